@@ -25,6 +25,7 @@
 )
 from .article import Article
 from .source import Source
+from .mthreading import parse_many
 from .version import __version__
 import logging
 from logging import NullHandler
@@ -78,5 +79,6 @@ def article(url: str, language: Optional[str] = None, **kwargs) -> Article:
     "ArticleException",
     "ArticleBinaryDataException",
     "Source",
+    "parse_many",
     "__version__",
 ]
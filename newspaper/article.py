@@ -6,17 +6,33 @@
 to download, parse and analyze said article.
 """
 
+import asyncio
+import copy
 from datetime import datetime
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Literal, Optional, Set, Union, overload
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 from urllib.parse import urlparse
 import lxml
 
 import requests
 
 from newspaper.exceptions import ArticleException
-from newspaper.text import StopWords
+from newspaper.text import get_stopwords
 import newspaper.parsers as parsers
 from . import network
 from . import nlp
@@ -46,6 +62,76 @@
 ]
 
 
+# The method of `Article` extracting each field, in the order they are run.
+# Fields with the same method are extracted together. "top_node" is the
+# detection of the article body, needed by the fields that follow it.
+_FIELD_PARSERS = {
+    "title": "_parse_title",
+    "authors": "_parse_authors",
+    "meta_lang": "_parse_metadata",
+    "meta_site_name": "_parse_metadata",
+    "meta_description": "_parse_metadata",
+    "canonical_link": "_parse_metadata",
+    "meta_keywords": "_parse_metadata",
+    "tags": "_parse_metadata",
+    "meta_data": "_parse_metadata",
+    "publish_date": "_parse_publish_date",
+    "top_node": "_parse_top_node",
+    "movies": "_parse_movies",
+    "article_links": "_parse_links",
+    "top_image": "_parse_top_image",
+    "meta_img": "_parse_images",
+    "images": "_parse_images",
+    "meta_favicon": "_parse_images",
+    "text": "_parse_text",
+    "article_html": "_parse_text",
+}
+
+_METADATA_FIELDS = {k for k, v in _FIELD_PARSERS.items() if v == "_parse_metadata"}
+# Fields that need the article body detection
+_BODY_FIELDS = {
+    "movies",
+    "article_links",
+    "top_image",
+    "meta_img",
+    "images",
+    "meta_favicon",
+    "text",
+    "article_html",
+}
+
+
+_T = TypeVar("_T")
+
+
+class _ParsedField(Generic[_T]):
+    """Article attribute of type `_T` set by :any:`Article.parse`. If the
+    article is parsed lazily (see :any:`Configuration.lazy_parse`), the
+    extractor of the attribute runs on its first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(
+        self, article: None, owner: Optional[type] = None
+    ) -> "_ParsedField[_T]": ...
+
+    @overload
+    def __get__(self, article: "Article", owner: Optional[type] = None) -> _T: ...
+
+    def __get__(self, article, owner=None):
+        if article is None:
+            return self
+        if self.name in article._unparsed_fields:
+            article.extract_fields([self.name])
+        return article.__dict__[self.name]
+
+    def __set__(self, article: "Article", value: _T) -> None:
+        article.__dict__[self.name] = value
+        article._unparsed_fields.discard(self.name)
+
+
 class ArticleDownloadState:
     """Download state for the Article object."""
 
@@ -82,7 +168,8 @@ class Article:
         top_image (str): The top image url of the article. It will try to guess
             the best fit for a main image from the images found in the article.
         meta_img (str): Image url provided by metadata
-        images (List[str]): List of all image urls in the current article
+        images (List[Tuple[str, str]]): List of all image urls in the current
+            article, with their alt text
         movies (List[str]): List of video links in the article body
         text (str): a parsed version of the article body. It will be truncated
             to the first `config.max_text` characters.
@@ -114,6 +201,8 @@ class Article:
             `ArticleDownloadState.NOT_STARTED` if `download()` was not called.
         download_exception_msg (str): The exception message if download() failed.
         history (List[str]): Redirection history from the requests.get call.
+        download_attempts (Dict[str, int]): Number of http attempts made
+            for each url downloaded (see :any:`Configuration.retry_policy`).
         meta_description (str): The description extracted from the meta data.
         meta_lang (str): The language extracted from the meta data.
             If config.language is not set, this value will be used
@@ -134,6 +223,23 @@ class Article:
                 is now same as :any:`Article.doc`
     """
 
+    top_image = _ParsedField[str]()
+    meta_img = _ParsedField[str]()
+    images = _ParsedField[List[Tuple[str, str]]]()
+    movies = _ParsedField[List[str]]()
+    meta_keywords = _ParsedField[List[str]]()
+    tags = _ParsedField[Set[str]]()
+    authors = _ParsedField[List[str]]()
+    publish_date = _ParsedField[Optional[datetime]]()
+    article_html = _ParsedField[str]()
+    meta_description = _ParsedField[str]()
+    meta_lang = _ParsedField[str]()
+    meta_favicon = _ParsedField[str]()
+    meta_site_name = _ParsedField[str]()
+    meta_data = _ParsedField[Dict[str, str]]()
+    canonical_link = _ParsedField[str]()
+    article_links = _ParsedField[List[str]]()
+
     def __init__(
         self,
         url: str,
@@ -191,6 +297,11 @@ def __init__(
 
         self.extractor = ContentExtractor(self.config)
 
+        # Fields of `settings.article_parse_fields` that are extracted on
+        # their first access, and the index of `doc` used to extract them
+        self._unparsed_fields: Set[str] = set()
+        self._doc_index: Optional[parsers.DocumentIndex] = None
+
         if source_url == "":
             scheme = urls.get_scheme(url)
             if scheme is None:
@@ -221,10 +332,10 @@ def __init__(
         self.meta_img = ""
 
         # All image urls in this article
-        self.images: List[str] = []
+        self.images = []
 
         # All videos in this article: youtube, vimeo, etc
-        self.movies: List[str] = []
+        self.movies = []
 
         # Body text from this article
         self._text = ""
@@ -236,15 +347,15 @@ def __init__(
         self.keyword_scores: Dict[str, float] = {}
 
         # `meta_keywords` are extracted via parse() from <meta> tags
-        self.meta_keywords: List[str] = []
+        self.meta_keywords = []
 
         # `tags` are also extracted via parse() from <meta> tags
-        self.tags: Set[str] = set()
+        self.tags = set()
 
         # List of authors who have published the article, via parse()
-        self.authors: List[str] = []
+        self.authors = []
 
-        self.publish_date: Optional[datetime] = None
+        self.publish_date = None
 
         # Summary generated from the article's body txt
         self._summary = ""
@@ -263,6 +374,9 @@ def __init__(
         # Redirection history from the requests.get call
         self.history: Optional[List[str]] = []
 
+        # Number of http attempts made for each downloaded url
+        self.download_attempts: Dict[str, int] = {}
+
         # Meta description field in the HTML source
         self.meta_description = ""
 
@@ -276,7 +390,7 @@ def __init__(
         self.meta_site_name = ""
 
         # Meta tags contain a lot of structured data, e.g. OpenGraph
-        self.meta_data: Dict[str, str] = {}
+        self.meta_data = {}
 
         # The canonical link of this article if found in the meta data
         self.canonical_link = ""
@@ -293,7 +407,7 @@ def __init__(
         self._clean_doc: Optional[lxml.html.Element] = None
 
         # Store only URLs
-        self.article_links: List[str] = []  # List of URLs found in article
+        self.article_links = []  # List of URLs found in article
 
     def build(self):
         """Build a lone article from a URL independent of the source (newspaper).
@@ -315,30 +429,47 @@ def _parse_scheme_file(self, path):
             return None
 
     def _parse_scheme_http(self, url: Optional[str] = None):
+        url = url or self.url
         try:
             # We do not use get_html() here because we want to be able to
             # detect protection in the response regardless of the status code
-            html, status_code, history = network.get_html_status(
-                url or self.url, self.config
-            )
-            self.history = [r.url for r in history]
-            if status_code >= 400:
-                self.download_state = ArticleDownloadState.FAILED_RESPONSE
-                protection = self._detect_protection(html)
-                if protection:
-                    self.download_exception_msg = (
-                        f"Website protected with {protection}, url: {url}"
-                    )
-                else:
-                    self.download_exception_msg = (
-                        f"Status code {status_code} for url {url}"
-                    )
-                return None
+            response = network.do_request(url, self.config)
+        except requests.exceptions.RequestException as e:
+            self.download_attempts[url] = getattr(e, "attempts", 1)
+            self.download_state = ArticleDownloadState.FAILED_RESPONSE
+            self.download_exception_msg = str(e)
+            return None
+
+        return self._check_http_response(url, response)
+
+    async def _aparse_scheme_http(self, url: Optional[str] = None):
+        url = url or self.url
+        try:
+            response = await network.async_do_request(url, self.config)
         except requests.exceptions.RequestException as e:
+            self.download_attempts[url] = getattr(e, "attempts", 1)
             self.download_state = ArticleDownloadState.FAILED_RESPONSE
             self.download_exception_msg = str(e)
             return None
 
+        return self._check_http_response(url, response)
+
+    def _check_http_response(self, url, response):
+        self.download_attempts[url] = getattr(response, "attempts", 1)
+        html, status_code, history = network.get_html_status(url, self.config, response)
+
+        self.history = [r.url for r in history]
+        if status_code >= 400:
+            self.download_state = ArticleDownloadState.FAILED_RESPONSE
+            protection = self._detect_protection(html)
+            if protection:
+                self.download_exception_msg = (
+                    f"Website protected with {protection}, url: {url}"
+                )
+            else:
+                self.download_exception_msg = f"Status code {status_code} for url {url}"
+            return None
+
         return html
 
     def _detect_protection(self, html):
@@ -441,18 +572,90 @@ def download(
 
         return self
 
-    def parse(self) -> "Article":
+    async def adownload(
+        self,
+        input_html: Optional[str] = None,
+        title: Optional[str] = None,
+        ignore_read_more: bool = False,
+    ) -> "Article":
+        """Asynchronous version of :any:`Article.download()`. The article
+        html is fetched on the running event loop (using ``aiohttp`` if it is
+        installed), so that many articles can be downloaded concurrently
+        with ``asyncio.gather``.
+
+        Following meta refresh redirects and read more links is still done
+        by :any:`Article.download()`, in the default executor of the loop.
+
+        Args:
+            input_html (str, optional): A cached version of the article to parse.
+                Defaults to None.
+            title (str, optional): Force an article title. Defaults to None.
+            ignore_read_more (bool, optional): If true, the download process will
+                ignore any kind of "read_more" xpath set up in the constructor.
+                Defaults to False.
+        Returns:
+            Article: self
+        """
+        if input_html is None:
+            parsed_url = urlparse(self.url)
+            if parsed_url.scheme == "file":
+                input_html = self._parse_scheme_file(parsed_url.path)
+            else:
+                input_html = await self._aparse_scheme_http()
+            if input_html is None:
+                log.debug(
+                    "Download failed on URL %s because of %s",
+                    self.url,
+                    self.download_exception_msg,
+                )
+                return self
+
+        download = functools.partial(
+            self.download,
+            input_html=input_html,
+            title=title,
+            ignore_read_more=ignore_read_more,
+        )
+        if self.config.follow_meta_refresh or (
+            self.read_more_link and not ignore_read_more
+        ):
+            # these can trigger additional blocking downloads
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, download)
+
+        return download()
+
+    def parse(self, fields: Optional[Iterable[str]] = None) -> "Article":
         """Parse the previously downloaded article.
         If `download()` wasn't called, it will raise
         a `ArticleException` exception.
         Populates the article properties such as:
         ``title``, ``authors``, ``publish_date``,
         ``text``, ``top_image``, etc.
+
+        If :any:`Configuration.lazy_parse` is set, only the title and the
+        article body are detected, the other properties are extracted on
+        their first access.
+
+        Args:
+            fields (Iterable[str], optional): only populate these properties,
+                from ``settings.article_parse_fields``. The other properties
+                keep their default values (or are extracted on their first
+                access, with ``lazy_parse``), and their extraction is skipped.
+                Defaults to :any:`Configuration.parse_fields`, all properties
+                if not set.
         Returns:
             Article: self
         """
         self.throw_if_not_downloaded_verbose()
 
+        if fields is None:
+            fields = self.config.parse_fields
+        else:
+            fields = Configuration.validate_parse_fields(fields)
+
+        self._unparsed_fields = set()
+        self._doc_index = None
         self.doc = parsers.fromstring(self.html)
 
         if self.doc is None:
@@ -460,15 +663,72 @@ def parse(self) -> "Article":
             self.is_parsed = True
             return self
 
-        document_cleaner = DocumentCleaner(self.config)
-        output_formatter = OutputFormatter(self.config)
+        # The extractors query the document through a shared index, the
+        # document itself is not modified during the extraction
+        self._unparsed_fields = set(_FIELD_PARSERS)
+        self._doc_index = parsers.DocumentIndex(self.doc)
+        self._parse_document(fields)
 
-        title = self.extractor.get_title(self.doc)
-        self.title = title
+        if not self.config.lazy_parse:
+            self._unparsed_fields.clear()
+        if not self._unparsed_fields:
+            self._doc_index = None
+
+        self.is_parsed = True
+        return self
+
+    def _parse_document(self, fields: Optional[Set[str]] = None):
+        """Runs the extractors of the selected fields on the parsed document,
+        all of them if ``fields`` is None"""
+        lazy = self.config.lazy_parse
+        if fields is None:
+            fields = set() if lazy else set(settings.article_parse_fields)
+        # The title is removed from the beginning of the text
+        if lazy or not fields.isdisjoint(["text", "article_html"]):
+            fields = fields | {"title"}
+        if lazy or not fields.isdisjoint(_BODY_FIELDS):
+            fields = fields | {"top_node"}
+            # The meta language can change the stopwords of the body detection
+            if self.config.use_meta_language:
+                fields = fields | _METADATA_FIELDS
+
+        self.extract_fields(fields)
+
+    def extract_fields(self, fields: Optional[Iterable[str]] = None):
+        """Runs the extractors of the fields that were not extracted yet by
+        a lazy :any:`Article.parse` (see :any:`Configuration.lazy_parse`).
 
+        Args:
+            fields (Iterable[str], optional): names from
+                ``settings.article_parse_fields``. Defaults to all the fields
+                not extracted yet.
+        """
+        if fields is None:
+            fields = set(self._unparsed_fields)
+        else:
+            fields = self._unparsed_fields.intersection(fields)
+        if not fields:
+            return
+
+        with parsers.document_index(self.doc, self._doc_index):
+            for name, method in _FIELD_PARSERS.items():
+                if name in fields and name in self._unparsed_fields:
+                    self._unparsed_fields.difference_update(
+                        k for k, v in _FIELD_PARSERS.items() if v == method
+                    )
+                    getattr(self, method)()
+
+        if not self._unparsed_fields:
+            self._doc_index = None
+
+    def _parse_title(self):
+        self.title = self.extractor.get_title(self.doc)
+
+    def _parse_authors(self):
         authors = self.extractor.get_authors(self.doc)
         self.authors = authors[: self.config.max_authors]
 
+    def _parse_metadata(self):
         metadata = self.extractor.get_metadata(self.url, self.doc)
         if metadata["language"] in get_available_languages():
             self.meta_lang = metadata["language"]
@@ -482,43 +742,64 @@ def parse(self) -> "Article":
         self.tags = metadata["tags"]
         self.meta_data = metadata["data"]
 
+    def _parse_publish_date(self):
         self.publish_date = self.extractor.get_publishing_date(self.url, self.doc)
 
+    def _parse_top_node(self):
         # Top node in the original documentDOM
         self.top_node = self.extractor.calculate_best_node(self.doc)
         # Off-tree Node containing the top node and any relevant siblings
         self._top_node_complemented = self.extractor.top_node_complemented
 
+    def _parse_movies(self):
         self.set_movies(self.extractor.get_videos(self.doc, self.top_node))
 
+    def _parse_links(self):
         if self.top_node is not None:
             self.extractor.parse_links(self.url, self.doc, self.top_node)
             self.article_links = self.extractor.link_extractor.get_links()
+
+    def _parse_top_image(self):
+        if self.top_node is not None:
             self.fetch_images()
+
+    def _parse_images(self):
+        if self.top_node is not None:
+            self.fetch_images(top_image=False)
+
+    def _parse_text(self):
+        if self.top_node is not None:
+            document_cleaner = DocumentCleaner(self.config)
+            output_formatter = OutputFormatter(self.config)
             self._top_node_complemented = document_cleaner.clean(
                 self._top_node_complemented
             )
             text, article_html = output_formatter.get_formatted(
-                self._top_node_complemented, title
+                self._top_node_complemented,
+                self.title,
+                self.extractor.complemented_scores,
             )
             self.article_html = article_html
             self.text = text
 
-        self.is_parsed = True
-        return self
-
-    def fetch_images(self):
+    def fetch_images(self, top_image: bool = True):
         """Fetch top image, meta image and image list with alt text from
         current cleaned_doc. Will set the attributes: meta_img,
         top_image, images, meta_favicon
+
+        Args:
+            top_image (bool): if False, the top image is not searched and no
+                image is downloaded. Defaults to True.
         """
-        self.extractor.parse_images(self.url, self.doc, self.top_node)
+        self.extractor.parse_images(self.url, self.doc, self.top_node, top_image)
 
-        self.meta_img = self.extractor.image_extractor.meta_image
-        self.top_image = self.extractor.image_extractor.top_image
+        image_extractor = self.extractor.image_extractor
+        self.meta_img = image_extractor.meta_image or ""
+        if top_image:
+            self.top_image = image_extractor.top_image or ""
         # images is now a list of tuples (url, alt_text)
-        self.images = self.extractor.image_extractor.images
-        self.meta_favicon = self.extractor.image_extractor.favicon
+        self.images = image_extractor.images
+        self.meta_favicon = image_extractor.favicon or ""
 
     def is_valid_url(self):
         """Performs a check on the url of this link to determine if article
@@ -535,7 +816,8 @@ def is_valid_body(self):
                 "must parse article before checking                                    "
                 " if it's body is valid!"
             )
-        meta_type = self.extractor.metadata_extractor.meta_data["type"]
+        self.extract_fields(_METADATA_FIELDS)
+        meta_type = self.extractor.metadata_extractor.meta_type
         wordcount = self.text.split(" ")
         sentcount = self.text.split(".")
 
@@ -590,7 +872,7 @@ def nlp(self):
         self.throw_if_not_downloaded_verbose()
         self.throw_if_not_parsed_verbose()
 
-        stopwords = StopWords(self.config.language)
+        stopwords = get_stopwords(self.config.language)
         keywords = nlp.keywords(self.text, stopwords, self.config.max_keywords)
         for k, v in nlp.keywords(
             self.title, stopwords, self.config.max_keywords
@@ -636,6 +918,8 @@ def text(self) -> str:
         Returns:
             The text content of the article.
         """
+        if "text" in self._unparsed_fields:
+            self.extract_fields(["text"])
         return self._text
 
     @text.setter
@@ -645,6 +929,7 @@ def text(self, value: str):
             value (str): The text to be set.
         """
         self._text = value[: self.config.max_text] if value else ""
+        self._unparsed_fields.discard("text")
 
     @property
     def html(self) -> str:
@@ -669,12 +954,12 @@ def html(self, value: str):
             self._html = ""
 
     @property
-    def imgs(self) -> List[str]:
+    def imgs(self) -> List[Tuple[str, str]]:
         """Same as images. Kept for legacy reasons
         .. deprecated:: 0.9.3
             use :any:`Article.images` instead
         Returns:
-            List[str]: list of image urls
+            List[Tuple[str, str]]: list of image urls and their alt text
         """
         # Seems to be some legacy api,
         return self.images
@@ -692,15 +977,37 @@ def top_img(self) -> str:
 
     @property
     def clean_doc(self) -> lxml.html.HtmlElement:
-        """Cleans the document and returns the cleaned version.
+        """Cleans a copy of the document and returns the cleaned version.
+        With the "article" :any:`Configuration.clean_scope`, only the head,
+        the top node and its complemented siblings are cleaned.
         Returns:
             lxml.html.HtmlElement: The cleaned document.
         """
-        if self._clean_doc is None:
+        if self._clean_doc is None and self.doc is not None:
             document_cleaner = DocumentCleaner(self.config)
-            self._clean_doc = document_cleaner.clean(self._clean_doc)
+            if self.config.clean_scope == "article":
+                self._clean_doc = self._clean_article_subtrees(
+                    self.doc, document_cleaner
+                )
+            else:
+                self._clean_doc = document_cleaner.clean(copy.deepcopy(self.doc))
         return self._clean_doc
 
+    def _clean_article_subtrees(
+        self, doc: lxml.html.HtmlElement, document_cleaner: DocumentCleaner
+    ) -> lxml.html.HtmlElement:
+        """Cleans the parts of a copy of `doc` that can be part of the
+        article: the head, the top node and its complemented siblings"""
+        roots = parsers.get_tags(doc, tag="head")[:1]
+        if self.top_node is not None:
+            # after unpickling, only the top node is known
+            roots += self.extractor.complemented_nodes or [self.top_node]
+
+        doc_copy = copy.deepcopy(doc)
+        # deepcopy keeps the order of the elements
+        copies = dict(zip(doc.iter(), doc_copy.iter()))
+        return document_cleaner.clean_subtrees(doc_copy, [copies[n] for n in roots])
+
     @property
     def text_cleaned(self) -> str:
         """Returns the cleaned text of the article.
@@ -787,6 +1094,8 @@ def to_json(self, as_string: Optional[bool] = True) -> Union[str, Dict]:
 
     def __getstate__(self):
         """Return a pickable object for this article. This can be used for caching"""
+        # the lazy fields can not be extracted without the extractor state
+        self.extract_fields()
         state = self.__dict__.copy()
         # drop non pickable attributes
         if (
@@ -804,17 +1113,20 @@ def __getstate__(self):
         state.pop("top_node", None)
         state.pop("_top_node_complemented", None)
         state.pop("doc", None)
+        state.pop("_doc_index", None)
         # state.pop("clean_doc", None)
 
         return state
 
     def __setstate__(self, state):
         """Restore state from the unpickled state"""
+        self._unparsed_fields = set()
         self.__dict__.update(state)
         self.extractor = ContentExtractor(self.config)
         self.top_node = None
         self._top_node_complemented = None
         self.doc = None
+        self._doc_index = None
         # self.clean_doc = None
 
         if state["__parsed_state"]:
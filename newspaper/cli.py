@@ -125,6 +125,17 @@ def get_arparse() -> argparse.ArgumentParser:
     parser.add_argument(
         "--skip-nlp", action="store_true", help="Whether to skip the NLP step."
     )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        choices=settings.article_parse_fields,
+        metavar="FIELD",
+        help=(
+            "Only parse these article fields, e.g. --fields text publish_date."
+            " The extraction of the other fields is skipped, and they are empty"
+            " in the output. Choices: %(choices)s"
+        ),
+    )
 
     return parser
 
@@ -174,6 +185,8 @@ def get_kwargs(args: argparse.Namespace) -> dict:
 
     if args.max_nr_keywords:
         res["max_keywords"] = args.max_nr_keywords
+    if args.fields:
+        res["parse_fields"] = args.fields
 
     return res
 
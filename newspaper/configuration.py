@@ -8,17 +8,86 @@
 holds them. For example, pass in a config object to an Article
 object, Source object, or even network methods, and it just works.
 """
+from dataclasses import dataclass, field
 import logging
+import random
+from typing import Iterable, Optional, Set, Tuple, Type
 
 from warnings import warn
 
+import requests
+
 from newspaper.utils import get_available_languages
 
+from . import settings
 from .version import __version__
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class RetryPolicy:
+    """Retry policy for the http downloads. Failed requests are retried
+    with an exponential backoff: attempt ``n`` waits
+    ``backoff_factor * 2 ** (n - 1)`` seconds (at most ``backoff_max``),
+    randomized with full jitter if ``jitter`` is True.
+
+    The multi-threaded downloads (:any:`multithread_request`,
+    :any:`Source.download_articles`, :any:`Source.process_articles`) wait
+    for the retries on timers, and the asynchronous downloads on the event
+    loop. A single blocking download (:any:`Article.download`,
+    :any:`do_request`, :any:`get_html`) has nothing else to do, and sleeps
+    in the calling thread between its attempts.
+
+    Attributes:
+        max_attempts (int): maximum number of attempts, including the first
+            request. 1 disables retries. Default 1.
+        retry_statuses (Tuple[int]): http status codes that are retried.
+            Default (429, 500, 502, 503, 504).
+        retry_exceptions (Tuple[Type[Exception]]): ``requests`` exceptions
+            that are retried. Default connection errors (including connect
+            timeouts) and broken chunked responses. Read timeouts are not
+            retried.
+        backoff_factor (float): base delay in seconds. Default 0.5.
+        backoff_max (float): maximum delay in seconds, also caps the
+            ``Retry-After`` delays. Default 30.
+        jitter (bool): randomize the delays, so that retries of many urls
+            are not sent all at the same time. Default True.
+    """
+
+    max_attempts: int = 1
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_exceptions: Tuple[Type[Exception], ...] = field(
+        default=(
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        )
+    )
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+
+    def should_retry(
+        self,
+        response: Optional[requests.Response] = None,
+        exception: Optional[BaseException] = None,
+    ) -> bool:
+        """Is the outcome of an attempt (response or exception) retryable?"""
+        if exception is not None:
+            return isinstance(exception, self.retry_exceptions)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay in seconds before the attempt following `attempt`.
+        A ``Retry-After`` delay announced by the server is honoured."""
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.backoff_max)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+
 class Configuration:
     """Modifies Article / Source properties.
 
@@ -62,12 +131,55 @@ class Configuration:
         clean_article_html (bool): if True it will clean 'unnecessary' tags
             from the article body html.
             Affected property is :any:`Article.article_html`. Default True.
+        clean_scope (str): what :any:`newspaper.fulltext` and
+            :any:`Article.clean_doc` clean. "document" cleans the whole DOM,
+            "article" only the head, the top node and its complemented
+            siblings, as :any:`Article.parse` does. Default "document".
+        parse_fields (Set[str]): the article attributes computed by
+            :any:`Article.parse`, from ``settings.article_parse_fields``. The
+            extractors, DOM passes and image downloads of the other attributes
+            are skipped, e.g. ``{"text", "publish_date"}`` does not look for
+            the authors, images or links. None parses all fields.
+            Default None.
+        lazy_parse (bool): if True, :any:`Article.parse` only detects the
+            title and the article body (and the fields of ``parse_fields``).
+            The other fields (authors, publish_date, images, text, ...) are
+            extracted on their first access, so an application reading a few
+            fields only runs their extractors. The parsed document is kept
+            until all the fields are extracted. Default False.
         http_success_only (bool): if True, it will raise an :any:`ArticleException`
             if the html status_code is >= 400 (e.g. 404 page).
             Default True.
         requests_params (dict): Any of the params for the
             `get call`_ from ``requests`` library
         number_threads (int): number of threads to use for multi-threaded downloads
+        async_concurrency (int): maximum number of simultaneous connections
+            opened by the asyncio download engine
+            (:any:`Source.adownload_articles()`, :any:`Article.adownload()`).
+            Only used if the ``aiohttp`` library is installed, otherwise the
+            async engine falls back to :any:`number_threads` threads.
+            Default 100.
+        parse_processes (int): if set, :any:`Source.parse_articles()` parses
+            the articles in this number of processes (see
+            :any:`newspaper.mthreading.parse_many`). The parsed articles do
+            not keep their lxml trees. None parses in the current process.
+            Default None.
+        domain_max_concurrency (int): maximum number of simultaneous requests
+            to the same domain, across all threads. None means no limit.
+            Default None.
+        domain_requests_per_second (float): maximum number of requests started
+            per second for the same domain. None means no limit. Default None.
+        max_retry_after (float): if a website answers with ``429`` or ``503``
+            and a ``Retry-After`` header, no other request is sent to it
+            for the announced time, but at most ``max_retry_after`` seconds.
+            None disables this. Default None.
+        retry_policy (RetryPolicy): how failed downloads (connection errors,
+            5xx and 429 responses) are retried. See :any:`RetryPolicy`.
+            Retries are disabled by default, set ``retry_policy.max_attempts``
+            to enable them.
+        pool_size_per_host (int): number of keep-alive connections kept open
+            for each host in the shared http connection pool. If None, it
+            defaults to :any:`number_threads` (at least 10). Default None.
         verbose (bool): if True, it will output debugging information
             **deprecated**: Use the standard python logging module instead
         thread_timeout_seconds (int): timeout for threads
@@ -84,6 +196,12 @@ class Configuration:
             :any:`Article.download()` and will be skipped in
             :any:`Source.build()`. This will override the defaults
             in :any:`ignored_content_types_defaults` if these match binary files.
+        use_http_cache (bool): if True, the :any:`Source` homepage, category
+            pages and feeds are downloaded with conditional requests
+            (``If-None-Match`` / ``If-Modified-Since``). If they did not change
+            since the last download, the locally stored copy is used. The
+            copies are stored in ``settings.HTTP_CACHE_DIRECTORY``, at most
+            ``settings.HTTP_CACHE_MAX_ENTRIES`` of them. Default False.
         use_cached_categories (bool): if set to False, the cached categories
             will be ignored and a the :any:`Source` will recompute the category
              list every time you build it.
@@ -148,6 +266,9 @@ def __init__(self):
         # If true, it will not cache the `Source` category urls
         self.disable_category_cache = False
 
+        # Conditional requests for the `Source` homepage, categories and feeds
+        self.use_http_cache = False
+
         # Set this to false if you don't care about getting images
         self.fetch_images = True
 
@@ -160,6 +281,15 @@ def __init__(self):
         # You may keep the html of just the main article body
         self.clean_article_html = True
 
+        # Clean the whole DOM, or only the parts of the article
+        self._clean_scope = "document"
+
+        # Article attributes computed by `Article.parse()`, None for all
+        self._parse_fields = None
+
+        # Extract the article fields on their first access
+        self.lazy_parse = False
+
         # Fail for error responses (e.g. 404 page)
         self.http_success_only = True
 
@@ -178,6 +308,25 @@ def __init__(self):
         # Number of threads to use for mthreaded downloads
         self.number_threads = 10
 
+        # Max number of simultaneous connections for the asyncio downloads
+        self.async_concurrency = 100
+
+        # Number of processes for parsing articles, None means no subprocesses
+        self.parse_processes = None
+
+        # Politeness: per domain limits, None means no limit
+        self.domain_max_concurrency: Optional[int] = None
+        self.domain_requests_per_second: Optional[float] = None
+        # Max pause for a domain that answered with a Retry-After header,
+        # None to not pause the domain
+        self.max_retry_after: Optional[float] = None
+
+        # Retries with exponential backoff for failed downloads
+        self.retry_policy = RetryPolicy()
+
+        # Keep-alive connections per host, None means number_threads
+        self.pool_size_per_host = None
+
         # Deprecated, use standard python logging module instead (debug level)
         self.verbose = False  # for debugging
 
@@ -277,6 +426,59 @@ def language(self, value: str):
         # Set oriental language stopword class
         self._language = value
 
+    @property
+    def clean_scope(self) -> str:
+        """str: "document" to clean the whole DOM, "article" to clean only
+        the subtrees that can end up in the article text"""
+        return self._clean_scope
+
+    @clean_scope.setter
+    def clean_scope(self, value: str):
+        if value not in ["document", "article"]:
+            raise ValueError(
+                f"Unknown clean_scope {value!r}, use 'document' or 'article'"
+            )
+        self._clean_scope = value
+
+    @property
+    def parse_fields(self) -> Optional[Set[str]]:
+        """Set[str]: the article attributes computed by :any:`Article.parse`,
+        None for all of them"""
+        return self._parse_fields
+
+    @parse_fields.setter
+    def parse_fields(self, value: Optional[Iterable[str]]):
+        self._parse_fields = self.validate_parse_fields(value)
+
+    @staticmethod
+    def validate_parse_fields(
+        fields: Optional[Iterable[str]],
+    ) -> Optional[Set[str]]:
+        """Checks a selection of article fields to parse.
+
+        Args:
+            fields (Iterable[str], optional): names from
+                ``settings.article_parse_fields``, or None for all of them.
+
+        Returns:
+            Set[str]: the selected fields, None for all of them.
+
+        Raises:
+            ValueError: if a field is unknown.
+        """
+        if fields is None:
+            return None
+        if isinstance(fields, str):
+            fields = [fields]
+        fields = set(fields)
+        unknown = fields.difference(settings.article_parse_fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown parse_fields {sorted(unknown)}, use any of"
+                f" {settings.article_parse_fields}"
+            )
+        return fields
+
     @property
     def use_meta_language(self):
         """Read-only property that indicates whether the meta language
@@ -1,13 +1,16 @@
 import copy
-from functools import partial
+from dataclasses import dataclass
+import importlib
+from itertools import islice
 import re
 from statistics import mean
-from typing import Optional
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 import lxml
 from newspaper.configuration import Configuration
 import newspaper.extractors.defines as defines
 import newspaper.parsers as parsers
-from newspaper.text import StopWords
+from newspaper.text import StopWords, get_stopwords
 
 score_weights = {
     "bottom_negativescore_nodes": 0.25,
@@ -21,8 +24,76 @@
     "boost_min_stopword_count": 5,
 }
 
-get_stop_words = partial(parsers.get_attribute, attr="stop_words", type_=int, default=0)
-get_word_count = partial(parsers.get_attribute, attr="word_count", type_=int, default=0)
+
+def _import_numpy() -> Optional[ModuleType]:
+    """Imports numpy (optional, slow to import) the first time the gravity
+    scores are computed. Returns None if numpy is not installed.
+    """
+    if "np" not in globals():
+        numpy: Optional[ModuleType]
+        try:
+            numpy = importlib.import_module("numpy")
+        except ImportError:
+            numpy = None
+        globals()["np"] = numpy
+    return globals()["np"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "np":
+        return _import_numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass
+class NodeFeatures:
+    """Features of a node with text, computed by
+    :any:`ArticleBodyExtractor.compute_features`
+
+    Attributes:
+        stop_words (int): number of stopwords in the node, excluding the
+            ones already counted in its descendants
+        word_count (int): number of words in the node, excluding the
+            ones already counted in its descendants
+        is_highlink_density (bool): True if the node is mostly links
+        node_level (int): depth of the node in the tree (1 for the root)
+    """
+
+    stop_words: int = 0
+    word_count: int = 0
+    is_highlink_density: bool = False
+    node_level: int = 0
+
+
+class DocumentNodes:
+    """Numbering of the nodes of a document, in document order, with the
+    index of the parent and of the previous sibling of each node (-1 if none)
+    and its level in the tree.
+    """
+
+    def __init__(self, doc: lxml.html.HtmlElement):
+        self.nodes: List[lxml.html.HtmlElement] = [doc]
+        self.nodes.extend(doc.iterdescendants())
+        self.index: Dict[lxml.html.HtmlElement, int] = {
+            node: i for i, node in enumerate(self.nodes)
+        }
+        self.parent = [-1] * len(self.nodes)
+        self.previous = [-1] * len(self.nodes)
+        self.level = [parsers.get_level(doc)] * len(self.nodes)
+        # only the elements have a tag code, comments etc. have -1
+        tag_codes: Dict[str, int] = {}
+        self.tag = [-1] * len(self.nodes)
+        last_child: Dict[int, int] = {}
+        for i, node in enumerate(self.nodes):
+            if isinstance(node.tag, str):
+                self.tag[i] = tag_codes.setdefault(node.tag, len(tag_codes))
+            if i == 0:
+                continue
+            parent = self.index[node.getparent()]
+            self.parent[i] = parent
+            self.level[i] = self.level[parent] + 1
+            self.previous[i] = last_child.get(parent, -1)
+            last_child[parent] = i
 
 
 class ArticleBodyExtractor:
@@ -30,7 +101,17 @@ def __init__(self, config: Configuration):
         self.config = config
         self.top_node = None
         self.top_node_complemented = None
+        # Nodes of the document copied into top_node_complemented
+        self.complemented_nodes: List[lxml.html.HtmlElement] = []
+        # Gravity scores of the nodes of top_node_complemented
+        self.complemented_scores: Dict[lxml.html.HtmlElement, float] = {}
         self.stopwords: Optional[StopWords] = None
+        self.text_index: Optional[parsers.TextIndex] = None
+        # Side tables for the nodes of the document being parsed
+        self.node_features: Dict[lxml.html.HtmlElement, NodeFeatures] = {}
+        self.gravity_scores: Dict[lxml.html.HtmlElement, float] = {}
+        self.gravity_nodes: Dict[lxml.html.HtmlElement, float] = {}
+        self.document_nodes: Optional[DocumentNodes] = None
 
     def parse(self, doc: lxml.html.Element):
         """_summary_
@@ -38,12 +119,19 @@ def parse(self, doc: lxml.html.Element):
         Args:
             doc (lxml.html.Element): _description_
         """
-        self.stopwords = StopWords(self.config.language)
+        self.stopwords = get_stopwords(self.config.language)
         self.top_node = self.calculate_best_node(doc)
         self.top_node_complemented = self.complement_with_siblings(self.top_node)
 
     def calculate_best_node(self, doc):
         top_node = None
+        # Texts and scores of the doc nodes, shared until complement_with_siblings()
+        self.text_index = parsers.TextIndex()
+        self.node_features = {}
+        self.gravity_scores = {}
+        self.gravity_nodes = {}
+        self.complemented_nodes = []
+        self.complemented_scores = {}
         self.boost_highly_likely_nodes(doc)
 
         parent_nodes = []
@@ -51,23 +139,32 @@ def calculate_best_node(self, doc):
 
         # process the tree from bottom up. farthest nodes first
         nodes_with_text.sort(
-            key=lambda node: parsers.get_attribute(
-                node, "node_level", type_=int, default=0
-            ),
+            key=lambda node: self.node_features[node].node_level,
             reverse=True,
         )
 
         parent_nodes = self.compute_gravity_scores(nodes_with_text)
 
         if parent_nodes:
-            parent_nodes.sort(key=parsers.get_node_gravity_score, reverse=True)
+            parent_nodes.sort(key=self.get_gravity_score, reverse=True)
             top_node = parent_nodes[0]
 
         return top_node
 
+    def get_gravity_score(self, node: lxml.html.HtmlElement) -> float:
+        """The gravity score of the node, 0 if not scored"""
+        return self.gravity_scores.get(node, 0.0)
+
+    def get_stop_words(self, node: lxml.html.HtmlElement) -> int:
+        """The stopwords count of the node (excluding its descendants),
+        0 if the node has no text"""
+        features = self.node_features.get(node)
+        return features.stop_words if features else 0
+
     def compute_gravity_scores(self, nodes_with_text):
         """Computes the gravity score for each node in the list.
         And propagate the score to its parents and grandparents.
+        If numpy is installed, the scores are computed with array operations.
 
         Args:
             nodes_with_text (list): list of candidate nodes that have meaningful text
@@ -75,6 +172,14 @@ def compute_gravity_scores(self, nodes_with_text):
         Returns:
             list: list of nodes with gravity score
         """
+        if (
+            _import_numpy() is not None
+            and self.document_nodes is not None
+            and all(node in self.document_nodes.index for node in nodes_with_text)
+            and self.document_nodes.nodes[0].getparent() is None
+        ):
+            return self._compute_gravity_scores_arrays(nodes_with_text)
+
         parent_nodes = []
 
         boost_discount = 1
@@ -104,7 +209,7 @@ def compute_gravity_scores(self, nodes_with_text):
                     if negscore > score_weights["negative_score_threshold"]:
                         boost_score = score_weights["negative_score_boost"]
 
-            stop_word_count = get_stop_words(node)
+            stop_word_count = self.get_stop_words(node)
 
             upscore = stop_word_count + boost_score
 
@@ -131,44 +236,166 @@ def compute_gravity_scores(self, nodes_with_text):
 
         return parent_nodes
 
-    def compute_features(self, doc):
-        candidates = []
-        nodes_to_check = self.nodes_to_check(doc)
-        nodes_to_check.sort(key=parsers.get_level, reverse=True)
-
-        for node in nodes_to_check:
-            # exclude nodes that are in this list
+    def _compute_gravity_scores_arrays(self, nodes_with_text):
+        """numpy version of :any:`compute_gravity_scores`. The features of the
+        document nodes are kept in arrays indexed by their :any:`DocumentNodes`
+        number, and the boosts and scores are computed with array operations.
+        The scores are added in the same order as in the loop version, so
+        the results are identical.
+        """
+        np = _import_numpy()
+        assert np is not None
+        document = self.document_nodes
+        if not nodes_with_text:
+            return []
 
-            text_content = parsers.get_text(node)
-            if not text_content:
-                continue
+        parent = np.array(document.parent)
+        previous = np.array(document.previous)
+        tag = np.array(document.tag)
+        stop_words = np.zeros(len(document.nodes))
+        for node, features in self.node_features.items():
+            stop_words[document.index[node]] = features.stop_words
+
+        nodes = np.array([document.index[node] for node in nodes_with_text])
+        nodes_count = len(nodes)
+
+        # is_boostable(): one of the 3 previous siblings, with the same tag,
+        # has enough stopwords
+        boostable = np.zeros(nodes_count, dtype=bool)
+        sibling = nodes
+        for _ in range(score_weights["boost_max_steps_from_node"]):
+            sibling = np.where(sibling >= 0, previous[sibling], -1)
+            exists = sibling >= 0
+            safe_sibling = np.where(exists, sibling, 0)
+            boostable |= (
+                exists
+                & (tag[safe_sibling] == tag[nodes])
+                & (stop_words[safe_sibling] > score_weights["boost_min_stopword_count"])
+            )
 
-            word_stats = self.stopwords.get_stopword_count(text_content)
-            high_link_density = parsers.is_highlink_density(node, self.config.language)
+        # boost score decays with the number of boosted nodes before it
+        boost_discount = np.maximum(np.cumsum(boostable), 1)
+        boost_score = np.where(
+            boostable, score_weights["boost_score"] / boost_discount, 0.0
+        )
 
-            children_word_stats = [
-                (get_stop_words(child), get_word_count(child))
-                for child in node.xpath(".//*[@stop_words>0]")
-            ]
-            children_word_stats = (
-                sum([x[0] for x in children_word_stats]),
-                sum([x[1] for x in children_word_stats]),
-            )
-            parsers.set_attribute(
-                node, "stop_words", word_stats.stop_word_count - children_word_stats[0]
+        if nodes_count > score_weights["node_count_threshold"]:
+            # higher number of possible top nodes
+            bottom_negativescore_nodes = (
+                nodes_count * score_weights["bottom_negativescore_nodes"]
             )
-            parsers.set_attribute(
-                node, "word_count", word_stats.word_count - children_word_stats[1]
+            dist_from_end = np.arange(nodes_count, 0, -1, dtype=float)
+            negative_boost = -((bottom_negativescore_nodes - dist_from_end) ** 2)
+            negative_boost = np.where(
+                np.abs(negative_boost) > score_weights["negative_score_threshold"],
+                score_weights["negative_score_boost"],
+                negative_boost,
             )
-            parsers.set_attribute(
-                node, "is_highlink_density", 1 if high_link_density else 0
+            boost_score = np.where(
+                dist_from_end <= bottom_negativescore_nodes, negative_boost, boost_score
             )
-            parsers.set_attribute(node, "node_level", parsers.get_level(node))
 
-            if word_stats.stop_word_count > 2 and not high_link_density:
-                candidates.append(node)
+        upscore = stop_words[nodes] + boost_score
+
+        # parents and grandparents, interleaved in the order of the updates
+        parents = parent[nodes]
+        targets = np.empty(2 * nodes_count, dtype=int)
+        targets[0::2] = parents
+        targets[1::2] = np.where(parents >= 0, parent[parents], -1)
+        values = np.empty(2 * nodes_count)
+        values[0::2] = upscore
+        values[1::2] = upscore * score_weights["parent_parent_node"]
+        valid = targets >= 0
+
+        scores = np.zeros(len(document.nodes))
+        counts = np.zeros(len(document.nodes))
+        for node, score in self.gravity_scores.items():
+            scores[document.index[node]] = score
+        for node, count in self.gravity_nodes.items():
+            counts[document.index[node]] = count
+        np.add.at(scores, targets[valid], values[valid])
+        np.add.at(counts, targets[valid], 1.0)
+
+        for i in np.unique(targets[valid]).tolist():
+            self.gravity_scores[document.nodes[i]] = float(scores[i])
+            self.gravity_nodes[document.nodes[i]] = float(counts[i])
+
+        parent_nodes = {document.nodes[i] if i >= 0 else None for i in targets.tolist()}
+        return [x for x in parent_nodes if x is not None]
+
+    def compute_features(self, doc) -> List[lxml.html.HtmlElement]:
+        """Computes the :any:`NodeFeatures` of the nodes to check, in one
+        bottom-up traversal of the document: the stopwords and words counted
+        in descendant nodes are aggregated while going up, and are not
+        counted again in their ancestors.
+
+        Args:
+            doc (lxml.html.Element): the document
 
-        return candidates
+        Returns:
+            List[lxml.html.Element]: the candidate nodes, with enough
+            stopwords and not mostly links, farthest nodes first
+        """
+        nodes_to_check = self.nodes_to_check(doc)
+        nodes_set = set(nodes_to_check)
+        self.document_nodes = DocumentNodes(doc)
+        index, levels = self.document_nodes.index, self.document_nodes.level
+
+        has_stop_words = set()
+        # (stop_words, word_count) of the descendants having stop_words > 0
+        descendants_counts: Dict[lxml.html.HtmlElement, Tuple[int, int]] = {}
+        # Reversed document order: the descendants come before their ancestors
+        for node in reversed(self.document_nodes.nodes):
+            stop_words, word_count = descendants_counts.pop(node, (0, 0))
+            counts = (stop_words, word_count)
+            if node in nodes_set:
+                features = self._get_node_features(node, counts, levels[index[node]])
+                if features is not None:
+                    self.node_features[node] = features
+                    if features.stop_words > 0:
+                        stop_words += features.stop_words
+                        word_count += features.word_count
+                    if features.stop_words + counts[0] > 2:
+                        has_stop_words.add(node)
+
+            parent = node.getparent()
+            if parent is not None and (stop_words or word_count):
+                parent_counts = descendants_counts.get(parent, (0, 0))
+                descendants_counts[parent] = (
+                    parent_counts[0] + stop_words,
+                    parent_counts[1] + word_count,
+                )
+
+        nodes_to_check.sort(key=lambda node: levels[index[node]], reverse=True)
+        return [
+            node
+            for node in nodes_to_check
+            if node in has_stop_words
+            and not self.node_features[node].is_highlink_density
+        ]
+
+    def _get_node_features(
+        self,
+        node: lxml.html.HtmlElement,
+        descendants_counts: Tuple[int, int],
+        level: int,
+    ) -> Optional[NodeFeatures]:
+        """Features of the node, None if it has no text"""
+        text_content = parsers.get_text(node, self.text_index)
+        if not text_content:
+            return None
+
+        assert self.stopwords is not None, "parse() sets the stopwords"
+        word_stats = self.stopwords.get_stopword_count(text_content)
+        high_link_density = parsers.is_highlink_density(
+            node, self.config.language, self.text_index
+        )
+        return NodeFeatures(
+            stop_words=word_stats.stop_word_count - descendants_counts[0],
+            word_count=word_stats.word_count - descendants_counts[1],
+            is_highlink_density=high_link_density,
+            node_level=level,
+        )
 
     def nodes_to_check(self, doc):
         """Returns a list of nodes we want to search
@@ -227,13 +454,11 @@ def is_boostable(self, node):
         """
         max_stepsaway_from_node = score_weights["boost_max_steps_from_node"]
 
-        nodes = self.walk_siblings(node)
-        for current_node in nodes[:max_stepsaway_from_node]:
+        nodes = node.itersiblings(preceding=True)
+        for current_node in islice(nodes, max_stepsaway_from_node):
             if current_node.tag != node.tag:
                 continue
-            stop_word_count = parsers.get_attribute(
-                current_node, "stop_words", type_=int, default=0
-            )
+            stop_word_count = self.get_stop_words(current_node)
             if stop_word_count > score_weights["boost_min_stopword_count"]:
                 return True
         return False
@@ -296,21 +521,19 @@ def is_tag_match(node, tag_dict):
         return 0
 
     def update_score(self, node, add_to_score):
-        """Adds a score to the gravityScore Attribute we put on divs
+        """Adds a score to the gravity score we keep for the node
         we'll get the current score then add the score we're passing
         in to the current.
         """
         if node is None:
             return
-        new_score = parsers.get_node_gravity_score(node) + add_to_score
-        parsers.set_attribute(node, "gravityScore", str(new_score))
+        self.gravity_scores[node] = self.get_gravity_score(node) + add_to_score
 
     def update_node_count(self, node, add_to_count):
         """Stores how many decent nodes are under a parent node"""
         if node is None:
             return
-        new_count = float(node.get("gravityNodes", 0)) + add_to_count
-        parsers.set_attribute(node, "gravityNodes", str(new_count))
+        self.gravity_nodes[node] = self.gravity_nodes.get(node, 0.0) + add_to_count
 
     def add_siblings(self, top_node):
         res_node = copy.deepcopy(top_node)
@@ -338,7 +561,9 @@ def get_plausible_content(self, node, baseline_score, score_weight=0.3):
         if (
             node.tag == "p"
             and node.text
-            and not parsers.is_highlink_density(node, self.config.language)
+            and not parsers.is_highlink_density(
+                node, self.config.language, self.text_index
+            )
         ):
             element = copy.deepcopy(node)
             element.tail = ""
@@ -350,16 +575,16 @@ def get_plausible_content(self, node, baseline_score, score_weight=0.3):
             return result
 
         for paragraph in paragraphs:
-            stop_word_count = parsers.get_attribute(
-                paragraph, "stop_words", type_=int, default=0
-            )
+            stop_word_count = self.get_stop_words(paragraph)
             if stop_word_count <= 0:
                 continue
-            if parsers.is_highlink_density(paragraph, self.config.language):
+            if parsers.is_highlink_density(
+                paragraph, self.config.language, self.text_index
+            ):
                 continue
 
             if stop_word_count > baseline_score * score_weight:
-                text = parsers.get_text(paragraph)
+                text = parsers.get_text(paragraph, self.text_index)
                 element = parsers.create_element(tag="p", text=text)
                 result.append(element)
 
@@ -377,7 +602,7 @@ def get_normalized_score(self, top_node):
 
         nodes_to_check = parsers.get_tags(top_node, tag="p")
 
-        scores = [parsers.get_node_gravity_score(node) for node in nodes_to_check]
+        scores = [self.get_gravity_score(node) for node in nodes_to_check]
         scores = [score for score in scores if score > 0]  # filter out 0 scores
 
         return mean(scores) if scores else float("inf")
@@ -409,13 +634,24 @@ def complement_with_siblings(self, node: lxml.html.Element) -> lxml.html.Element
         #             parsers.remove(e)
         return node_complemented
 
+    def _copy_with_scores(self, node: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+        """Deep copy of `node` for top_node_complemented. The copied nodes
+        get the gravity scores of the originals in `complemented_scores`."""
+        node_copy = copy.deepcopy(node)
+        # deepcopy keeps the order of the elements
+        for original, copied in zip(node.iter(), node_copy.iter()):
+            score = self.gravity_scores.get(original)
+            if score is not None:
+                self.complemented_scores[copied] = score
+        return node_copy
+
     def add_same_level_candidates(self, node):
         """Adds any siblings that may have a decent score to this node"""
         tree = node.getroottree()
 
         node_level = parsers.get_level(node)
         # base_score = self.get_normalized_score(node)
-        base_score = parsers.get_node_gravity_score(node)
+        base_score = self.get_gravity_score(node)
 
         candidates = parsers.get_nodes_at_level(tree.getroot(), node_level)
 
@@ -428,19 +664,21 @@ def add_same_level_candidates(self, node):
 
         for n in candidates:
             if n == node:
-                new_node.append(copy.deepcopy(node))
+                new_node.append(self._copy_with_scores(node))
+                self.complemented_nodes.append(node)
                 continue
 
             # avoid adding nodes that do not resemble the top node
             if n.tag != node.tag:
                 continue
 
-            score = parsers.get_node_gravity_score(n)
+            score = self.get_gravity_score(n)
 
             if score > base_score * 0.3 and not parsers.is_highlink_density(
-                n, self.config.language
+                n, self.config.language, self.text_index
             ):
-                new_node.append(copy.deepcopy(n))
+                new_node.append(self._copy_with_scores(n))
+                self.complemented_nodes.append(n)
                 continue
 
             # content_items = self.get_plausible_content(n, base_score)
@@ -1,6 +1,5 @@
 import re
 import lxml
-import tldextract
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 from newspaper import urls
 from newspaper.configuration import Configuration
@@ -19,7 +18,7 @@ def parse(self, source_url: str, doc: lxml.html.Element) -> List[str]:
         the category urls.
         cnn.com --> [cnn.com/latest, world.cnn.com, cnn.com/asia]
         """
-        domain_tld = tldextract.extract(source_url)
+        domain_tld = urls.split_domain(source_url)
 
         links_in_doc = set([a.get("href") for a in parsers.get_tags(doc, tag="a")])
 
@@ -101,7 +100,7 @@ def _get_other_links(
 
         def _filter(candidate):
             if filter_tld is not None:
-                candidate_tld = tldextract.extract(candidate)
+                candidate_tld = urls.split_domain(candidate)
                 if candidate_tld.domain != filter_tld:
                     return False
             if re.search(r"\.(css|js|json|xml|rss|jpg|jpeg|png|)$", candidate, re.I):
@@ -145,7 +144,7 @@ def is_valid_link(self, url: str, filter_tld: str) -> Tuple[bool, Dict[str, Any]
             path_chunks.remove("index.html")
 
         if parsed_url["domain"]:
-            child_tld = tldextract.extract(url)
+            child_tld = urls.split_domain(url)
             parsed_url["tld"] = child_tld
             child_subdomain_parts = child_tld.subdomain.split(".")
 
@@ -120,10 +120,15 @@ def get_metadata(self, article_url: str, doc: lxml.html.Element) -> Dict[str, An
         return self.metadata_extractor.parse(article_url, doc)
 
     def parse_images(
-        self, article_url: str, doc: lxml.html.Element, top_node: lxml.html.Element
+        self,
+        article_url: str,
+        doc: lxml.html.Element,
+        top_node: lxml.html.Element,
+        top_image: bool = True,
     ):
-        """Parse images in an article"""
-        self.image_extractor.parse(doc, top_node, article_url)
+        """Parse images in an article. The top image is not searched if
+        ``top_image`` is False"""
+        self.image_extractor.parse(doc, top_node, article_url, top_image)
 
     def get_category_urls(self, source_url, doc):
         """Inputs source lxml root and source url, extracts domain and
@@ -152,6 +157,28 @@ def top_node_complemented(self) -> lxml.html.Element:
         """
         return self.article_body_extractor.top_node_complemented
 
+    @property
+    def complemented_nodes(self) -> List[lxml.html.Element]:
+        """The nodes of the document that make up :any:`top_node_complemented`:
+        the top node and its siblings with a similar score.
+        calculate_best_node() must be called first
+
+        Returns:
+            List[lxml.html.Element]: the top node and the added siblings
+        """
+        return self.article_body_extractor.complemented_nodes
+
+    @property
+    def complemented_scores(self) -> Dict[lxml.html.Element, float]:
+        """The gravity scores of the nodes of :any:`top_node_complemented`,
+        for :any:`OutputFormatter.get_formatted`.
+        calculate_best_node() must be called first
+
+        Returns:
+            Dict[lxml.html.Element, float]: the scores of the scored nodes
+        """
+        return self.article_body_extractor.complemented_scores
+
     def calculate_best_node(
         self, doc: lxml.html.Element
     ) -> Optional[lxml.html.Element]:
@@ -2,17 +2,19 @@
 import urllib.parse
 from copy import copy
 import re
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import lxml
-from PIL import Image, ImageFile
 import requests
 from newspaper import urls
 import newspaper.parsers as parsers
-from newspaper.network import session
+from newspaper import network
 from newspaper.configuration import Configuration
 import newspaper.extractors.defines as defines
 from newspaper.urls import urljoin_if_valid
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 log = logging.getLogger(__name__)
 
 
@@ -29,12 +31,18 @@ def __init__(self, config: Configuration) -> None:
         self._chunksize = 1024
 
     def parse(
-        self, doc: lxml.html.Element, top_node: lxml.html.Element, article_url: str
+        self,
+        doc: lxml.html.Element,
+        top_node: lxml.html.Element,
+        article_url: str,
+        top_image: bool = True,
     ) -> None:
         """main method to extract images from a document
 
         Args:
             doc (lxml.html.Element): _description_
+            top_image (bool): if False, the top image is not searched, and
+                no image is downloaded to check its size. Defaults to True.
         """
         self.favicon = self._get_favicon(doc)
 
@@ -46,7 +54,9 @@ def parse(
             for u, alt in self._get_images(doc)
             if u and u.strip()
         ]
-        self.top_image = self._get_top_image(doc, top_node, article_url)
+        self.top_image = ""
+        if top_image:
+            self.top_image = self._get_top_image(doc, top_node, article_url)
 
     def _get_favicon(self, doc: lxml.html.Element) -> str:
         """Extract the favicon from a website http://en.wikipedia.org/wiki/Favicon
@@ -167,7 +177,7 @@ def _check_image_size(self, url: str, referer: Optional[str]) -> bool:
 
         return True
 
-    def _fetch_image(self, url: str, referer: Optional[str]) -> Optional[Image.Image]:
+    def _fetch_image(self, url: str, referer: Optional[str]) -> Optional["Image.Image"]:
         def clean_url(url):
             """Url quotes unicode data out of urls"""
             if not isinstance(url, str):
@@ -182,8 +192,14 @@ def clean_url(url):
             )
             return url
 
+        from PIL import ImageFile  # pylint: disable=import-outside-toplevel
+
         requests_params = copy(self.config.requests_params)
-        requests_params["headers"]["Referer"] = referer
+        # do not modify the configuration headers, they are shared between threads
+        requests_params["headers"] = {
+            **(requests_params.get("headers") or {}),
+            "Referer": referer,
+        }
         max_retries = self.config.top_image_settings["max_retries"]
 
         cur_try = 0
@@ -194,7 +210,7 @@ def clean_url(url):
         response = None
         while True:
             try:
-                response = session.get(
+                response = network.session_manager.get(self.config).get(
                     url,
                     stream=True,
                     **requests_params,
@@ -27,6 +27,15 @@ def __init__(self, config: Configuration) -> None:
             "data": None,
         }
 
+    @property
+    def meta_type(self) -> Optional[str]:
+        """The ``og:type`` of the document, e.g. ``article``"""
+        return self.meta_data["type"]
+
+    @meta_type.setter
+    def meta_type(self, value: Optional[str]):
+        self.meta_data["type"] = value
+
     def parse(self, article_url: str, doc: lxml.html.Element) -> Dict[str, Any]:
         """Parse the article's HTML for any known metadata attributes"""
         self.meta_data["language"] = self._get_meta_language(doc)
@@ -6,7 +6,6 @@
 from newspaper import urls
 from newspaper.configuration import Configuration
 import newspaper.parsers as parsers
-from dateutil.parser import parse as date_parser
 
 from newspaper.extractors.defines import PUBLISH_DATE_META_INFO, PUBLISH_DATE_TAGS
 
@@ -26,6 +25,9 @@ def parse(self, article_url: str, doc: lxml.html.Element) -> Optional[datetime]:
         3. Raw regex searches in the HTML + added heuristics
         """
 
+        # pylint: disable-next=import-outside-toplevel
+        from dateutil.parser import parse as date_parser
+
         def parse_date_str(date_str):
             if date_str:
                 try:
@@ -1,16 +1,35 @@
 """
-Helper functions for multihtreading news fetching.
+Helper functions for multihtreading news fetching, and multiprocessing
+article parsing.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
 import newspaper
+from newspaper import network
 from newspaper.article import Article
+from newspaper.configuration import Configuration
 from newspaper.source import Source
 
+# Attributes that are not sent back from the parsing processes: lxml trees,
+# objects holding lxml trees, and what the calling process already has
+_NOT_TRANSFERRED_ATTRIBUTES = {
+    "config",
+    "extractor",
+    "doc",
+    "_clean_doc",
+    "top_node",
+    "_top_node_complemented",
+    "_doc_index",
+    "_html",
+}
+
 
 def fetch_news(
-    news_list: List[Union[str, Article, Source]], threads: int = 5
+    news_list: List[Union[str, Article, Source]],
+    threads: int = 5,
+    parse_processes: Optional[int] = None,
 ) -> List[Union[Article, Source]]:
     """
     Fetch news from a list of sources, articles, or both. Threads will be
@@ -32,25 +51,131 @@ def fetch_news(
             `Configuration`.`number_threads` setting. This could result in
             a high number of threads. Maximum number of threads would be
             `threads` * `Configuration`.`number_threads`.
+            The items are processed spread across domains, and the per-domain
+            limits (`Configuration`.`domain_max_concurrency`,
+            `Configuration`.`domain_requests_per_second`) apply to all
+            the downloads.
+        parse_processes(int, optional): If set, the articles are only
+            downloaded in the threads, and then parsed with :any:`parse_many`
+            in this number of processes. Note that the parsed articles do
+            not keep their lxml trees (``doc``, ``top_node``, ...).
+            Sources use their own `Configuration`.`parse_processes` setting.
     Returns:
         List[Union[Article, Source]]: List of articles or sources.
     """
 
     def get_item(item: Union[str, Article, Source]) -> Union[Article, Source]:
+        if isinstance(item, str):
+            if parse_processes:
+                return Article(url=item).download()
+            return newspaper.article(url=item)
         if isinstance(item, Article):
             item.download()
-            item.parse()
+            if not parse_processes:
+                item.parse()
         elif isinstance(item, Source):
             item.download_articles()
             item.parse_articles()
-        elif isinstance(item, str):
-            item = newspaper.article(url=item)
         else:
             raise TypeError(f"Invalid type {type(item)} for item {item}")
 
         return item
 
+    def get_url(item: Union[str, Article, Source]) -> str:
+        return item if isinstance(item, str) else item.url
+
     with ThreadPoolExecutor(max_workers=threads) as tpe:
-        results = tpe.map(get_item, news_list)
+        # Spread the items across domains, the per-domain politeness rules
+        # are enforced for every request by network.scheduler
+        futures = {
+            idx: tpe.submit(get_item, news_list[idx])
+            for idx in network.scheduler.spread([get_url(x) for x in news_list])
+        }
+        results = [futures[idx].result() for idx in range(len(news_list))]
+
+    if parse_processes:
+        parse_many([x for x in results if isinstance(x, Article)], parse_processes)
+
+    return results
+
+
+def _compact_state(article: Article) -> Dict[str, Any]:
+    """The parsing results of an article, without the lxml trees"""
+    article.extract_fields()
+    state = {
+        k: v
+        for k, v in article.__dict__.items()
+        if k not in _NOT_TRANSFERRED_ATTRIBUTES
+    }
+    # needed by Article.is_valid_body()
+    state["meta_type"] = article.extractor.metadata_extractor.meta_type
+    return state
+
+
+def _parse_worker(payload: Tuple[str, str, Configuration]) -> Dict[str, Any]:
+    """Parses one article in a worker process"""
+    url, html, config = payload
+    article = Article(url, config=config)
+    article.html = html
+    article.parse()
+    return _compact_state(article)
+
+
+def parse_many(
+    items: List[Union[Article, Tuple[str, str]]],
+    processes: Optional[int] = None,
+    config: Optional[Configuration] = None,
+) -> List[Article]:
+    """Parse many articles in parallel, using a pool of processes. Parsing is
+    CPU bound, so unlike threads, the processes can use all the cpu cores.
+
+    Only the url, the html and the configuration are sent to the worker
+    processes, and only the extracted fields (title, text, authors, etc.)
+    are sent back. The lxml trees (``doc``, ``top_node``, ``clean_doc``)
+    of the returned articles are therefore None.
+
+    Args:
+        items (List[Union[Article, Tuple[str, str]]]): downloaded
+            :any:`Article` objects, or ``(url, html)`` tuples.
+        processes (int, optional): number of worker processes. Defaults to
+            the ``parse_processes`` of the articles configurations, or the
+            number of cpus.
+        config (Configuration, optional): configuration used for the
+            articles created from ``(url, html)`` tuples.
+
+    Returns:
+        List[Article]: the parsed articles, in the order of `items`. Article
+        objects passed in `items` are updated in place.
+
+    Raises:
+        ArticleException: if one of the articles was not downloaded.
+    """
+    config = config or Configuration()
+    articles = []
+    for item in items:
+        if not isinstance(item, Article):
+            url, html = item
+            item = Article(url, config=config)
+            item.html = html
+        item.throw_if_not_downloaded_verbose()
+        articles.append(item)
+
+    processes = (
+        processes
+        or max((a.config.parse_processes or 0 for a in articles), default=0)
+        or os.cpu_count()
+        or 1
+    )
+    payloads = [(a.url, a.html, a.config) for a in articles]
+    if processes <= 1 or len(articles) <= 1:
+        states = [_parse_worker(payload) for payload in payloads]
+    else:
+        chunksize = max(1, len(payloads) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes) as ppe:
+            states = list(ppe.map(_parse_worker, payloads, chunksize=chunksize))
+
+    for article, state in zip(articles, states):
+        article.extractor.metadata_extractor.meta_type = state.pop("meta_type")
+        article.__dict__.update(state)
 
-    return list(results)
+    return articles
@@ -2,23 +2,60 @@
 Helper functions for http requests and remote data fetching.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, List, Optional, Tuple, Union
+import asyncio
+import concurrent.futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import email.utils
+import functools
+import hashlib
+import importlib
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 import logging
+import os
+from pathlib import Path
+import pickle
+import ssl
+import threading
+import time
+from types import ModuleType
+from urllib.parse import urlparse
+import weakref
 import requests
 
 from requests import RequestException
 from requests import Response
-import tldextract
+from requests.adapters import HTTPAdapter
+from requests.models import CONTENT_CHUNK_SIZE
+from requests.structures import CaseInsensitiveDict
 
 from newspaper import parsers
+from newspaper import settings
+from newspaper import urls as urls_module
 from newspaper.exceptions import ArticleException, ArticleBinaryDataException
 from newspaper.configuration import Configuration
+from newspaper.utils import LRUCache
 
 log = logging.getLogger(__name__)
 
 FAIL_ENCODING = "ISO-8859-1"
 
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+}
+
 
 def get_session() -> requests.Session:
     """
@@ -44,76 +81,591 @@ def get_session() -> requests.Session:
             " library is recommended for bypassing Cloudflare protection)"
         )
 
-    sess.headers.update(
-        {
-            "Accept-Encoding": "gzip, deflate",
-        }
-    )
+    sess.headers.update(DEFAULT_HEADERS)
     return sess
 
 
-session = get_session()
+class SessionManager:
+    """Hands out one :class:`requests.Session` per :any:`Configuration`.
+
+    Session state (cookies, default headers) is never shared between two
+    configurations, so that several configurations can be used at the same
+    time from different threads. The connection pools, on the other hand, are
+    shared by all sessions: every session mounts the same transport adapters,
+    which keep up to ``pool_size_per_host`` keep-alive connections for each of
+    the last :any:`settings.POOL_MAX_HOSTS` hosts. This way TCP/TLS
+    connections are reused across articles, sources and threads.
+    The sessions are released together with their configuration objects.
+    The default session is only created when it is first used.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._default_lock = threading.Lock()
+        self._default_session: Optional[requests.Session] = None
+        self._sessions: "weakref.WeakKeyDictionary[Configuration, requests.Session]"
+        self._sessions = weakref.WeakKeyDictionary()
+        self._adapters: Dict[str, HTTPAdapter] = {}
+        self._pool_maxsize = 0
+
+    @property
+    def default_session(self) -> requests.Session:
+        """The session used when no configuration is given."""
+        if self._default_session is None:
+            with self._default_lock:
+                if self._default_session is None:
+                    self._default_session = self._create_session(None)
+        return self._default_session
+
+    @staticmethod
+    def pool_size_for(config: Optional[Configuration]) -> int:
+        """The number of keep-alive connections per host needed by `config`."""
+        if config is None:
+            return settings.DEFAULT_POOL_SIZE_PER_HOST
+        if config.pool_size_per_host:
+            return config.pool_size_per_host
+        return max(config.number_threads, settings.DEFAULT_POOL_SIZE_PER_HOST)
+
+    def _resize_adapters(self, pool_maxsize: int):
+        """Grows the shared connection pools, by mounting new adapters on all
+        the sessions. Must be called with the lock held"""
+        self._pool_maxsize = pool_maxsize
+        for prefix, adapter in list(self._adapters.items()):
+            if type(adapter) is HTTPAdapter:
+                self._adapters[prefix] = HTTPAdapter(
+                    pool_connections=settings.POOL_MAX_HOSTS,
+                    pool_maxsize=pool_maxsize,
+                    max_retries=adapter.max_retries,
+                )
+            else:
+                # adapters of the session factory (e.g. cloudscraper) set up
+                # their TLS context in init_poolmanager, keep them
+                adapter.init_poolmanager(settings.POOL_MAX_HOSTS, pool_maxsize)
+
+        sessions = list(self._sessions.values())
+        if self._default_session is not None:
+            sessions.append(self._default_session)
+        for sess in sessions:
+            self._mount_adapters(sess)
+
+    def _mount_adapters(self, sess: requests.Session):
+        for prefix, adapter in self._adapters.items():
+            sess.mount(prefix, adapter)
+
+    def _create_session(self, config: Optional[Configuration]) -> requests.Session:
+        sess = get_session()
+        with self._lock:
+            for prefix, adapter in list(sess.adapters.items()):
+                if isinstance(adapter, HTTPAdapter) and prefix not in self._adapters:
+                    self._adapters[prefix] = adapter
+
+            pool_maxsize = self.pool_size_for(config)
+            if pool_maxsize > self._pool_maxsize:
+                self._resize_adapters(pool_maxsize)
+            self._mount_adapters(sess)
+
+        return sess
+
+    def get(self, config: Optional[Configuration] = None) -> requests.Session:
+        """Returns the session associated with `config`, creating it if needed.
+        If `config` is None, the default (module wide) session is returned.
+        """
+        if config is None:
+            return self.default_session
+
+        with self._lock:
+            sess = self._sessions.get(config)
+        if sess is None:
+            sess = self._create_session(config)
+            with self._lock:
+                sess = self._sessions.setdefault(config, sess)
+
+        return sess
+
+    def stats(self) -> Dict[str, Any]:
+        """Keep-alive statistics of the currently pooled hosts.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the total number of ``requests``
+            sent, ``connections`` opened and connections ``reused`` (requests
+            that did not need a new connection), plus the same numbers for every
+            host (``host:port``) under ``hosts``. Hosts evicted from the pool
+            are not counted.
+        """
+        hosts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            adapters = list(self._adapters.values())
+
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            with pools.lock:
+                # pylint: disable=protected-access
+                host_pools = list(pools._container.values())
+            for pool in host_pools:
+                name = pool.host if pool.port is None else f"{pool.host}:{pool.port}"
+                host = hosts.setdefault(
+                    name, {"requests": 0, "connections": 0, "reused": 0}
+                )
+                host["requests"] += pool.num_requests
+                host["connections"] += pool.num_connections
+                host["reused"] = max(host["requests"] - host["connections"], 0)
+
+        return {
+            "requests": sum(h["requests"] for h in hosts.values()),
+            "connections": sum(h["connections"] for h in hosts.values()),
+            "reused": sum(h["reused"] for h in hosts.values()),
+            "hosts": hosts,
+        }
+
+
+session_manager = SessionManager()
+
+
+def _import_aiohttp() -> Optional[ModuleType]:
+    """Imports aiohttp on first use, it is slow to import and only needed by
+    the async functions. Returns None if aiohttp is not installed.
+    """
+    if "aiohttp" not in globals():
+        aiohttp: Optional[ModuleType]
+        try:
+            aiohttp = importlib.import_module("aiohttp")
+        except ImportError:
+            aiohttp = None
+        globals()["aiohttp"] = aiohttp
+    return globals()["aiohttp"]
+
+
+def _require_aiohttp() -> ModuleType:
+    """The aiohttp module, for the code only used when it is installed"""
+    aiohttp = _import_aiohttp()
+    assert aiohttp is not None, "aiohttp is not installed"
+    return aiohttp
+
+
+# The default session, created on first access by the module __getattr__
+session: requests.Session
+
+
+def __getattr__(name: str) -> Any:
+    # `aiohttp` and the default `session` are created on first access
+    if name == "aiohttp":
+        return _import_aiohttp()
+    if name == "session":
+        return session_manager.default_session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def reset_session() -> requests.Session:
     """
     Resets the session variable to a new requests.Session object. Destroys any
     cookies and other session data that may have been stored in the previous
-    object.
+    object. All the per configuration sessions and the shared connection pools
+    are dropped as well.
 
     Returns:
         requests.Session: The newly created session object.
     """
-    global session  # pylint: disable=global-statement
-    session = get_session()
+    global session, session_manager  # pylint: disable=global-statement
+    session_manager = SessionManager()
+    session = session_manager.default_session
     return session
 
 
-def do_cache(func: Callable):
+@dataclass
+class HttpCacheEntry:
+    """A stored response, along with its validators (ETag, Last-Modified)"""
+
+    url: str
+    content: bytes
+    headers: Dict[str, str]
+    encoding: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        """The conditional request headers for this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request_url: str) -> Response:
+        """Rebuilds the stored response"""
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url or request_url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response._content = self.content  # pylint: disable=protected-access
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+class HttpValidatorCache:
+    """Persistent HTTP conditional-GET cache. For every url, the last
+    response body is saved on disk together with its ``ETag`` and
+    ``Last-Modified`` validators. The next request for the same url sends
+    ``If-None-Match`` / ``If-Modified-Since`` and, if the server answers
+    with ``304 Not Modified``, the stored body is reused.
+
+    It is used for the :any:`Source` homepage, categories and feeds, which
+    rarely change between two builds, if :any:`Configuration.use_http_cache`
+    is set. At most ``max_entries`` responses are kept: past it, the least
+    recently used ones are removed, down to 90% of ``max_entries`` so that
+    the folder is not scanned on every store.
+    """
+
+    def __init__(
+        self,
+        cache_folder: Union[str, Path] = settings.HTTP_CACHE_DIRECTORY,
+        max_entries: int = settings.HTTP_CACHE_MAX_ENTRIES,
+    ):
+        self._cache_folder = Path(cache_folder)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Number of stored responses, counted on the first store
+        self._entries: Optional[int] = None
+
+    def get_cache_file(self, url: str) -> Path:
+        filename = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self._cache_folder / filename
+
+    def get(self, url: str) -> Optional[HttpCacheEntry]:
+        """Returns the stored entry for `url`, None if there is none"""
+        filepath = self.get_cache_file(url)
+        try:
+            with open(filepath, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            log.debug("Invalid http cache file %s for URL %s: %s", filepath, url, e)
+            return None
+        # the modification time is the last use, for the eviction
+        try:
+            os.utime(filepath)
+        except OSError:
+            pass
+        return entry
+
+    def _cache_files(self) -> List[Path]:
+        """The files of the stored responses, without the ones being written"""
+        if not self._cache_folder.exists():
+            return []
+        return [f for f in self._cache_folder.iterdir() if f.suffix != ".tmp"]
+
+    def store(self, url: str, response: Response):
+        """Saves `response` for `url`, if it has validators"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = HttpCacheEntry(
+            url=response.url,
+            content=response.content,
+            headers=dict(response.headers),
+            encoding=response.encoding,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        filepath = self.get_cache_file(url)
+        self._cache_folder.mkdir(parents=True, exist_ok=True)
+        # write + rename, so that concurrent readers never see partial files
+        tmp_filepath = filepath.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_filepath, "wb") as f:
+            pickle.dump(entry, f)
+        with self._lock:
+            if self._entries is None:
+                self._entries = len(self._cache_files())
+            if not filepath.exists():
+                self._entries += 1
+            os.replace(tmp_filepath, filepath)
+            if self._entries > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Removes the least recently used responses, down to 90% of
+        ``max_entries``. Called with the lock held."""
+        mtimes = {}
+        for filepath in self._cache_files():
+            try:
+                mtimes[filepath] = filepath.stat().st_mtime
+            except FileNotFoundError:
+                continue
+        keep = self.max_entries - self.max_entries // 10
+        oldest = sorted(mtimes, key=mtimes.__getitem__)
+        for filepath in oldest[: max(len(mtimes) - keep, 0)]:
+            filepath.unlink(missing_ok=True)
+        self._entries = min(len(mtimes), keep)
+
+    def update(
+        self, url: str, response: Response, entry: Optional[HttpCacheEntry]
+    ) -> Response:
+        """Processes the `response` to a (possibly conditional) request.
+        Returns the stored response on a ``304 Not Modified``, otherwise
+        stores the new response and returns it.
+        """
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self.hits += 1
+            log.debug("Http cache hit (304) for URL: %s", url)
+            return entry.to_response(url)
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200:
+            self.store(url, response)
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of cache ``hits`` and ``misses``"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        """Removes all stored responses and resets the counters"""
+        with self._lock:
+            for filepath in self._cache_files():
+                filepath.unlink(missing_ok=True)
+            self._entries = 0
+            self.hits = 0
+            self.misses = 0
+
+
+http_cache = HttpValidatorCache()
+
+
+_NOT_CACHED = object()
+
+
+def _url_domain(url: str) -> str:
+    """Registered domain of the url, e.g. cnn.com for https://edition.cnn.com"""
+    tld = urls_module.split_domain(url)
+    return tld.domain + "." + tld.suffix
+
+
+def do_cache(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: int = settings.DOMAIN_CACHE_MAX_SIZE,
+    ttl: Optional[float] = settings.DOMAIN_CACHE_TTL_SECONDS,
+):
     """A decorator that caches the result of a function based on its arguments.
     expects url as one argument and caches the result based on the domain
-    of the url.
+    of the url. The results are kept in a thread-safe :any:`LRUCache`, with
+    at most `maxsize` domains, each valid for `ttl` seconds. The cache is
+    available as the ``cache`` attribute of the decorated function.
+    Can be used as ``@do_cache`` or ``@do_cache(maxsize=100, ttl=60)``.
     Args:
         func (Callable): The function to be cached.
+        maxsize (int): The maximum number of cached domains.
+        ttl (float, optional): Expiry of the cached results, in seconds.
+            None means no expiry.
     Returns:
         Callable: The wrapped function that caches the result.
     """
 
-    def wrapper(*args, **kwargs):
-        if not hasattr(func, "cache"):
-            func.cache = {}
-        if kwargs.get("url"):
-            url = kwargs["url"]
-        else:
-            url = args[0] if len(args) > 0 else None
-        if url:
-            tld = tldextract.extract(url).domain + "." + tldextract.extract(url).suffix
-        else:
-            return func(*args, **kwargs)
+    def decorator(func: Callable) -> Callable:
+        cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if kwargs.get("url"):
+                url = kwargs["url"]
+            else:
+                url = args[0] if len(args) > 0 else None
+            if not url:
+                return func(*args, **kwargs)
+
+            domain = _url_domain(url)
+            result = cache.get(domain, _NOT_CACHED)
+            if result is _NOT_CACHED:
+                # computed outside of the cache lock, concurrent calls for
+                # the same domain could run the function twice
+                result = func(*args, **kwargs)
+                cache.set(domain, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+@dataclass
+class _DomainState:
+    """Politeness state of a single domain"""
+
+    in_flight: int = 0
+    waiting: int = 0
+    tokens: float = 0.0
+    updated: float = 0.0
+    blocked_until: float = 0.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a ``Retry-After`` header (seconds or http date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class DomainScheduler:
+    """Per-domain politeness for http requests. Every request made by
+    :any:`do_request` waits for a free slot of its domain (host), so that:
+
+    * at most :any:`Configuration.domain_max_concurrency` requests are in
+      flight for the same domain,
+    * at most :any:`Configuration.domain_requests_per_second` requests are
+      started per second for the same domain (token bucket, allowing bursts
+      of the same size),
+    * after a ``429`` or ``503`` response with a ``Retry-After`` header, no
+      new request is sent to the domain for the announced time (at most
+      :any:`Configuration.max_retry_after` seconds, if it is set).
+
+    The state is shared by all threads and configurations, the limits are
+    taken from the configuration of each request.
+    """
+
+    MAX_IDLE_DOMAINS = 10000
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._states: Dict[str, _DomainState] = {}
+
+    @staticmethod
+    def spread(urls: List[str]) -> List[int]:
+        """Orders the indexes of `urls` round-robin across domains, keeping
+        the relative order of the urls of each domain. Processing a mixed url
+        list in this order keeps the requests spread over all domains.
+        """
+        queues: Dict[Optional[str], List[int]] = {}
+        for idx, url in enumerate(urls):
+            queues.setdefault(urls_module.get_domain(url), []).append(idx)
+
+        order: List[int] = []
+        for round_robin in itertools.zip_longest(*queues.values()):
+            order.extend(idx for idx in round_robin if idx is not None)
+        return order
+
+    def _prune(self, now: float):
+        """Drops the state of idle domains. Must be called with the lock held"""
+        for domain, state in list(self._states.items()):
+            if (
+                state.in_flight == 0
+                and state.waiting == 0
+                and state.blocked_until <= now
+            ):
+                del self._states[domain]
+
+    def acquire(self, url: str, config: Configuration):
+        """Blocks until a request to `url` is allowed by the politeness rules"""
+        domain = urls_module.get_domain(url) or ""
+        max_concurrency = config.domain_max_concurrency
+        rate = config.domain_requests_per_second
+        capacity = max(1.0, rate or 0)
+
+        with self._cond:
+            state = self._states.get(domain)
+            if state is None:
+                now = time.monotonic()
+                if len(self._states) >= self.MAX_IDLE_DOMAINS:
+                    self._prune(now)
+                state = _DomainState(tokens=capacity, updated=now)
+                self._states[domain] = state
+
+            while True:
+                now = time.monotonic()
+                wait = state.blocked_until - now
+                if rate:
+                    state.tokens = min(
+                        capacity, state.tokens + (now - state.updated) * rate
+                    )
+                    if state.tokens < 1:
+                        wait = max(wait, (1 - state.tokens) / rate)
+                state.updated = now
+                saturated = bool(max_concurrency and state.in_flight >= max_concurrency)
+
+                if wait <= 0 and not saturated:
+                    break
+                # A finished request of this domain notifies the waiters
+                state.waiting += 1
+                try:
+                    self._cond.wait(timeout=wait if wait > 0 else None)
+                finally:
+                    state.waiting -= 1
+
+            state.in_flight += 1
+            if rate:
+                state.tokens -= 1
+
+    def release(
+        self, url: str, config: Configuration, response: Optional[Response] = None
+    ):
+        """Frees the slot taken by :any:`acquire`, and honours the
+        ``Retry-After`` header of the `response`, if any"""
+        domain = urls_module.get_domain(url) or ""
+        with self._cond:
+            state = self._states.get(domain)
+            if state is None:
+                return
+            state.in_flight = max(state.in_flight - 1, 0)
+
+            if response is not None and response.status_code in (429, 503):
+                delay = _parse_retry_after(response.headers.get("Retry-After"))
+                if delay and config.max_retry_after:
+                    delay = min(delay, config.max_retry_after)
+                    log.info(
+                        "Server asked to retry after %.1f seconds, pausing domain %s",
+                        delay,
+                        domain,
+                    )
+                    state.blocked_until = max(
+                        state.blocked_until, time.monotonic() + delay
+                    )
+            self._cond.notify_all()
 
-        if tld not in func.cache:
-            func.cache[tld] = func(*args, **kwargs)
-        return func.cache[tld]
 
-    return wrapper
+scheduler = DomainScheduler()
 
 
 @do_cache
-def has_get_ranges(url: str) -> bool:
+def has_get_ranges(url: str, config: Optional[Configuration] = None) -> bool:
     """Does this url support HTTP Range requests?"""
+    sess = session_manager.get(config)
+    headers = config.headers if config else None
     try:
-        resp = session.head(url, timeout=3, allow_redirects=False)
+        resp = sess.head(url, headers=headers, timeout=3, allow_redirects=False)
         if resp.status_code in [301, 302, 303, 307, 308]:
             new_url = resp.headers.get("Location")
             if new_url:
-                resp = session.head(url, timeout=3, allow_redirects=True)
+                resp = sess.head(url, headers=headers, timeout=3, allow_redirects=True)
                 url = new_url
 
         if "Accept-Ranges" in resp.headers:
             return True
 
-        resp = session.get(
-            url, headers={"Range": "bytes=0-100"}, timeout=3, stream=True
+        resp = sess.get(
+            url,
+            headers={**(headers or {}), "Range": "bytes=0-100"},
+            timeout=3,
+            stream=True,
         )
         if resp.status_code == 206:
             return True
@@ -123,42 +675,159 @@ def has_get_ranges(url: str) -> bool:
     return False
 
 
-def is_binary_url(url: str) -> bool:
-    """Does this url point to a binary file?"""
-    try:
-        resp = session.head(url, timeout=3, allow_redirects=True)
-        if "Content-Type" in resp.headers:
-            if resp.headers["Content-Type"].startswith("application"):
-                if (
-                    "json" not in resp.headers["Content-Type"]
-                    and "xml" not in resp.headers["Content-Type"]
-                ):
-                    return True
-            if resp.headers["Content-Type"].startswith("image"):
-                return True
-            if resp.headers["Content-Type"].startswith("video"):
-                return True
-            if resp.headers["Content-Type"].startswith("audio"):
-                return True
-            if resp.headers["Content-Type"].startswith("font"):
+def _is_binary_content_type(headers: Mapping[str, str]) -> bool:
+    """Do the response headers announce a binary payload?"""
+    content_type = headers.get("Content-Type")
+    if content_type:
+        if content_type.startswith("application"):
+            if "json" not in content_type and "xml" not in content_type:
                 return True
+        if content_type.startswith(("image", "video", "audio", "font")):
+            return True
+
+    if "Content-Disposition" in headers:
+        return True
+
+    return False
+
+
+def _is_binary_content(content: Union[str, bytes, None]) -> bool:
+    """Does the beginning of a response body look like binary data?"""
+    if content is None:
+        return False
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+
+    content = content[:1000]
 
-        if "Content-Disposition" in resp.headers:
+    if len(content) == 0:
+        return False
+
+    if "<html" in content:
+        return False
+
+    chars = len(
+        [
+            char
+            for char in [ord(c) if isinstance(c, str) else c for c in content]
+            if 31 < char < 128 or char in [9, 10, 13]
+        ]
+    )
+    if chars / len(content) < 0.6:  # 40% of the content is binary
+        return True
+
+    return False
+
+
+class BinaryVerdictCache:
+    """Keeps track, per domain, of how many downloads were html and how many
+    were binary. Once a domain served :any:`HTML_ONLY_THRESHOLD` html pages and
+    no binary content, it is considered *html only*: the first bytes of its
+    responses are not sniffed anymore and :any:`is_binary_url` skips the
+    probing requests entirely. The ``Content-Type`` header is always checked.
+    The verdicts are kept in a :any:`LRUCache`, so they are bounded in number
+    and expire after ``settings.DOMAIN_CACHE_TTL_SECONDS``.
+    """
+
+    HTML_ONLY_THRESHOLD = 10
+
+    def __init__(
+        self,
+        maxsize: int = settings.DOMAIN_CACHE_MAX_SIZE,
+        ttl: Optional[float] = settings.DOMAIN_CACHE_TTL_SECONDS,
+    ):
+        self._lock = threading.Lock()
+        self._verdicts = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def record(self, url: str, is_binary: bool):
+        """Records the verdict for a downloaded url"""
+        domain = _url_domain(url)
+        with self._lock:
+            html, binary = self._verdicts.get(domain, (0, 0))
+            if is_binary:
+                binary += 1
+            else:
+                html += 1
+            self._verdicts.set(domain, (html, binary))
+
+    def is_html_only(self, url: str) -> bool:
+        """True if the domain of `url` never served binary content so far"""
+        html, binary = self._verdicts.get(_url_domain(url), (0, 0))
+        return binary == 0 and html >= self.HTML_ONLY_THRESHOLD
+
+    def stats(self) -> Dict[str, int]:
+        """Hits and misses of the verdict lookups"""
+        return self._verdicts.stats()
+
+    def clear(self):
+        self._verdicts.clear()
+
+
+binary_verdicts = BinaryVerdictCache()
+
+
+def _sniff_binary_response(url: str, response: Response) -> bool:
+    """Checks a streamed `response` for binary content, using its headers and
+    its first bytes. The body is read completely only if it is not binary,
+    otherwise the connection is closed without downloading the rest.
+
+    Returns:
+        bool: True if the response is binary (and was closed).
+    """
+    is_binary = _is_binary_content_type(response.headers)
+    first_chunk = b""
+    if not is_binary:
+        first_chunk = next(response.iter_content(1000), b"")
+        if response.status_code < 300 and not binary_verdicts.is_html_only(url):
+            is_binary = _is_binary_content(first_chunk)
+
+    if response.status_code < 300:
+        binary_verdicts.record(url, is_binary)
+
+    if is_binary:
+        response.close()
+        return True
+
+    rest = b"".join(response.iter_content(CONTENT_CHUNK_SIZE))
+    # pylint: disable=protected-access
+    response._content = first_chunk + rest
+    response._content_consumed = True  # type: ignore[attr-defined]
+    return False
+
+
+def is_binary_url(url: str, config: Optional[Configuration] = None) -> bool:
+    """Does this url point to a binary file? It uses HEAD and (ranged) GET
+    requests to probe the url, unless its domain is known to serve only html.
+    :any:`do_request` does not use it anymore, it checks the actual response
+    instead.
+    """
+    if binary_verdicts.is_html_only(url):
+        return False
+
+    sess = session_manager.get(config)
+    headers = config.headers if config else None
+    range_headers = {**(headers or {}), "Range": "bytes=0-1000"}
+    try:
+        resp = sess.head(url, headers=headers, timeout=3, allow_redirects=True)
+        if _is_binary_content_type(resp.headers):
             return True
 
-        if not has_get_ranges(url):
-            resp = session.get(url, timeout=3, allow_redirects=True, stream=True)
+        if not has_get_ranges(url, config=config):
+            resp = sess.get(
+                url, headers=headers, timeout=3, allow_redirects=True, stream=True
+            )
             content: Union[str, bytes, None] = next(resp.iter_content(1000), None)
         else:
-            resp = session.get(
-                url, headers={"Range": "bytes=0-1000"}, timeout=3, allow_redirects=False
+            resp = sess.get(
+                url, headers=range_headers, timeout=3, allow_redirects=False
             )
             if resp.status_code in [301, 302, 303, 307, 308]:
                 new_url = resp.headers.get("Location")
                 if new_url:
-                    resp = session.get(
+                    resp = sess.get(
                         new_url,
-                        headers={"Range": "bytes=0-1000"},
+                        headers=range_headers,
                         timeout=3,
                         allow_redirects=True,
                     )
@@ -167,54 +836,138 @@ def is_binary_url(url: str) -> bool:
         if resp.status_code > 299 or content is None:
             return False  # We cannot test if we get an error
 
-        if isinstance(content, bytes):
-            content = content.decode("utf-8", errors="replace")
-
-        content = content[:1000]
+        return _is_binary_content(content)
 
-        if len(content) == 0:
-            return False
+    except RequestException as e:
+        log.debug("is_binary_url() error. %s on URL: %s", e, url)
+    return False
 
-        if "<html" in content:
-            return False
 
-        chars = len(
-            [
-                char
-                for char in [ord(c) if isinstance(c, str) else c for c in content]
-                if 31 < char < 128 or char in [9, 10, 13]
-            ]
+def _retry_delay(config: Configuration, attempt: int, response: Optional[Response]):
+    """Backoff delay after a failed `attempt`, honouring Retry-After headers"""
+    retry_after = None
+    if response is not None:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+    return config.retry_policy.backoff(attempt, retry_after)
+
+
+def _retry_outcome(
+    config: Configuration,
+    attempt: int,
+    response: Optional[Response],
+    exception: Optional[BaseException],
+) -> Optional[float]:
+    """Decides if a request is retried after `attempt`. Returns the delay
+    before the next attempt, or None if the outcome is final (in which case
+    the number of attempts is recorded on the response or the exception)."""
+    policy = config.retry_policy
+    if attempt < policy.max_attempts and policy.should_retry(response, exception):
+        delay = _retry_delay(config, attempt, response)
+        log.info(
+            "Attempt %d failed (%s), retrying in %.2f seconds",
+            attempt,
+            exception or response.status_code,  # type: ignore[union-attr]
+            delay,
         )
-        if chars / len(content) < 0.6:  # 40% of the content is binary
-            return True
+        return delay
 
-        return False
-
-    except RequestException as e:
-        log.debug("is_binary_url() error. %s on URL: %s", e, url)
-    return False
+    if exception is not None:
+        exception.attempts = attempt  # type: ignore[attr-defined]
+    elif response is not None:
+        response.attempts = attempt  # type: ignore[attr-defined]
+    return None
 
 
-def do_request(url: str, config: Configuration) -> Response:
+def do_request(
+    url: str,
+    config: Configuration,
+    use_http_cache: bool = False,
+    retry: bool = True,
+) -> Response:
     """Perform a HTTP GET request to the specified URL using the provided configuration.
+    Failed requests are retried according to :any:`Configuration.retry_policy`,
+    sleeping in the calling thread between the attempts (the multi-threaded
+    downloads use timers instead). The number of attempts made is stored in
+    the ``attempts`` attribute of the returned response (or of the raised
+    exception).
+
     Args:
         url (str): The URL to send the request to.
         config (Configuration): The configuration object containing request parameters.
+        use_http_cache (bool, optional): If True, a conditional request is made
+            for urls already present in the :any:`HttpValidatorCache`, and the
+            stored content is returned if the server answers with 304.
+            Defaults to False.
+        retry (bool, optional): If False, only one attempt is made. Use it
+            if you schedule the retries yourself. Defaults to True.
 
     Returns:
         requests.Response: The response object containing the server's response
             to the request.
     """
-    session.headers.update(config.requests_params["headers"])
+    attempt = 1
+    while True:
+        response, exception = None, None
+        try:
+            response = _do_single_request(url, config, use_http_cache)
+        except RequestException as e:
+            exception = e
+
+        delay = _retry_outcome(config, attempt, response, exception) if retry else None
+        if delay is None:
+            if exception is not None:
+                if not retry:
+                    exception.attempts = 1  # type: ignore[attr-defined]
+                raise exception
+            if not retry:
+                response.attempts = 1  # type: ignore[union-attr]
+            return response  # type: ignore[return-value]
+
+        time.sleep(delay)
+        attempt += 1
+
+
+def _do_single_request(
+    url: str, config: Configuration, use_http_cache: bool = False
+) -> Response:
+    """One attempt of :any:`do_request`"""
+    sess = session_manager.get(config)
+    requests_params = config.requests_params
+
+    cache_entry = http_cache.get(url) if use_http_cache else None
+    if cache_entry is not None:
+        requests_params = {
+            **requests_params,
+            "headers": {
+                **(requests_params.get("headers") or {}),
+                **cache_entry.validators(),
+            },
+        }
 
-    if not config.allow_binary_content:
-        if is_binary_url(url):
-            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+    scheduler.acquire(url, config)
+    response = None
+    try:
+        # The configuration headers are passed on every request, the session
+        # headers are never modified (they could be shared between threads)
+        response = sess.get(
+            url=url,
+            stream=True,
+            **requests_params,
+        )
 
-    response = session.get(
-        url=url,
-        **config.requests_params,
-    )
+        # Binary detection is done on the actual response: we only read the
+        # headers and the first bytes before aborting. Urls in the http cache
+        # are known not to be binary.
+        if cache_entry is None and not config.allow_binary_content:
+            if _sniff_binary_response(url, response):
+                raise ArticleBinaryDataException(f"Article is binary data: {url}")
+        else:
+            _ = response.content  # read the body, releases the connection
+    finally:
+        scheduler.release(url, config, response)
+
+    if use_http_cache:
+        response = http_cache.update(url, response, cache_entry)
 
     return response
 
@@ -223,6 +976,7 @@ def get_html(
     url: str,
     config: Optional[Configuration] = None,
     response: Optional[Response] = None,
+    use_http_cache: bool = False,
 ) -> str:
     """Returns the html content from an url.
     if response is provided, no download will occur. The html will be extracted
@@ -231,11 +985,13 @@ def get_html(
     In case of http error (e.g. 404, 500), it returns an empty string.
     If `config`.`http_success_only` is True, it raises an exception in
     case of a http error.
+    If `use_http_cache` is True, the download is a conditional request
+    (see :any:`do_request`).
     """
     html = ""
     config = config or Configuration()
     try:
-        html, status_code, _ = get_html_status(url, config, response)
+        html, status_code, _ = get_html_status(url, config, response, use_http_cache)
         if status_code >= 400:
             log.warning("get_html() bad status code %s on URL: %s", status_code, url)
             if config.http_success_only:
@@ -253,6 +1009,7 @@ def get_html_status(
     url: str,
     config: Optional[Configuration] = None,
     response: Optional[Response] = None,
+    use_http_cache: bool = False,
 ) -> Tuple[str, int, List[Response]]:
     """Consolidated logic for http requests from newspaper. We handle error cases:
     - Attempt to find encoding of the html by using HTTP header. Fallback to
@@ -268,7 +1025,7 @@ def get_html_status(
             response.history,
         )
 
-    response = do_request(url, config)
+    response = do_request(url, config, use_http_cache)
 
     if response.status_code != 200:
         log.warning(
@@ -313,12 +1070,100 @@ def _get_html_from_response(response: Response, config: Configuration) -> str:
     return html or ""
 
 
+def _submit_with_retries(
+    tpe: ThreadPoolExecutor, url: str, config: Configuration, use_http_cache: bool
+) -> Future:
+    """Submits :any:`do_request` to the thread pool. Failed attempts are
+    submitted again after the backoff delay by a timer, so no worker thread
+    sleeps between attempts. Returns a future with the final outcome."""
+    result: Future = Future()
+
+    def submit(attempt: int):
+        try:
+            future = tpe.submit(do_request, url, config, use_http_cache, retry=False)
+        except RuntimeError as e:  # the pool was shut down while waiting
+            result.set_exception(e)
+            return
+        future.add_done_callback(lambda f: on_done(f, attempt))
+
+    def on_done(future: Future, attempt: int):
+        exception = future.exception()
+        if exception is not None and not isinstance(exception, RequestException):
+            result.set_exception(exception)
+            return
+        response = None if exception is not None else future.result()
+
+        delay = _retry_outcome(config, attempt, response, exception)
+        if delay is not None:
+            timer = threading.Timer(delay, submit, args=(attempt + 1,))
+            timer.daemon = True
+            timer.start()
+        elif exception is not None:
+            result.set_exception(exception)
+        else:
+            result.set_result(response)
+
+    submit(1)
+    return result
+
+
 def multithread_request(
-    urls: List[str], config: Optional[Configuration] = None
+    urls: List[str],
+    config: Optional[Configuration] = None,
+    use_http_cache: bool = False,
+    attempts: Optional[Dict[str, int]] = None,
 ) -> List[Optional[Response]]:
     """Request multiple urls via mthreading, order of urls & requests is stable
     returns same requests but with response variables filled.
+    If `use_http_cache` is True, conditional requests are made for the urls
+    present in the :any:`HttpValidatorCache` (see :any:`do_request`).
+    Failed requests are retried according to :any:`Configuration.retry_policy`,
+    without blocking a worker thread during the backoff. If `attempts` is
+    given, it is filled with the number of attempts made for each url.
+    See :any:`iter_multithread_request` to process the responses as soon
+    as they arrive.
+    """
+    return [
+        response
+        for _, response in iter_multithread_request(
+            urls, config, use_http_cache, ordered=True, attempts=attempts
+        )
+    ]
+
+
+def iter_multithread_request(
+    urls: List[str],
+    config: Optional[Configuration] = None,
+    use_http_cache: bool = False,
+    ordered: bool = False,
+    attempts: Optional[Dict[str, int]] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[str, Optional[Response]]]:
+    """Generator version of :any:`multithread_request`. Yields
+    ``(url, response)`` tuples as soon as each request completes, so that
+    a slow url does not hold back the responses already downloaded.
+    Failed requests are yielded with a None response.
+
+    Args:
+        urls (List[str]): The urls to download.
+        config (Configuration, optional): The configuration object containing
+            request parameters.
+        use_http_cache (bool, optional): see :any:`do_request`. Defaults to False.
+        ordered (bool, optional): If True, the responses are yielded in the
+            order of `urls` (still as early as possible). Defaults to False.
+        attempts (Dict[str, int], optional): If given, it is filled with the
+            number of attempts made for each url.
+        max_pending (int, optional): If given, at most `max_pending` urls are
+            being downloaded or waiting to be yielded. The next urls are
+            submitted as the responses are consumed, so the downloads pause
+            while the caller is busy. Requires ``ordered=False``.
+            Defaults to None (all the urls are submitted at once).
+
+    Yields:
+        Tuple[str, Optional[requests.Response]]: the url and its response.
     """
+    if ordered and max_pending:
+        raise ValueError("max_pending can not be used with ordered=True")
     config = config or Configuration()
 
     timeout = config.thread_timeout_seconds
@@ -332,22 +1177,339 @@ def multithread_request(
             timeout,
             requests_timeout,
         )
-    results: List[Optional[Response]] = []
+
+    def outcome(idx: int, future: Future) -> Tuple[str, Optional[Response]]:
+        url = urls[idx]
+        response = None
+        try:
+            response = future.result()
+        except TimeoutError:
+            log.error("multithread_request(): Thread timeout for URL: %s", url)
+        except RequestException as e:
+            log.warning(
+                "multithread_request(): Http download error %s on URL: %s", e, url
+            )
+        if attempts is not None:
+            result = future.exception() if response is None else response
+            attempts[url] = getattr(result, "attempts", 1)
+        return url, response
+
     with ThreadPoolExecutor(max_workers=config.number_threads) as tpe:
-        result_futures = [
-            tpe.submit(do_request, url=url, config=config) for url in urls
-        ]
-        for idx, future in enumerate(result_futures):
-            url = urls[idx]
-            try:
-                results.append(future.result())
-            except TimeoutError:
-                results.append(None)
-                log.error("multithread_request(): Thread timeout for URL: %s", url)
-            except RequestException as e:
-                results.append(None)
-                log.warning(
-                    "multithread_request(): Http download error %s on URL: %s", e, url
-                )
+        # Submit the urls spread across domains, so that the workers are not
+        # all waiting for the politeness slots of the same domain
+        to_submit = iter(scheduler.spread(urls))
+        futures: Dict[Future, int] = {}
+        done: Dict[int, Future] = {}
+
+        def submit_next():
+            while not max_pending or len(futures) + len(done) < max_pending:
+                idx = next(to_submit, None)
+                if idx is None:
+                    return
+                future = _submit_with_retries(tpe, urls[idx], config, use_http_cache)
+                futures[future] = idx
+
+        submit_next()
+        next_idx = 0
+        while futures:
+            completed, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in completed:
+                done[futures.pop(future)] = future
+            while done:
+                idx = next_idx if ordered else next(iter(done))
+                if idx not in done:
+                    break
+                future = done.pop(idx)
+                next_idx += 1
+                # the next download runs while the caller handles this one
+                submit_next()
+                yield outcome(idx, future)
+
+
+def _aiohttp_request_kwargs(url: str, config: Configuration) -> Dict[str, Any]:
+    """Translates :any:`Configuration.requests_params` (which follow the
+    ``requests`` library conventions) into keyword arguments for an
+    ``aiohttp.ClientSession.get`` call.
+    """
+    aiohttp = _require_aiohttp()
+    params = config.requests_params
+    kwargs: Dict[str, Any] = {
+        "headers": {**DEFAULT_HEADERS, **(params.get("headers") or {})},
+        "allow_redirects": params.get("allow_redirects", True),
+    }
+
+    timeout = params.get("timeout")
+    if isinstance(timeout, (tuple, list)):
+        connect_timeout, read_timeout = timeout
+    else:
+        connect_timeout = read_timeout = timeout
+    kwargs["timeout"] = aiohttp.ClientTimeout(
+        sock_connect=connect_timeout, sock_read=read_timeout
+    )
+
+    proxies = params.get("proxies") or {}
+    proxy = proxies.get(urlparse(url).scheme) or proxies.get("all")
+    if proxy:
+        kwargs["proxy"] = proxy
+
+    if params.get("cookies"):
+        kwargs["cookies"] = params["cookies"]
+
+    auth = params.get("auth")
+    if isinstance(auth, (tuple, list)):
+        kwargs["auth"] = aiohttp.BasicAuth(*auth)
+
+    verify = params.get("verify", True)
+    cert = params.get("cert")
+    if verify is False:
+        kwargs["ssl"] = False
+    elif isinstance(verify, str) or cert:
+        context = ssl.create_default_context(
+            cafile=verify if isinstance(verify, str) else None
+        )
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        kwargs["ssl"] = context
+
+    return kwargs
+
+
+def _can_use_aiohttp(config: Configuration) -> bool:
+    """Checks if the async engine can honour the requests parameters in
+    `config` natively. Custom ``requests`` authentication objects have no
+    aiohttp equivalent, in which case we fall back to the threaded engine.
+    """
+    if _import_aiohttp() is None:
+        return False
+    auth = config.requests_params.get("auth")
+    return auth is None or isinstance(auth, (tuple, list))
+
+
+def _response_from_aiohttp(resp: Any, content: bytes) -> Response:
+    """Wraps an aiohttp response into a :class:`requests.Response`, so that
+    the rest of the library (e.g. :any:`get_html`) can handle it transparently.
+    """
+    response = Response()
+    response.status_code = resp.status
+    response.reason = resp.reason
+    response.url = str(resp.url)
+    response.headers = CaseInsensitiveDict(resp.headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = content  # pylint: disable=protected-access
+    response.history = [_response_from_aiohttp(r, b"") for r in resp.history]
+    return response
+
+
+async def _aiohttp_do_request(
+    url: str, config: Configuration, client: Any  # aiohttp.ClientSession
+) -> Response:
+    """Performs the GET request with aiohttp. aiohttp errors are converted into
+    their ``requests`` counterparts, in order to keep the same error handling
+    as the synchronous :any:`do_request`.
+    """
+    aiohttp = _require_aiohttp()
+    try:
+        async with client.get(url, **_aiohttp_request_kwargs(url, config)) as resp:
+            content = b""
+            if not config.allow_binary_content:
+                is_binary = _is_binary_content_type(resp.headers)
+                if not is_binary:
+                    content = await resp.content.read(1000)
+                    if resp.status < 300 and not binary_verdicts.is_html_only(url):
+                        is_binary = _is_binary_content(content)
+                if resp.status < 300:
+                    binary_verdicts.record(url, is_binary)
+                if is_binary:
+                    raise ArticleBinaryDataException(f"Article is binary data: {url}")
+            content += await resp.content.read()
+            return _response_from_aiohttp(resp, content)
+    except asyncio.TimeoutError as e:
+        raise requests.exceptions.Timeout(f"Timeout on URL: {url}") from e
+    except aiohttp.ClientError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+async def _aretry(config: Configuration, attempt_once: Callable[[], Any]) -> Response:
+    """Awaits `attempt_once()` until it succeeds or the
+    :any:`Configuration.retry_policy` gives up, sleeping on the event loop
+    between attempts."""
+    attempt = 1
+    while True:
+        response, exception = None, None
+        try:
+            response = await attempt_once()
+        except RequestException as e:
+            exception = e
+
+        delay = _retry_outcome(config, attempt, response, exception)
+        if delay is None:
+            if exception is not None:
+                raise exception
+            return response  # type: ignore[return-value]
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _executor_request(
+    loop: asyncio.AbstractEventLoop,
+    executor: Optional[ThreadPoolExecutor],
+    url: str,
+    config: Configuration,
+) -> Callable[[], Any]:
+    """One attempt of :any:`do_request` in `executor`, retries are left
+    to the event loop"""
+    return lambda: loop.run_in_executor(
+        executor, functools.partial(do_request, url, config, retry=False)
+    )
+
+
+async def async_do_request(
+    url: str,
+    config: Optional[Configuration] = None,
+    client: Optional[Any] = None,
+) -> Response:
+    """Asynchronous version of :any:`do_request`.
+    If the ``aiohttp`` library is installed, the request is done natively
+    on the event loop. Otherwise, the blocking :any:`do_request` is run in
+    the default executor of the running loop. In both cases, the backoff
+    between retries is awaited on the event loop.
+
+    Args:
+        url (str): The URL to send the request to.
+        config (Configuration, optional): The configuration object containing
+            request parameters.
+        client (aiohttp.ClientSession, optional): An open aiohttp session to
+            reuse. If None, a new session is created for this request.
+
+    Returns:
+        requests.Response: The response object containing the server's response
+            to the request.
+    """
+    config = config or Configuration()
+
+    if not _can_use_aiohttp(config):
+        loop = asyncio.get_running_loop()
+        return await _aretry(config, _executor_request(loop, None, url, config))
+
+    if client is not None:
+        return await _aretry(config, lambda: _aiohttp_do_request(url, config, client))
+
+    async with _require_aiohttp().ClientSession() as new_client:
+        return await _aretry(
+            config, lambda: _aiohttp_do_request(url, config, new_client)
+        )
+
+
+async def async_get_html_status(
+    url: str,
+    config: Optional[Configuration] = None,
+) -> Tuple[str, int, List[Response]]:
+    """Asynchronous version of :any:`get_html_status`."""
+    config = config or Configuration()
+    response = await async_do_request(url, config)
+
+    if response.status_code != 200:
+        log.warning(
+            "async_get_html_status(): bad status code %s on URL: %s, html: %s",
+            response.status_code,
+            url,
+            response.text[:200],
+        )
+
+    html = _get_html_from_response(response, config)
+    if isinstance(html, bytes):
+        html = parsers.get_unicode_html(html)
+
+    return html, response.status_code, response.history
+
+
+async def _gather_requests(
+    urls: List[str],
+    config: Configuration,
+    request: Callable[[str], Callable[[], Any]],
+    attempts: Optional[Dict[str, int]] = None,
+) -> List[Optional[Response]]:
+    """Awaits the attempts returned by `request(url)` for all urls
+    concurrently, with retries, keeping the order of the urls. Failed
+    requests are logged and returned as None."""
+
+    async def fetch(url):
+        outcome = None
+        try:
+            outcome = await _aretry(config, request(url))
+            return outcome
+        except TimeoutError:
+            log.error("async_multi_request(): Timeout for URL: %s", url)
+        except RequestException as e:
+            outcome = e
+            log.warning(
+                "async_multi_request(): Http download error %s on URL: %s", e, url
+            )
+        finally:
+            if attempts is not None:
+                attempts[url] = getattr(outcome, "attempts", 1)
+        return None
+
+    return list(await asyncio.gather(*[fetch(url) for url in urls]))
+
+
+async def async_multi_request(
+    urls: List[str],
+    config: Optional[Configuration] = None,
+    attempts: Optional[Dict[str, int]] = None,
+) -> List[Optional[Response]]:
+    """Request multiple urls concurrently on the running event loop. Same as
+    :any:`multithread_request`, the order of urls & responses is stable and
+    failed requests are returned as None.
+
+    If the ``aiohttp`` library is installed, up to
+    :any:`Configuration.async_concurrency` requests are in flight at the same
+    time, all of them on the current thread, and at most
+    :any:`Configuration.domain_max_concurrency` connections per host.
+    Otherwise it falls back to a thread pool of
+    :any:`Configuration.number_threads` workers running :any:`do_request`,
+    which also applies the other :any:`DomainScheduler` politeness rules.
+
+    Args:
+        urls (List[str]): The urls to download.
+        config (Configuration, optional): The configuration object containing
+            request parameters.
+        attempts (Dict[str, int], optional): If given, it is filled with the
+            number of attempts made for each url.
+
+    Returns:
+        List[Optional[requests.Response]]: The responses, in the order of `urls`.
+    """
+    config = config or Configuration()
+
+    if not _can_use_aiohttp(config):
+        log.debug(
+            "async_multi_request(): aiohttp not available, using %d threads",
+            config.number_threads,
+        )
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=config.number_threads) as tpe:
+            return await _gather_requests(
+                urls,
+                config,
+                lambda url: _executor_request(loop, tpe, url, config),
+                attempts,
+            )
 
-    return results
+    aiohttp = _require_aiohttp()
+    connector = aiohttp.TCPConnector(
+        limit=config.async_concurrency,
+        limit_per_host=config.domain_max_concurrency or 0,
+    )
+    async with aiohttp.ClientSession(connector=connector) as client:
+        return await _gather_requests(
+            urls,
+            config,
+            lambda url: lambda: _aiohttp_do_request(url, config, client),
+            attempts,
+        )
@@ -101,8 +101,8 @@ def scored_sentences(sentences, title_words, keywords, stopwords):
     sentence_count = len(sentences)
     ranks = []
 
-    for i, s in enumerate(sentences):
-        sentence = list(stopwords.tokenizer(s))
+    tokenized_sentences = stopwords.tokenize_many(sentences)
+    for i, (s, sentence) in enumerate(zip(sentences, tokenized_sentences)):
         title_features = title_score(title_words, sentence, stopwords)
         sent_len = length_score(len(sentence))
         sent_pos = sentence_position_score(i + 1, sentence_count)
@@ -10,7 +10,7 @@
 import logging
 import re
 from statistics import mean, stdev
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import lxml
 from newspaper import parsers
@@ -34,9 +34,15 @@ class OutputFormatter:
 
     def __init__(self, config=None):
         self.config = config or Configuration()
+        # Tags separating the text blocks, and tags kept in the article html
+        self._text_tags = set(settings.BLOCK_LEVEL_TAGS + ["br"])
+        self._html_tags = set(settings.CLEAN_ARTICLE_TAGS)
 
     def get_formatted(
-        self, top_node: lxml.html.HtmlElement, article_title: Optional[str] = None
+        self,
+        top_node: lxml.html.HtmlElement,
+        article_title: Optional[str] = None,
+        gravity_scores: Optional[Dict[lxml.html.HtmlElement, float]] = None,
     ) -> Tuple[str, str]:
         """Returns the body text of an article, and also the cleaned html body
         article of the article.
@@ -44,6 +50,10 @@ def get_formatted(
             top_node {lxml.html.HtmlElement} -- The top node element of the article
             article_title {str} -- The title of the article, if available, to
                 be removed from the text (and max 1 paragraph before it)
+            gravity_scores {Dict[lxml.html.HtmlElement, float]} -- The gravity
+                scores of the nodes under `top_node`, see
+                :any:`ContentExtractor.complemented_scores`. The nodes without
+                a score count as 0.
         Returns:
             Tuple[str, str] -- The body text of the article, and the cleaned
             html body of the article
@@ -53,34 +63,46 @@ def get_formatted(
             return (text, html)
 
         node_cleaned = deepcopy(top_node)
+        # deepcopy keeps the order of the elements
+        scores: Dict[lxml.html.HtmlElement, float] = {}
+        if gravity_scores:
+            for node, node_copy in zip(top_node.iter(), node_cleaned.iter()):
+                score = gravity_scores.get(node)
+                if score is not None:
+                    scores[node_copy] = score
 
-        self._remove_negativescores_nodes(node_cleaned)
+        self._remove_negativescores_nodes(node_cleaned, scores)
 
         if not self.config.clean_article_html:
             # We deliver the HTML untouched (only the negative nodes are removed)
             html = parsers.node_to_string(node_cleaned)
 
-        self._remove_advertisement_nodes(node_cleaned)
+        self._remove_advertisement_nodes(node_cleaned, scores)
 
-        self._remove_unlikely_nodes(node_cleaned)
+        self._remove_unlikely_nodes(node_cleaned, scores)
 
         self._remove_empty_tags(node_cleaned)
 
         # removes some same level tags that might
         # contain non-content like menus, gallery,  etc.
         # this can misfire on some sites
-        self._remove_trailing_media_div(node_cleaned)
+        self._remove_trailing_media_div(node_cleaned, scores)
 
-        if self.config.clean_article_html:
-            html = self._create_clean_html(node_cleaned)
+        self._sanitize(node_cleaned)
+        html_tags = self._html_tags if self.config.clean_article_html else None
+        texts, html_node = self._serialize(node_cleaned, html_tags)
+        if html_node is not None:
+            html = parsers.node_to_string(html_node)
 
-        text = self._convert_to_text(node_cleaned, article_title)
+        text = self._convert_to_text(texts, article_title)
 
         return (text, html)
 
-    def _convert_to_text(
-        self, top_node: lxml.html.HtmlElement, article_title: Optional[str] = None
-    ) -> str:
+    def _sanitize(self, top_node: lxml.html.HtmlElement):
+        """Removes scripts, styles, embedded content, forms, meta tags, unsafe
+        attributes and javascript links, in place. The tags left are filtered
+        by :any:`_serialize`.
+        """
         article_cleaner = lxml.html.clean.Cleaner()
         article_cleaner.javascript = True
         article_cleaner.style = True
@@ -88,14 +110,92 @@ def _convert_to_text(
         article_cleaner.meta = True
         article_cleaner.embedded = True
         article_cleaner.frames = True
-        article_cleaner.allow_tags = settings.BLOCK_LEVEL_TAGS + ["br"]
+        article_cleaner(top_node)
+
+    def _serialize(
+        self, top_node: lxml.html.HtmlElement, html_tags: Optional[Set[str]] = None
+    ) -> Tuple[List[str], Optional[lxml.html.HtmlElement]]:
+        """Walks the tree under `top_node` once, and returns its text blocks
+        and, if `html_tags` is set, a new tree with only these tags.
+        The text blocks are the texts between the :any:`settings.BLOCK_LEVEL_TAGS`
+        and <br> tags. In both, the other tags are dropped as with the
+        `allow_tags` of the lxml Cleaner: their text is merged with the text
+        around them. A root with a dropped tag becomes a <div>.
+
+        Args:
+            top_node (lxml.html.HtmlElement): the (sanitized) article node
+            html_tags (Optional[Set[str]]): the tags kept in the new tree
 
-        cleaned_node = article_cleaner.clean_html(top_node)
-        # TODO: do not remove newlines in <pre> tags
+        Returns:
+            Tuple[List[str], Optional[lxml.html.HtmlElement]]: the text blocks,
+            and the new tree or None
+        """
+        texts: List[str] = []
+        block: List[str] = []
+        html_node = None
+        # Elements of the new tree receiving the text of the open nodes
+        containers: List[Optional[lxml.html.HtmlElement]] = []
+
+        def add_text(text: str):
+            block.append(text)
+            container = containers[-1]
+            if container is None:
+                return
+            if len(container):
+                container[-1].tail = (container[-1].tail or "") + text
+            else:
+                container.text = (container.text or "") + text
+
+        stack = [(top_node, False)]
+        while stack:
+            node, closing = stack.pop()
+            tag = node.tag
+            if closing:
+                containers.pop()
+                if node is top_node:
+                    break
+                if tag in self._text_tags:
+                    texts.append("".join(block))
+                    block = []
+                if node.tail:
+                    add_text(node.tail)
+                continue
+
+            if node is top_node or tag in self._text_tags:
+                texts.append("".join(block))
+                block = []
+            if html_tags is None:
+                containers.append(None)
+            elif node is top_node:
+                if tag in html_tags:
+                    html_node = lxml.html.Element(tag, dict(node.attrib))
+                else:
+                    html_node = lxml.html.Element("div")
+                html_node.tail = node.tail
+                containers.append(html_node)
+            elif tag in html_tags:
+                parent = containers[-1]
+                assert parent is not None, "the top node has a container"
+                element = lxml.etree.SubElement(parent, tag, dict(node.attrib))
+                containers.append(element)
+            else:
+                containers.append(containers[-1])
+            if isinstance(tag, str) and node.text:
+                add_text(node.text)
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node))
+        texts.append("".join(block))
+
+        return texts, html_node
 
+    def _convert_to_text(
+        self, texts: List[str], article_title: Optional[str] = None
+    ) -> str:
+        """Joins the text blocks of the article into paragraphs"""
+        # TODO: do not remove newlines in <pre> tags
         txts = [
             re.sub(r"[\s\t\xa0\uFEFF]+", " ", value, flags=re.UNICODE)
-            for value in cleaned_node.itertext()
+            for value in texts
         ]
         txts = [x.strip(" \t") for x in txts if x.strip(WHITESPACE_CHARS)]
         if article_title and len(txts) > 1:
@@ -117,34 +217,23 @@ def normalize_string(s: str) -> str:
 
         return "\n\n".join(txts)
 
-    def _create_clean_html(self, top_node: lxml.html.HtmlElement):
-        article_cleaner = lxml.html.clean.Cleaner()
-        article_cleaner.javascript = True
-        article_cleaner.style = True
-        article_cleaner.remove_unknown_tags = False
-        article_cleaner.meta = True
-        article_cleaner.embedded = True
-
-        article_cleaner.allow_tags = settings.CLEAN_ARTICLE_TAGS
-
-        cleaned_node = article_cleaner.clean_html(top_node)
-        return parsers.node_to_string(cleaned_node)
-
     def _add_newline_to_br(self, top_node: lxml.html.HtmlElement):
         """Replace all br tags in 'element' with a newline character"""
         br_tags = top_node.xpath(".//br")
         for br in br_tags:
             br.tail = "\n" + br.tail if br.tail else "\n"
 
-    def _remove_negativescores_nodes(self, top_node: lxml.html.HtmlElement):
+    def _remove_negativescores_nodes(
+        self,
+        top_node: lxml.html.HtmlElement,
+        scores: Dict[lxml.html.HtmlElement, float],
+    ):
         """If there are elements inside our top node that have a
         negative gravity score, let's give em the boot.
         """
-        gravity_items = top_node.xpath(".//*[@gravityScore]")
+        gravity_items = [node for node in top_node.iterdescendants() if node in scores]
         for item in gravity_items:
-            score = item.attrib.get("gravityScore", "0")
-            score = float(score)
-            if score < 1:
+            if scores[item] < 1:
                 item.getparent().remove(item)
 
     def _remove_empty_tags(self, top_node: lxml.html.HtmlElement):
@@ -153,6 +242,9 @@ def _remove_empty_tags(self, top_node: lxml.html.HtmlElement):
         """
         all_nodes = parsers.get_tags(top_node)
         all_nodes.reverse()
+        # Children come before their parents, and only nodes without text
+        # are removed: the texts in the index stay valid
+        text_index = parsers.TextIndex()
         for el in all_nodes:
             tag = el.tag
             if tag == "br":
@@ -160,7 +252,7 @@ def _remove_empty_tags(self, top_node: lxml.html.HtmlElement):
             if len(parsers.get_elements_by_tagslist(el, ["object", "embed"])) > 0:
                 continue
 
-            txt = parsers.get_text(el)
+            txt = parsers.get_text(el, text_index)
             txt = re.sub(r"[\s\t]+", "", txt)
 
             if not txt:
@@ -174,7 +266,11 @@ def _get_top_level_nodes(self, top_node: lxml.html.HtmlElement):
 
         return top_level_nodes
 
-    def _remove_trailing_media_div(self, top_node: lxml.html.HtmlElement):
+    def _remove_trailing_media_div(
+        self,
+        top_node: lxml.html.HtmlElement,
+        scores: Dict[lxml.html.HtmlElement, float],
+    ):
         """Punish the *last top level* node in the top_node if it's
         DOM depth is too deep or has a a lot of links. Many media non-content
         links are eliminated: "related", "loading gallery", etc. It skips
@@ -194,7 +290,7 @@ def _remove_trailing_media_div(self, top_node: lxml.html.HtmlElement):
         if last_node_class in NON_MEDIA_CLASSES:
             return
         if last_node.tag != "p" and len(parsers.get_tags(last_node, "p")) > 0:
-            if parsers.get_node_gravity_score(last_node) > 15:
+            if scores.get(last_node, 0.0) > 15:
                 return
 
         if parsers.get_node_depth(last_node) >= 2:
@@ -202,7 +298,11 @@ def _remove_trailing_media_div(self, top_node: lxml.html.HtmlElement):
         elif parsers.is_highlink_density(last_node, self.config.language):
             parsers.remove(last_node)
 
-    def _top_nodes_stats(self, top_node: lxml.html.HtmlElement):
+    def _top_nodes_stats(
+        self,
+        top_node: lxml.html.HtmlElement,
+        scores: Dict[lxml.html.HtmlElement, float],
+    ):
         """Returns a list of top nodes and stats about them"""
         top_nodes = self._get_top_level_nodes(top_node)
         node_stats: Dict[str, Dict[str, Any]] = {}
@@ -211,7 +311,7 @@ def _top_nodes_stats(self, top_node: lxml.html.HtmlElement):
                 el.tag, {"count": 0, "gravity": [], "depth": []}
             )
             node_stats[el.tag]["count"] += 1
-            node_stats[el.tag]["gravity"].append(parsers.get_node_gravity_score(el))
+            node_stats[el.tag]["gravity"].append(scores.get(el, 0.0))
             node_stats[el.tag]["depth"].append(parsers.get_node_depth(el))
 
         node_stats = {
@@ -227,11 +327,15 @@ def _top_nodes_stats(self, top_node: lxml.html.HtmlElement):
 
         return node_stats
 
-    def _remove_unlikely_nodes(self, top_node: lxml.html.HtmlElement):
+    def _remove_unlikely_nodes(
+        self,
+        top_node: lxml.html.HtmlElement,
+        scores: Dict[lxml.html.HtmlElement, float],
+    ):
         """Remove unlikely top level nodes from the top node
         based on statistical analysis based on depth and gravity score
         """
-        stats = self._top_nodes_stats(top_node)
+        stats = self._top_nodes_stats(top_node, scores)
         top_nodes = self._get_top_level_nodes(top_node)
 
         # has p and divs. Analyse if divs are not boilerplate or ads
@@ -239,7 +343,7 @@ def _remove_unlikely_nodes(self, top_node: lxml.html.HtmlElement):
             for node in top_nodes:
                 if node.tag != "div":
                     continue
-                gravity = parsers.get_node_gravity_score(node)
+                gravity = scores.get(node, 0.0)
                 depth = parsers.get_node_depth(node)
 
                 if (
@@ -252,17 +356,21 @@ def _remove_unlikely_nodes(self, top_node: lxml.html.HtmlElement):
                 ):
                     parsers.remove(node)
 
-    def _remove_advertisement_nodes(self, top_node: lxml.html.HtmlElement):
+    def _remove_advertisement_nodes(
+        self,
+        top_node: lxml.html.HtmlElement,
+        scores: Dict[lxml.html.HtmlElement, float],
+    ):
         """Remove nodes that may contain advertisement content."""
 
         divs = top_node.xpath(".//div")
-        stats = self._top_nodes_stats(top_node)
+        stats = self._top_nodes_stats(top_node, scores)
 
         for el in divs:
             # Does it contain p tags?
             if len(parsers.get_tags(el, "p")):
                 if parsers.is_highlink_density(el, self.config.language):
-                    gravity = parsers.get_node_gravity_score(el)
+                    gravity = scores.get(el, 0.0)
                     if len(stats):
                         limit = max(
                             [
@@ -5,6 +5,8 @@
 Helper functions for handling LXML nodes and trees.
 """
 from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 import json
 from math import exp
 import re
@@ -12,17 +14,21 @@
 import string
 from html import unescape
 from copy import deepcopy
-from typing import List, Dict, Optional, Union
+from typing import Any, Callable, Hashable, Iterator, List, Dict, Optional, Union, cast
 import lxml.etree
 import lxml.html
 import lxml.html.clean
 
-from bs4.dammit import UnicodeDammit
 
+from . import settings
 from . import text as txt
+from .utils.classes import LRUCache
 
 log = logging.getLogger(__name__)
 
+# Compiled XPath selectors of get_tags & co, shared by all the documents
+xpath_cache = LRUCache(maxsize=settings.XPATH_CACHE_SIZE)
+
 
 def drop_tags(nodes: Union[lxml.html.HtmlElement, List[lxml.html.HtmlElement]]):
     """Remove the tag(s), but not its children or text.
@@ -38,6 +44,10 @@ def get_unicode_html(html):
         return html
     if not html:
         return html
+    from bs4.dammit import (  # pylint: disable=import-outside-toplevel
+        UnicodeDammit,
+    )
+
     converted = UnicodeDammit(html, is_html=True)
     if not converted.unicode_markup:
         raise ValueError(
@@ -71,6 +81,39 @@ def node_to_string(node):
     return lxml.etree.tostring(node, method="html").decode()
 
 
+def compiled_xpath(
+    key: Hashable, build_selector: Callable[[], str], namespaces=None
+) -> lxml.etree.XPath:
+    """Returns the compiled XPath selector for `key` from :any:`xpath_cache`.
+    On a cache miss, the selector string is built with `build_selector` and
+    compiled. Use ``xpath_cache.stats()`` for the hits and misses.
+
+    Args:
+        key (Hashable): the parameters of the query that define the selector
+        build_selector (Callable[[], str]): returns the XPath selector string
+        namespaces (dict, optional): namespace prefixes used in the selector
+
+    Returns:
+        lxml.etree.XPath: the compiled selector, called with the context node
+    """
+    xpath = xpath_cache.get(key)
+    if xpath is None:
+        xpath = lxml.etree.XPath(build_selector(), namespaces=namespaces)
+        xpath_cache.set(key, xpath)
+    return xpath
+
+
+def _select(
+    node: lxml.html.Element,
+    key: Hashable,
+    build_selector: Callable[[], str],
+    namespaces=None,
+) -> List[Any]:
+    """Evaluates the :any:`compiled_xpath` selector for `key` on `node`.
+    The selectors of this module always return a node-set."""
+    return cast(list, compiled_xpath(key, build_selector, namespaces)(node))
+
+
 def get_tags_regex(
     node: lxml.html.Element,
     tag: Optional[str] = None,
@@ -93,15 +136,17 @@ def get_tags_regex(
         return get_tags(node, tag=tag)
 
     namespace = {"re": "http://exslt.org/regular-expressions"}
-    sel_list = []
 
-    for k, v in attribs.items():
-        selector = f"re:test(@{k}, '{v}', 'i')"
-        sel_list.append(selector)
+    def build_selector():
+        sel_list = []
+        for k, v in attribs.items():
+            selector = f"re:test(@{k}, '{v}', 'i')"
+            sel_list.append(selector)
+
+        return ".//%s[%s]" % (tag or "*", " and ".join(sel_list))
 
-    selector = ".//%s[%s]" % (tag or "*", " and ".join(sel_list))
-    elems = node.xpath(selector, namespaces=namespace)
-    return elems
+    regex_key = ("regex", tag, tuple(attribs.items()))
+    return _select(node, regex_key, build_selector, namespace)
 
 
 def get_tags(
@@ -135,36 +180,42 @@ def get_tags(
     """
     if attribs_match not in ["exact", "substring", "word"]:
         raise ValueError("attribs_match must be one of 'exact', 'substring' or 'word'")
+    document_index = _active_document_index(node)
+    if document_index is not None:
+        elems = document_index.get_tags(tag, attribs, attribs_match, ignore_dashes)
+        if elems is not None:
+            return elems
     if not attribs:
-        selector = f".//{(tag or '*')}"
-        elems = node.xpath(selector)
-        return elems
-
-    sel_list = []
-    for k, v in attribs.items():
-        trans = 'translate(@%s, "%s", "%s")' % (
-            k,
-            string.ascii_uppercase,
-            string.ascii_lowercase,
-        )
-
-        if ignore_dashes:
-            trans = f"translate({trans}, '-_', '  ')"
-
-        if attribs_match == "exact":
-            selector = '%s="%s"' % (trans, v.lower())
-        elif attribs_match == "substring":
-            selector = 'contains(%s, "%s")' % (trans, v.lower())
-        elif attribs_match == "word":
-            selector = 'contains(concat(" ", normalize-space(%s), " "), " %s ")' % (
-                trans,
-                v.lower(),
+        tag_key = ("tags", tag)
+        return _select(node, tag_key, lambda: f".//{(tag or '*')}")
+
+    def build_selector():
+        sel_list = []
+        for k, v in attribs.items():
+            trans = 'translate(@%s, "%s", "%s")' % (
+                k,
+                string.ascii_uppercase,
+                string.ascii_lowercase,
             )
 
-        sel_list.append(selector)
-    selector = ".//%s[%s]" % (tag or "*", " and ".join(sel_list))
-    elems = node.xpath(selector)
-    return elems
+            if ignore_dashes:
+                trans = f"translate({trans}, '-_', '  ')"
+
+            if attribs_match == "exact":
+                selector = '%s="%s"' % (trans, v.lower())
+            elif attribs_match == "substring":
+                selector = 'contains(%s, "%s")' % (trans, v.lower())
+            elif attribs_match == "word":
+                selector = 'contains(concat(" ", normalize-space(%s), " "), " %s ")' % (
+                    trans,
+                    v.lower(),
+                )
+
+            sel_list.append(selector)
+        return ".//%s[%s]" % (tag or "*", " and ".join(sel_list))
+
+    attribs_key = ("tags", tag, tuple(attribs.items()), attribs_match, ignore_dashes)
+    return _select(node, attribs_key, build_selector)
 
 
 def get_elements_by_attribs(
@@ -208,10 +259,15 @@ def get_metatags(
     if value is None:
         return get_tags(node, tag="meta")
 
-    sel_list = [f"@name='{value}'", f"@property='{value}'", f"@itemprop='{value}'"]
-    selector = "//meta[%s]" % " or ".join(sel_list)
-    elems = node.xpath(selector)
-    return elems
+    document_index = _active_document_index(node)
+    if document_index is not None and document_index.root.getparent() is None:
+        return document_index.get_metatags(value)
+
+    def build_selector():
+        sel_list = [f"@name='{value}'", f"@property='{value}'", f"@itemprop='{value}'"]
+        return "//meta[%s]" % " or ".join(sel_list)
+
+    return _select(node, ("metatags", value), build_selector)
 
 
 def get_elements_by_tagslist(node: lxml.html.Element, tag_list: List[str]):
@@ -224,9 +280,16 @@ def get_elements_by_tagslist(node: lxml.html.Element, tag_list: List[str]):
     Returns:
         List[lxml.html.Element]: Elements matching the tags
     """
-    selector = " | ".join([f".//{tag}" for tag in tag_list])
-    elems = node.xpath(selector)
-    return elems
+    document_index = _active_document_index(node)
+    if document_index is not None:
+        elems = document_index.get_elements_by_tagslist(tag_list)
+        if elems is not None:
+            return elems
+
+    tagslist_key = ("tagslist", tuple(tag_list))
+    return _select(
+        node, tagslist_key, lambda: " | ".join(f".//{tag}" for tag in tag_list)
+    )
 
 
 def create_element(tag, text=None, tail=None):
@@ -273,13 +336,264 @@ def remove(
         parent.remove(node)
 
 
-def get_text(node):
-    node_copy = deepcopy(node)
-    lxml.etree.strip_elements(
-        node_copy, lxml.etree.Comment, "script", "style", "select", "option", "textarea"
-    )
-    txts = list(node_copy.itertext())
-    return txt.inner_trim(" ".join(txts).strip())
+# Elements whose content is not displayed as text
+NON_TEXT_TAGS = {"script", "style", "select", "option", "textarea"}
+
+# Case folding done by the XPath queries of get_tags (ascii only)
+_XPATH_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_XPATH_NO_DASHES = str.maketrans("-_", "  ")
+_XPATH_SPACES_RE = re.compile(r"[ \t\r\n]+")
+_WORD_SEPARATORS_RE = re.compile(r"[ \t\r\n_-]+")
+_XPATH_NAME_RE = re.compile(r"^[A-Za-z_][\w.-]*$")
+
+
+def attribute_matches(
+    value: Optional[str],
+    query: str,
+    attribs_match: str = "exact",
+    ignore_dashes: bool = False,
+) -> bool:
+    """Same as the attribute condition of the :any:`get_tags` XPath query.
+
+    Args:
+        value (Optional[str]): the attribute value, None if missing
+        query (str): the lowercase value searched for
+        attribs_match (str): "exact", "substring" or "word"
+        ignore_dashes (bool): dashes and underscores are word separators
+
+    Returns:
+        bool: True if :any:`get_tags` would select the element
+    """
+    if value is None:
+        return False
+    value = value.translate(_XPATH_LOWER)
+    if ignore_dashes:
+        value = value.translate(_XPATH_NO_DASHES)
+    if attribs_match == "exact":
+        return value == query
+    if attribs_match == "substring":
+        return query in value
+    value = " ".join(w for w in _XPATH_SPACES_RE.split(value) if w)
+    return f" {query} " in f" {value} "
+
+
+class TextIndex:
+    """Cleaned text (see :any:`get_text`) of the nodes of one document.
+    The text of a node is computed bottom-up from the text of its children,
+    so each node is visited only once, and the tree is never copied.
+    Reuse the same index for all the `get_text` calls on a document, as long
+    as no text is removed from it (removing empty nodes is fine, the texts
+    already computed are not updated).
+    """
+
+    def __init__(self):
+        # Holding the elements as keys also keeps their lxml proxies alive
+        self._raw: Dict[lxml.etree._Element, str] = {}
+        self._text: Dict[lxml.etree._Element, str] = {}
+
+    @staticmethod
+    def _is_stripped(node) -> bool:
+        """Comments and non text elements are ignored, with their tail"""
+        return node.tag in NON_TEXT_TAGS or node.tag is lxml.etree.Comment
+
+    def _raw_text(self, node) -> str:
+        """Untrimmed text of the node, without its tail"""
+        if node in self._raw:
+            return self._raw[node]
+
+        stack = [(node, False)]
+        while stack:
+            current, children_done = stack.pop()
+            children = [child for child in current if not self._is_stripped(child)]
+            if not children_done:
+                stack.append((current, True))
+                stack.extend(
+                    (child, False)
+                    for child in children
+                    if isinstance(child.tag, str) and child not in self._raw
+                )
+                continue
+            parts = [current.text or ""]
+            for child in children:
+                # only the tail of processing instructions and entities
+                if isinstance(child.tag, str):
+                    parts.append(self._raw[child])
+                parts.append(child.tail or "")
+            self._raw[current] = " ".join(parts)
+
+        return self._raw[node]
+
+    def get_text(self, node) -> str:
+        """Returns the cleaned text of the node (see :any:`get_text`)"""
+        text = self._text.get(node)
+        if text is None:
+            text = txt.inner_trim(self._raw_text(node))
+            self._text[node] = text
+        return text
+
+
+class DocumentIndex:
+    """Elements of one document grouped by tag, by words of their class and id
+    attributes, and by attribute name, built in a single traversal.
+    While the index is active (see :any:`document_index`), :any:`get_tags`,
+    :any:`get_elements_by_attribs`, :any:`get_metatags` and
+    :any:`get_elements_by_tagslist` called on the indexed root are answered
+    from it, with the same results (and order) as the XPath queries.
+    The index is not updated when the document is modified.
+
+    Args:
+        root (lxml.html.HtmlElement): the root of the document
+    """
+
+    def __init__(self, root: lxml.html.HtmlElement):
+        self.root = root
+        # all the descendant elements (no comments), in document order
+        self.elements: List[lxml.html.HtmlElement] = []
+        self.position: Dict[lxml.html.HtmlElement, int] = {}
+        self.tags: Dict[str, List[lxml.html.HtmlElement]] = {}
+        self.attributes: Dict[str, List[lxml.html.HtmlElement]] = {}
+        # lower case words of the class / id, split on whitespaces, - and _
+        self.classes: Dict[str, List[lxml.html.HtmlElement]] = {}
+        self.ids: Dict[str, List[lxml.html.HtmlElement]] = {}
+
+        for element in root.iterdescendants():
+            if not isinstance(element.tag, str):
+                continue
+            self.position[element] = len(self.elements)
+            self.elements.append(element)
+            self.tags.setdefault(element.tag, []).append(element)
+            for name, value in element.items():
+                self.attributes.setdefault(name, []).append(element)
+                if name == "class":
+                    self._add_words(self.classes, value, element)
+                elif name == "id":
+                    self._add_words(self.ids, value, element)
+
+    @staticmethod
+    def _add_words(words_index, value: str, element):
+        words = _WORD_SEPARATORS_RE.split(value.translate(_XPATH_LOWER))
+        for word in dict.fromkeys(words):
+            if word:
+                words_index.setdefault(word, []).append(element)
+
+    def _candidates(self, name: str, value: str, attribs_match: str):
+        """Elements having the attribute `name`, narrowed down with the words
+        index for class and id, when all the matches must contain the words
+        of `value`
+        """
+        words_index = {"class": self.classes, "id": self.ids}.get(name)
+        if words_index is not None and attribs_match != "substring":
+            words = [w for w in _WORD_SEPARATORS_RE.split(value.lower()) if w]
+            if words:
+                return words_index.get(words[0], [])
+        return self.attributes.get(name, [])
+
+    def get_tags(
+        self,
+        tag: Optional[str] = None,
+        attribs: Optional[Dict[str, str]] = None,
+        attribs_match: str = "exact",
+        ignore_dashes: bool = False,
+    ) -> Optional[List[lxml.html.HtmlElement]]:
+        """Same as :any:`get_tags` on the root. Returns None for the queries
+        that can't be answered from the index.
+        """
+        if tag is not None and not _XPATH_NAME_RE.match(tag):
+            return None
+        candidates = self.elements if tag is None else self.tags.get(tag, [])
+        if not attribs:
+            return list(candidates)
+        for name, value in attribs.items():
+            # empty values also match the elements without the attribute
+            if not value or not _XPATH_NAME_RE.match(name):
+                return None
+            attribute_candidates = self._candidates(name, value, attribs_match)
+            if len(attribute_candidates) < len(candidates):
+                candidates = attribute_candidates
+
+        queries = [(name, value.lower()) for name, value in attribs.items()]
+        return [
+            element
+            for element in candidates
+            if (tag is None or element.tag == tag)
+            and all(
+                attribute_matches(
+                    element.get(name), query, attribs_match, ignore_dashes
+                )
+                for name, query in queries
+            )
+        ]
+
+    def get_metatags(self, value: str) -> List[lxml.html.HtmlElement]:
+        """Same as :any:`get_metatags` on the document"""
+        metas = self.tags.get("meta", [])
+        if self.root.tag == "meta":
+            metas = [self.root] + metas
+        return [
+            meta
+            for meta in metas
+            if value in (meta.get("name"), meta.get("property"), meta.get("itemprop"))
+        ]
+
+    def get_elements_by_tagslist(
+        self, tag_list: List[str]
+    ) -> Optional[List[lxml.html.HtmlElement]]:
+        """Same as :any:`get_elements_by_tagslist` on the root"""
+        if not all(_XPATH_NAME_RE.match(tag) for tag in tag_list):
+            return None
+        elements = {e for tag in tag_list for e in self.tags.get(tag, [])}
+        return sorted(elements, key=self.position.__getitem__)
+
+
+_document_index: ContextVar[Optional[DocumentIndex]] = ContextVar(
+    "document_index", default=None
+)
+
+
+@contextmanager
+def document_index(
+    root: lxml.html.HtmlElement, index: Optional[DocumentIndex] = None
+) -> Iterator[DocumentIndex]:
+    """Builds a :any:`DocumentIndex` of `root` and uses it, inside the
+    ``with`` block, for the element queries on `root`. The document should
+    not be modified inside the block.
+
+    Args:
+        root (lxml.html.HtmlElement): the root of the document
+        index (DocumentIndex, optional): an index of `root` built by a
+            previous call, to use instead of building a new one.
+            Defaults to None.
+    """
+    if index is None or index.root is not root:
+        index = DocumentIndex(root)
+    token = _document_index.set(index)
+    try:
+        yield index
+    finally:
+        _document_index.reset(token)
+
+
+def _active_document_index(node) -> Optional[DocumentIndex]:
+    """The active document index, if `node` is its root"""
+    index = _document_index.get()
+    if index is not None and node is index.root:
+        return index
+    return None
+
+
+def get_text(node, text_index: Optional[TextIndex] = None) -> str:
+    """Returns the text of the node and its descendants, without
+    comments, scripts, styles and form fields. Whitespaces are trimmed.
+
+    Args:
+        node (lxml.html.HtmlElement): the node
+        text_index (TextIndex, optional): an index of the document, that
+            stores the texts already computed. Defaults to None.
+
+    Returns:
+        str: the text of the node
+    """
+    return (text_index or TextIndex()).get_text(node)
 
 
 def get_attribute(
@@ -390,30 +704,30 @@ def get_nodes_at_level(root: lxml.html.Element, level: int) -> List[lxml.html.El
     return result_nodes
 
 
-def is_highlink_density(e, language=None):
+def is_highlink_density(e, language=None, text_index: Optional[TextIndex] = None):
     """Checks the density of links within a node, if there is a high
-    link to text ratio, then the text is less likely to be relevant
+    link to text ratio, then the text is less likely to be relevant.
+    Pass the `text_index` of the document to reuse the texts already computed.
     """
     links = get_elements_by_tagslist(e, ["a", "button"])
     if not links:
         return False
 
-    text = get_text(e)
+    text_index = text_index or TextIndex()
+    text = get_text(e, text_index)
 
-    def get_word_count(text):
+    def get_word_counts(texts):
         if language:
-            stopwords = txt.StopWords(language)
-            words = list(stopwords.tokenizer(text))
-        else:
-            words = [word for word in text.split() if word.isalnum()]
-
-        return len(words)
+            return txt.get_stopwords(language).count_words(texts)
+        return [
+            len([word for word in text.split() if word.isalnum()]) for text in texts
+        ]
 
-    total_words = get_word_count(text)
+    total_words = get_word_counts([text])[0]
     if total_words == 0:
         return len(links) > 0
 
-    link_words_counts = [get_word_count(get_text(link)) for link in links]
+    link_words_counts = get_word_counts([get_text(link, text_index) for link in links])
     link_words_counts = [
         w if w else 1 for w in link_words_counts
     ]  # Penalize empty links.
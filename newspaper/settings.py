@@ -15,6 +15,21 @@
 
 NUM_THREADS_PER_SOURCE_WARN_LIMIT = 5
 
+# Http connection pooling: number of hosts kept in the pool and the
+# minimum number of keep-alive connections per host
+POOL_MAX_HOSTS = 100
+DEFAULT_POOL_SIZE_PER_HOST = 10
+
+# In-memory caches for per-domain http probes (e.g. support of Range requests)
+DOMAIN_CACHE_MAX_SIZE = 5000
+DOMAIN_CACHE_TTL_SECONDS = 86400
+
+# Number of compiled XPath selectors kept by parsers.get_tags & co
+XPATH_CACHE_SIZE = 2048
+
+# Number of hosts whose domain split (subdomain, domain, suffix) is memoized
+SPLIT_DOMAIN_CACHE_SIZE = 100000
+
 # Expected value for sentence length
 MEAN_SENTENCE_LEN = 20.0
 SUMMARIZE_KEYWORD_COUNT = 10
@@ -23,6 +38,8 @@
 POPULAR_URLS = PARENT_DIRECTORY / "resources/misc/popular_sources.txt"
 USERAGENTS = PARENT_DIRECTORY / "resources/misc/useragents.txt"
 STOPWORDS_DIR = PARENT_DIRECTORY / "resources/text"
+PUNCTUATION_FILE = PARENT_DIRECTORY / "resources/misc/punctuation.txt"
+PUBLIC_SUFFIX_LIST = PARENT_DIRECTORY / "resources/misc/public_suffix_list.dat"
 
 DATA_DIRECTORY = ".newspaper_scraper"
 
@@ -53,6 +70,29 @@
     "text",
 ]
 
+# Fields that can be selected with `Configuration.parse_fields`, the other
+# article attributes are left at their default values by `Article.parse()`
+article_parse_fields = [
+    "title",
+    "authors",
+    "publish_date",
+    "text",
+    "article_html",
+    "top_image",
+    "meta_img",
+    "images",
+    "meta_favicon",
+    "movies",
+    "article_links",
+    "meta_lang",
+    "meta_site_name",
+    "meta_description",
+    "canonical_link",
+    "meta_keywords",
+    "tags",
+    "meta_data",
+]
+
 # Tags we allow to be left in the cleaned article body
 CLEAN_ARTICLE_TAGS = [
     "a",
@@ -136,6 +176,11 @@
 # category cache
 CACHE_DIRECTORY = TOP_DIRECTORY / "category_cache"
 
+# http conditional-GET cache (ETag / Last-Modified), created on first use
+HTTP_CACHE_DIRECTORY = TOP_DIRECTORY / "http_cache"
+# max number of responses kept in the http cache, the least recently used are removed
+HTTP_CACHE_MAX_ENTRIES = 1000
+
 TRENDING_URL = "http://www.google.com/trends/hottrends/atom/feed?pn=p1"
 
 for path in (TOP_DIRECTORY, MEMO_DIR, CACHE_DIRECTORY):
@@ -9,21 +9,23 @@
 Source provdides basic crawling + parsing logic for a news source homepage.
 """
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
 import logging
+import os
+import queue
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlsplit, urlunsplit
 import lxml
 
-from tldextract import tldextract
-
 import newspaper.parsers as parsers
 from . import network
 from . import urls
 from . import utils
-from .article import Article
+from .article import Article, ArticleDownloadState
 from .configuration import Configuration
 from .extractors import ContentExtractor
 from .settings import NUM_THREADS_PER_SOURCE_WARN_LIMIT
@@ -157,7 +159,7 @@ def __init__(
 
         self.logo_url = ""
         self.favicon = ""
-        self.brand = tldextract.extract(self.url).domain
+        self.brand = urls.split_domain(self.url).domain
         self.description = ""
         self.read_more_link = read_more_link
 
@@ -249,7 +251,9 @@ def set_feeds(self):
             for suffix in common_feed_sufixes:
                 common_feed_urls.append(cat.url + suffix)
 
-        responses = network.multithread_request(common_feed_urls, self.config)
+        responses = network.multithread_request(
+            common_feed_urls, self.config, use_http_cache=self.config.use_http_cache
+        )
 
         common_feed_urls_as_categories = []
         for response in responses:
@@ -285,12 +289,16 @@ def set_description(self):
 
     def download(self):
         """Downloads html of source, i.e. the news site homppage"""
-        self.html = network.get_html(self.url, self.config)
+        self.html = network.get_html(
+            self.url, self.config, use_http_cache=self.config.use_http_cache
+        )
 
     def download_categories(self):
         """Download all category html, can use mthreading"""
         category_urls = self.category_urls()
-        responses = network.multithread_request(category_urls, self.config)
+        responses = network.multithread_request(
+            category_urls, self.config, use_http_cache=self.config.use_http_cache
+        )
 
         for response, category in zip(responses, self.categories):
             if response and response.status_code < 400:
@@ -303,7 +311,9 @@ def download_categories(self):
     def download_feeds(self):
         """Download all feed html, can use mthreading"""
         feed_urls = self.feed_urls()
-        responses = network.multithread_request(feed_urls, self.config)
+        responses = network.multithread_request(
+            feed_urls, self.config, use_http_cache=self.config.use_http_cache
+        )
 
         for response, feed in zip(responses, self.feeds):
             if response and response.status_code < 400:
@@ -493,7 +503,8 @@ def get_path(url):
     def download_articles(self) -> List[Article]:
         """Starts the ``download()`` for all :any:`Article` objects
         in the :any:`Source.articles` property. It can run single threaded or
-        multi-threaded.
+        multi-threaded. Each article is processed as soon as its response
+        arrives, without waiting for the slower ones.
         Returns:
             List[:any:`Article`]: A list of downloaded articles.
         """
@@ -502,25 +513,87 @@ def download_articles(self) -> List[Article]:
 
         threads = self.config.number_threads
 
-        if threads > NUM_THREADS_PER_SOURCE_WARN_LIMIT:
+        if (
+            threads > NUM_THREADS_PER_SOURCE_WARN_LIMIT
+            and not self.config.domain_max_concurrency
+        ):
             log.warning(
-                "Using %s+ threads on a single source may result in rate limiting!",
+                "Using %s+ threads on a single source may result in rate limiting!"
+                " Consider setting `domain_max_concurrency` in the configuration.",
                 NUM_THREADS_PER_SOURCE_WARN_LIMIT,
             )
-        responses = network.multithread_request(url_list, self.config)
-        # Note that the responses are returned in original order
+        articles_by_url: Dict[str, List[Article]] = {}
+        for article in self.articles:
+            articles_by_url.setdefault(article.url, []).append(article)
+
+        attempts: Dict[str, int] = {}
+        # The articles are processed as soon as their response arrives,
+        # self.articles keeps its original order
         with ThreadPoolExecutor(max_workers=threads) as tpe:
+            futures = []
+            for url, response in network.iter_multithread_request(
+                url_list, self.config, attempts=attempts
+            ):
+                article = articles_by_url[url].pop()
+                article.download_attempts[url] = attempts.get(url, 1)
+                if response is not None and response.status_code < 400:
+                    html = network.get_html(url, response=response)
+                else:
+                    html = ""
+                    failed_articles.append(url)
+
+                futures.append(tpe.submit(article.download, input_html=html))
+
+            for future in futures:
+                future.result()
+
+        self.is_downloaded = True
+
+        if len(failed_articles) > 0:
+            log.warning(
+                "There were %d articles that failed to download: %s",
+                len(failed_articles),
+                ", ".join(failed_articles),
+            )
+        return self.articles
+
+    async def adownload_articles(self) -> List[Article]:
+        """Asynchronous version of :any:`Source.download_articles()`.
+        All the articles in the :any:`Source.articles` property are downloaded
+        concurrently on the running event loop, using
+        ``network.async_multi_request``. If the ``aiohttp`` library is
+        installed, up to :any:`Configuration.async_concurrency` requests are
+        in flight at the same time.
+
+        Returns:
+            List[:any:`Article`]: A list of downloaded articles.
+        """
+        url_list = self.article_urls()
+        failed_articles = []
+
+        attempts: Dict[str, int] = {}
+        responses = await network.async_multi_request(
+            url_list, self.config, attempts=attempts
+        )
+        # Note that the responses are returned in original order
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=self.config.number_threads) as tpe:
             futures = []
             for response, article in zip(responses, self.articles):
+                article.download_attempts[article.url] = attempts.get(article.url, 1)
                 if response and response.status_code < 400:
                     html = network.get_html(article.url, response=response)
                 else:
                     html = ""
                     failed_articles.append(article.url)
 
-                futures.append(tpe.submit(article.download, input_html=html))
+                futures.append(
+                    loop.run_in_executor(
+                        tpe, functools.partial(article.download, input_html=html)
+                    )
+                )
 
-            self.articles = [future.result() for future in futures]
+            self.articles = list(await asyncio.gather(*futures))
 
         self.is_downloaded = True
 
@@ -532,10 +605,131 @@ def download_articles(self) -> List[Article]:
             )
         return self.articles
 
-    def parse_articles(self):
-        """Parse all articles, delete if too small"""
+    def process_articles(
+        self, parse_threads: Optional[int] = None, queue_size: Optional[int] = None
+    ) -> List[Article]:
+        """Downloads and parses all articles in the :any:`Source.articles`
+        property, as a pipeline: the articles are downloaded with
+        :any:`Configuration.number_threads` threads and put in a bounded
+        queue, from which `parse_threads` workers parse them. Network waits
+        and parsing overlap, and the downloads are paused when the queue is
+        full, so that memory stays bounded on big sources. The retries wait
+        on timers, not in the download threads. Same as
+        :any:`Source.download_articles` followed by :any:`Source.parse_articles`.
+
+        Args:
+            parse_threads (int, optional): number of parsing workers.
+                Defaults to the number of cpus.
+            queue_size (int, optional): maximum number of downloaded
+                articles waiting to be parsed. Defaults to twice the number
+                of workers.
+
+        Returns:
+            List[:any:`Article`]: The downloaded and parsed articles that have
+            a valid body.
+        """
+        download_threads = self.config.number_threads
+        parse_threads = parse_threads or os.cpu_count() or 1
+        queue_size = queue_size or 2 * (download_threads + parse_threads)
+
+        articles_by_url: Dict[str, List[Article]] = {}
         for article in self.articles:
-            article.parse()
+            articles_by_url.setdefault(article.url, []).append(article)
+        downloaded: "queue.Queue[Optional[Tuple[Article, Optional[str]]]]" = (
+            queue.Queue(maxsize=queue_size)
+        )
+
+        def parse_worker():
+            # keep draining the queue on errors, the download loop would
+            # block forever otherwise
+            error = None
+            while True:
+                item = downloaded.get()
+                if item is None:
+                    break
+                if error is not None:
+                    continue
+                article, html = item
+                try:
+                    if html is not None:
+                        # follows the meta refresh and read more links
+                        article.download(input_html=html)
+                    if article.download_state != ArticleDownloadState.SUCCESS:
+                        log.debug(
+                            "Not parsing %s, download failed: %s",
+                            article.url,
+                            article.download_exception_msg,
+                        )
+                        continue
+                    article.parse()
+                except Exception as e:  # pylint: disable=broad-except
+                    error = e
+            if error is not None:
+                raise error
+
+        attempts: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=parse_threads) as tpe:
+            parsers_futures = [tpe.submit(parse_worker) for _ in range(parse_threads)]
+            try:
+                for url, response in network.iter_multithread_request(
+                    self.article_urls(),
+                    self.config,
+                    attempts=attempts,
+                    max_pending=queue_size,
+                ):
+                    article = articles_by_url[url].pop()
+                    article.download_attempts[url] = attempts.get(url, 1)
+                    html = None
+                    if response is None:
+                        article.download_state = ArticleDownloadState.FAILED_RESPONSE
+                        article.download_exception_msg = (
+                            f"Download failed for url {url}"
+                        )
+                    elif response.status_code >= 400:
+                        article.download_state = ArticleDownloadState.FAILED_RESPONSE
+                        article.download_exception_msg = (
+                            f"Status code {response.status_code} for url {url}"
+                        )
+                    else:
+                        html = network.get_html(url, self.config, response=response)
+                    # blocks, and pauses the downloads, while the parsers are behind
+                    downloaded.put((article, html))
+            finally:
+                for _ in range(parse_threads):
+                    downloaded.put(None)
+            for future in parsers_futures:
+                future.result()
+
+        self.is_downloaded = True
+        self.is_parsed = True
+        failed = [
+            a.url
+            for a in self.articles
+            if a.download_state != ArticleDownloadState.SUCCESS
+        ]
+        if failed:
+            log.warning(
+                "There were %d articles that failed to download: %s",
+                len(failed),
+                ", ".join(failed),
+            )
+        # Remove articles that are too small or do not have meaningful content
+        self.articles = [a for a in self.articles if a.is_parsed and a.is_valid_body()]
+        return self.articles
+
+    def parse_articles(self):
+        """Parse all articles, delete if too small. If
+        :any:`Configuration.parse_processes` is set, the articles are
+        parsed in a pool of processes (see :any:`mthreading.parse_many`)."""
+        if self.config.parse_processes:
+            # Imported here, mthreading depends on this module
+            # pylint: disable-next=import-outside-toplevel
+            from .mthreading import parse_many
+
+            parse_many(self.articles, self.config.parse_processes)
+        else:
+            for article in self.articles:
+                article.parse()
 
         # Remove articles that are too small or do not have meaningful content
         self.articles = [a for a in self.articles if a.is_valid_body()]
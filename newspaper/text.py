@@ -5,25 +5,69 @@
 This module contains Stopword extraction and stopword classes.
 """
 import sys
-from unicodedata import category
+import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import re
 import string
-from typing import Dict, List
-from nltk.tokenize import WhitespaceTokenizer
+from typing import Dict, Iterable, List, Set
 
 from newspaper import settings
 
-punctuation_set = {
-    c for i in range(sys.maxunicode + 1) if category(c := chr(i)).startswith("P")
-}
+
+def unicode_punctuation() -> Set[str]:
+    """Computes the set of Unicode punctuation characters (category P*) from
+    the ``unicodedata`` of the running Python. It iterates over all the code
+    points, which takes about a second, so the result is stored in
+    ``settings.PUNCTUATION_FILE`` (see :any:`write_punctuation_file`).
+    """
+    return {
+        c
+        for i in range(sys.maxunicode + 1)
+        if unicodedata.category(c := chr(i)).startswith("P")
+    }
+
+
+def write_punctuation_file(path=settings.PUNCTUATION_FILE):
+    """Regenerates the punctuation file as code point ranges, one per line.
+    Run it after a Unicode version update::
+
+        python -c "from newspaper import text; text.write_punctuation_file()"
+    """
+    code_points = sorted(ord(c) for c in unicode_punctuation())
+    ranges = []
+    for code_point in code_points:
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# Unicode {unicodedata.unidata_version} punctuation (category P*)\n")
+        for start, end in ranges:
+            f.write(f"{start:04X}-{end:04X}\n")
+
+
+def read_punctuation_file(path=settings.PUNCTUATION_FILE) -> Set[str]:
+    """Reads the punctuation characters from the file written by
+    :any:`write_punctuation_file`.
+    """
+    characters: Set[str] = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            start, end = line.split("-")
+            characters.update(chr(i) for i in range(int(start, 16), int(end, 16) + 1))
+    return characters
+
+
+punctuation_set = read_punctuation_file()
 punctuation_set.update(string.punctuation)
 # remove characters used in contractions
 contraction_separators = set("-'`ʹʻʼʽʾʿˈˊ‘’‛′‵Ꞌꞌ")
 punctuation_set -= contraction_separators
-punctuation: str = "".join(list(punctuation_set))
-whitespace_tokenizer = WhitespaceTokenizer()
+punctuation: str = "".join(sorted(punctuation_set))
 
 
 def inner_trim(value):
@@ -46,38 +90,65 @@ def inner_trim(value):
     return value.strip()
 
 
-def default_tokenizer(text):
+class Tokenizer:
     """
-    Tokenizes the given text using the default latin language tokenizer.
-    Will split tokens on words and punctuation. Use this tokenizer for
-    languages that are based on the latin alphabet or have clear word
-    delimiters such as spaces and punctuation.
-
-    Args:
-        text (str): The text to be tokenized.
+    The default latin language tokenizer. Splits the text on whitespace
+    and punctuation, keeping the contractions (e.g. "don't") together, and
+    lowers the case. Use this tokenizer for languages that are based on the
+    latin alphabet or have clear word delimiters such as spaces and punctuation.
 
-    Returns:
-        list: A list of tokens.
+    The translation table and the regular expressions are built once, when the
+    object is created, so a single instance (``default_tokenizer``) is shared.
 
+    Args:
+        punctuation (str): The characters replaced by spaces.
+        contraction_separators (Iterable[str]): The characters that are only
+            removed when they are not inside a word.
     """
-    if isinstance(text, bytes):
-        text = text.decode("utf-8", "replace")
-    # Remove punctuation
-    text = text.translate(
-        str.maketrans(
-            punctuation,
-            " " * len(punctuation),
+
+    def __init__(
+        self,
+        punctuation: str = punctuation,
+        contraction_separators: Iterable[str] = contraction_separators,
+    ):
+        self.translation_table = str.maketrans(punctuation, " " * len(punctuation))
+        regex_str = re.escape("".join(sorted(contraction_separators)))
+        self.contraction_regex = re.compile(
+            rf"(?<=\W)[{regex_str}]|[{regex_str}](?=\W)|"
+            f"^[{regex_str}]*|[{regex_str}]*$|[{regex_str}]{{2,}}"
         )
-    )
-    # remove multiple contraction separators
-    regex_str = re.escape("".join(contraction_separators))
-    text = re.sub(
-        rf"(?<=\W)[{regex_str}]|[{regex_str}](?=\W)|"
-        f"^[{regex_str}]*|[{regex_str}]*$|[{regex_str}]{{2,}}",
-        " ",
-        text,
-    )
-    return whitespace_tokenizer.tokenize(text.lower())
+
+    def __call__(self, text) -> List[str]:
+        """
+        Tokenizes the given text.
+
+        Args:
+            text (str): The text to be tokenized.
+
+        Returns:
+            list: A list of tokens.
+        """
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", "replace")
+        # Remove punctuation
+        text = text.translate(self.translation_table)
+        # remove multiple contraction separators
+        text = self.contraction_regex.sub(" ", text)
+        return text.lower().split()
+
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Tokenizes several texts in one call.
+
+        Args:
+            texts (Iterable[str]): The texts to be tokenized.
+
+        Returns:
+            List[List[str]]: The tokens of each text, in the same order.
+        """
+        return [self(text) for text in texts]
+
+
+default_tokenizer = Tokenizer()
 
 
 @dataclass
@@ -143,6 +214,31 @@ def __init__(self, language="en"):
 
         self.stop_words = self._cached_stop_words[language]
 
+    def tokenize_many(self, contents: Iterable[str]) -> List[List[str]]:
+        """Tokenizes several strings in one call, with the language tokenizer.
+
+        Args:
+            contents (Iterable[str]): The strings to tokenize.
+
+        Returns:
+            List[List[str]]: The tokens of each string, in the same order.
+        """
+        if hasattr(self.tokenizer, "tokenize_many"):
+            return self.tokenizer.tokenize_many(contents)
+        return [list(self.tokenizer(content)) for content in contents]
+
+    def count_words(self, contents: Iterable[str]) -> List[int]:
+        """Counts the words (tokens) of several strings in one call.
+
+        Args:
+            contents (Iterable[str]): The strings to analyze.
+
+        Returns:
+            List[int]: The number of tokens of each string, in the same order.
+        """
+        contents = [content or "" for content in contents]
+        return [len(tokens) for tokens in self.tokenize_many(contents)]
+
     def get_stopword_count(self, content: str) -> WordStats:
         """Calculates the word count and  stop words count in the given content.
 
@@ -172,3 +268,19 @@ def get_stopword_count(self, content: str) -> WordStats:
             word_count=len(tokens),
             stop_words=intersection,
         )
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str = "en") -> StopWords:
+    """Returns the shared :any:`StopWords` object of a language. It is created
+    the first time it is requested (loading the stopwords file and the
+    language tokenizer), then reused by all the extractors. The returned object
+    must not be modified.
+
+    Args:
+        language (str): The language code. Defaults to "en" (English).
+
+    Returns:
+        StopWords: The stopwords and tokenizer of the language.
+    """
+    return StopWords(language)
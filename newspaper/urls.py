@@ -8,17 +8,45 @@
 article in Source.build() method.
 """
 
+from functools import lru_cache
 import logging
 import re
 
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from tldextract import tldextract
+from newspaper import settings
+
+if TYPE_CHECKING:
+    import tldextract
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_tld_extractor() -> "tldextract.TLDExtract":
+    """Imports tldextract (slow to import) and creates the extractor the
+    first time a domain is split. It reads the public suffix list snapshot
+    shipped with newspaper, never downloads it and does not use the
+    tldextract disk cache."""
+    # pylint: disable-next=import-outside-toplevel
+    import tldextract
+
+    kwargs: Dict[str, Any] = {
+        "suffix_list_urls": (settings.PUBLIC_SUFFIX_LIST.as_uri(),),
+        "fallback_to_snapshot": True,
+    }
+    try:
+        return tldextract.TLDExtract(cache_dir=None, **kwargs)
+    except TypeError:
+        # tldextract < 3.0 has a cache_file instead, disabled when empty
+        return tldextract.TLDExtract(cache_file="", **kwargs)
+
+
+# Everything up to the end of the host (scheme, user info, host and port)
+_AUTHORITY_RE = re.compile(r"^[^/?#]*(?://[^/?#]*)?")
+
+
 _STRICT_DATE_REGEX_PREFIX = r"(?<=\W)"
 DATE_REGEX = (
     r"([\./\-_\s]?(19|20)\d{2})[\./\-_\s]?"
@@ -242,7 +270,7 @@ def valid_url(url: str, test: bool = False) -> bool:
         path_chunks.remove("index")
 
     # extract the tld (top level domain)
-    tld_dat = tldextract.extract(url)
+    tld_dat = split_domain(url)
     subd = tld_dat.subdomain
     tld = tld_dat.domain.lower()
 
@@ -356,6 +384,28 @@ def get_domain(abs_url: str, **kwargs) -> Optional[str]:
     return urlparse(abs_url, **kwargs).netloc
 
 
+def split_domain(url: str) -> "tldextract.tldextract.ExtractResult":
+    """Splits the host of a url into subdomain, domain and suffix, e.g.
+    ``https://edition.cnn.co.uk/news`` -> ("edition", "cnn", "co.uk").
+    Uses the public suffix list shipped with newspaper (no network access).
+    The results are memoized by host, so repeated calls for links of the
+    same site are cheap.
+
+    Arguments:
+        url(str): the url (or host name) to split
+
+    Returns:
+        tldextract.tldextract.ExtractResult: the subdomain, domain and suffix
+    """
+    match = _AUTHORITY_RE.match(url)
+    return _split_authority(match.group() if match else url)
+
+
+@lru_cache(maxsize=settings.SPLIT_DOMAIN_CACHE_SIZE)
+def _split_authority(authority: str) -> "tldextract.tldextract.ExtractResult":
+    return _get_tld_extractor()(authority)
+
+
 def get_scheme(abs_url: str, **kwargs) -> Optional[str]:
     """returns the url scheme (http, https, ftp, etc)
 
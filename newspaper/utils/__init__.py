@@ -12,14 +12,12 @@
 import sys
 import time
 
-from bs4 import BeautifulSoup
-
 from newspaper.languages import (
     valid_languages,
     get_available_languages,
 )
 from newspaper import settings
-from .classes import CacheDiskDecorator, Video
+from .classes import CacheDiskDecorator, LRUCache, Video
 
 
 log = logging.getLogger(__name__)
@@ -47,6 +45,8 @@ def extract_meta_refresh(html):
         ct=ga&cd=CAAYATIaYTc4ZTgzYjAwOTAwY2M4Yjpjb206ZW46VVM&
         usg=AFQjCNF7zAl6JPuEsV4PbEzBomJTUpX4Lg
     """
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
     soup = BeautifulSoup(html, "html.parser")
     element = soup.find("meta", attrs={"http-equiv": "refresh"})
     if element:
@@ -167,18 +167,19 @@ def show(j):
     print("\n", flush=True, file=out)
 
 
-def print_node_tree(node, header="", last=True, with_gravity=True):
+def print_node_tree(node, header="", last=True, with_gravity=True, gravity_scores=None):
     """Prints out the html node tree for nodes with gravity scores
-    debugging method
+    (e.g. ``ArticleBodyExtractor.gravity_scores``), debugging method
     """
     elbow = "└──"
     pipe = "│  "
     tee = "├──"
-    if not with_gravity or node.get("gravityScore"):
+    gravity_scores = gravity_scores or {}
+    if not with_gravity or gravity_scores.get(node):
         node_attribs = {
             k: node.attrib.get(k) for k in ["class", "id"] if node.attrib.get(k)
         }
-        score = float(node.get("gravityScore", 0))
+        score = gravity_scores.get(node, 0.0)
         print(
             header
             + (elbow if last else tee)
@@ -192,12 +193,16 @@ def print_node_tree(node, header="", last=True, with_gravity=True):
     children = list(node.iterchildren())
     for i, c in enumerate(children):
         print_node_tree(
-            c, header=header + (blank if last else pipe), last=i == len(children) - 1
+            c,
+            header=header + (blank if last else pipe),
+            last=i == len(children) - 1,
+            gravity_scores=gravity_scores,
         )
 
 
 __all__ = [
     "Video",
+    "LRUCache",
     "domain_to_filename",
     "extract_meta_refresh",
     "cache_disk",
@@ -1,14 +1,17 @@
 """
-This module contains the class for Video object and CacheDiskDecorator
+This module contains the class for Video object, CacheDiskDecorator and LRUCache
 CacheDiskDecorator provides the caching for the source categories on disk
 The object allows runtime enabling and disabling of the cache (by using
 utils.cache_disk.enabled = False) or Configuration.disable_category_cache = True
+LRUCache is a bounded, thread-safe in-memory cache with optional expiry.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 import pickle
-from typing import Callable, Optional
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
 import hashlib
 import time
 
@@ -87,3 +90,74 @@ def inner_function(*args, **kwargs):
     def __call__(self, seconds=None):
         self._seconds = seconds or self._seconds
         return self._do_cache
+
+
+class LRUCache:
+    """Thread-safe in-memory cache, with least recently used eviction and
+    an optional time to live for its entries. It keeps track of the number
+    of hits and misses.
+
+    Args:
+        maxsize (int): maximum number of entries. The least recently used
+            entries are evicted first. Defaults to 1024.
+        ttl (float, optional): number of seconds an entry is valid. None means
+            no expiry. Defaults to None.
+    """
+
+    _missing = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for key, or default if it is missing or
+        expired. Counts as a hit or a miss."""
+        with self._lock:
+            item = self._data.get(key, self._missing)
+            if item is not self._missing:
+                expires, value = item
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        """Adds or replaces the value for key, evicting old entries if needed"""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries and resets the statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of ``hits``, ``misses`` and the current ``size``"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            item = self._data.get(key, self._missing)
+            if item is self._missing:
+                return False
+            expires = item[0]
+            return expires is None or expires > time.monotonic()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
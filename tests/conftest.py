@@ -1,7 +1,12 @@
 # Some utility functions for testing
 """Helper functions for Tests"""
+from collections import Counter
+import http.server
 import json
 from pathlib import Path
+import threading
+import time
+import pytest
 from .evaluation.helper import get_html, read_or_download_json
 
 
@@ -57,3 +62,104 @@ def get_scrapinghub_data(filename: str):
         "html": html_content,
         "text": ground_truth_json[filename]["articleBody"],
     }
+
+
+class LocalHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Stand-in http server for network tests. It serves:
+    /article/<id>  - a small html article
+    /cached/<id>   - same as article, with an ETag. Honors If-None-Match
+    /headers       - the request headers, as json
+    /binary        - a png image
+    /octets        - binary content, served as text/plain
+    /slow/<id>     - same as article, answered after 0.2 seconds
+    /ratelimited   - a 429 error, with Retry-After: 1
+    /flaky/<n>/<id> - a 503 error for the first <n> requests, then an article
+    /notfound      - a 404 error
+    Every request path is counted in `server.hits`, the maximum number of
+    simultaneous requests is kept in `server.max_in_flight`.
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive connections
+
+    def log_message(self, format, *args):  # noqa
+        pass
+
+    def _send(
+        self, status, body, content_type="text/html; charset=utf-8", headers=None
+    ):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits[self.path] += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+        try:
+            self._handle()
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _handle(self):
+        if self.path.startswith("/slow/"):
+            time.sleep(0.2)
+            self.path = self.path.replace("/slow/", "/article/")
+        if self.path.startswith("/flaky/"):
+            failures = int(self.path.split("/")[2])
+            if self.server.hits[self.path] <= failures:
+                self._send(503, b"Service unavailable")
+                return
+            self.path = "/article/" + self.path.split("/")[-1]
+        if self.path.startswith("/article/"):
+            article_id = self.path.split("/")[-1]
+            body = (
+                f"<html><head><title>Article {article_id}</title></head>"
+                f"<body><p>Article body {article_id}</p></body></html>"
+            )
+            self._send(200, body.encode("utf-8"))
+        elif self.path.startswith("/cached/"):
+            etag = f'"{self.path.split("/")[-1]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, b"", headers={"ETag": etag})
+            else:
+                body = f"<html><body><p>Cached {etag}</p></body></html>"
+                self._send(200, body.encode("utf-8"), headers={"ETag": etag})
+        elif self.path == "/headers":
+            body = json.dumps(dict(self.headers)).encode("utf-8")
+            self._send(200, body, "application/json")
+        elif self.path == "/binary":
+            self._send(200, b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4, "image/png")
+        elif self.path == "/ratelimited":
+            self._send(429, b"Too many requests", headers={"Retry-After": "1"})
+        elif self.path == "/octets":
+            self._send(200, bytes(range(256)) * 40, "text/plain")
+        else:
+            self._send(404, b"<html><body>Not found</body></html>")
+
+
+@pytest.fixture
+def local_server():
+    """Runs a stand-in http server on localhost, yields its base url."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), LocalHTTPRequestHandler)
+    server.hits = Counter()
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
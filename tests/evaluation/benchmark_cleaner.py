@@ -0,0 +1,71 @@
+"""Compares the single traversal `DocumentCleaner.clean` with the pass per
+rule `DocumentCleaner.clean_sequential` on the html files of the test data,
+and prints the number of elements matched by each cleaning rule and the time
+spent on it.
+
+Usage:
+    python tests/evaluation/benchmark_cleaner.py --repeat 5
+"""
+
+import argparse
+import copy
+import time
+from pathlib import Path
+
+import newspaper
+from newspaper import parsers
+from newspaper.cleaners import DocumentCleaner
+
+HTML_DIR = Path(__file__).resolve().parent.parent / "data" / "html"
+
+
+def load_documents():
+    """The parsed documents of the test data"""
+    documents = []
+    for path in sorted(HTML_DIR.glob("*.html")):
+        doc = parsers.fromstring(path.read_text(encoding="utf-8", errors="ignore"))
+        if doc is not None:
+            documents.append(doc)
+    return documents
+
+
+def best_time(clean, documents, repeat: int) -> float:
+    """Best time out of `repeat` runs of `clean` on copies of the documents"""
+    best = float("inf")
+    for _ in range(repeat):
+        copies = [copy.deepcopy(doc) for doc in documents]
+        start = time.perf_counter()
+        for doc in copies:
+            clean(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args):
+    documents = load_documents()
+    cleaner = DocumentCleaner(newspaper.Config())
+    sequential = best_time(cleaner.clean_sequential, documents, args.repeat)
+    fused = best_time(cleaner.clean, documents, args.repeat)
+    print(f"{len(documents)} documents")
+    print(f"clean_sequential: {sequential:.4f} s")
+    print(f"clean:            {fused:.4f} s ({sequential / fused:.1f}x)")
+
+    profiler = DocumentCleaner(newspaper.Config(), profile=True)
+    for doc in documents:
+        profiler.clean(copy.deepcopy(doc))
+    print(f"\n{'rule':<40} {'matches':>8} {'time (ms)':>10}")
+    stats = sorted(
+        profiler.profile_stats.items(), key=lambda item: item[1]["time"], reverse=True
+    )
+    for rule, rule_stats in stats:
+        print(
+            f"{rule:<40} {rule_stats['matches']:>8} {rule_stats['time'] * 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Best time out of `repeat` runs"
+    )
+    main(parser.parse_args())
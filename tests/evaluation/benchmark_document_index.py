@@ -0,0 +1,70 @@
+"""Measures the parse time of the articles in the test HTML corpus with and
+without the shared document index (``parsers.DocumentIndex``), which answers
+the element queries of the extractors (tags, meta tags, attributes) from a
+single traversal of the document instead of one XPath scan per query.
+The images are not downloaded (the top image size check is skipped).
+
+Usage:
+    python tests/evaluation/benchmark_document_index.py --repeat 5
+"""
+
+import argparse
+import contextlib
+import time
+from pathlib import Path
+from unittest import mock
+
+import newspaper
+from newspaper import parsers
+from newspaper.extractors.image_extractor import ImageExtractor
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "html"
+
+
+@contextlib.contextmanager
+def no_document_index(root):  # pylint: disable=unused-argument
+    """Replaces parsers.document_index: every query is an XPath scan"""
+    yield None
+
+
+def parse_time(html: str, repeat: int) -> float:
+    """Best parse time of the article out of `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        article = newspaper.Article(
+            "https://www.example.com/2024/01/01/benchmark.html", fetch_images=False
+        )
+        article.download(input_html=html)
+        start = time.perf_counter()
+        article.parse()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@mock.patch.object(ImageExtractor, "_fetch_image", return_value=None)
+def main(args, _):
+    print(f"{'file':>40} {'without (s)':>12} {'with (s)':>12} {'speedup':>8}")
+    total_without, total_with = 0.0, 0.0
+    for path in sorted(DATA_DIR.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        with mock.patch.object(parsers, "document_index", no_document_index):
+            without_index = parse_time(html, args.repeat)
+        with_index = parse_time(html, args.repeat)
+        total_without += without_index
+        total_with += with_index
+        print(
+            f"{path.name[:40]:>40} {without_index:>12.4f} {with_index:>12.4f}"
+            f" {without_index / with_index:>8.2f}"
+        )
+    print(
+        f"{'total':>40} {total_without:>12.4f} {total_with:>12.4f}"
+        f" {total_without / total_with:>8.2f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Best time out of `repeat` runs"
+    )
+    main(parser.parse_args())
@@ -0,0 +1,56 @@
+"""Measures the time needed to import newspaper in a new interpreter, as paid
+by every CLI run and every process-pool worker. Prints the best wall time and
+the modules with the highest cumulative import time (``python -X importtime``).
+
+Usage:
+    python tests/evaluation/benchmark_import.py --repeat 5 --top 15
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+
+def import_time(module: str) -> float:
+    """Wall time of a new interpreter importing `module`"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return time.perf_counter() - start
+
+
+def slowest_imports(module: str, top: int) -> list:
+    """(cumulative microseconds, module name) of the slowest imports"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings.append((int(cumulative), name.strip()))
+    return sorted(timings, reverse=True)[:top]
+
+
+def main(args):
+    baseline = min(import_time("sys") for _ in range(args.repeat))
+    best = min(import_time(args.module) for _ in range(args.repeat))
+    print(f"interpreter startup: {baseline:.3f} s")
+    print(f"import {args.module}: {best:.3f} s ({best - baseline:.3f} s for imports)")
+    print(f"\n{'cumulative (ms)':>16}  module")
+    for cumulative, name in slowest_imports(args.module, args.top):
+        print(f"{cumulative / 1000:>16.1f}  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="newspaper", help="Module to import")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Best time out of `repeat` runs"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports shown")
+    main(parser.parse_args())
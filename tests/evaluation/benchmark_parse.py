@@ -0,0 +1,89 @@
+"""Measures the parsing time of articles against the size of their DOM.
+The pages are generated: a number of sections, each containing paragraphs,
+links, scripts and the next section, as the wrapper divs found on many
+news websites. The text of every div is needed to find the article body,
+so the time spent in text extraction (``parsers.get_text``) depends on
+the depth of the tree as well as on its size.
+
+Usage:
+    python tests/evaluation/benchmark_parse.py --sizes 50 100 200 400
+"""
+
+import argparse
+import time
+
+import newspaper
+from newspaper import parsers
+
+PARAGRAPH = (
+    "<p>The committee said on Tuesday that the new rules would be applied to "
+    "all the members of the union, and that <a href='/more'>further details</a> "
+    "will be published in the coming weeks by the ministry.</p>"
+)
+
+
+def generate_html(sections: int) -> str:
+    """A page with `sections` nested sections of divs and paragraphs"""
+    body = ""
+    for i in reversed(range(sections)):
+        body = (
+            f"<div class='story'><h2>Section {i}</h2>"
+            f"{PARAGRAPH * 4}<script>var x = {i};</script>"
+            f"<ul><li><a href='/link/{i}'>Related {i}</a></li></ul>"
+            f"{body}</div>"
+        )
+    return (
+        "<html><head><title>Benchmark article</title></head><body>"
+        f"<article>{body}</article></body></html>"
+    )
+
+
+def benchmark(sections: int, repeat: int) -> tuple:
+    """Best parse time, and best time for the text of all the nodes"""
+    html = generate_html(sections)
+    doc = parsers.fromstring(html)
+    nodes = list(doc.iter())
+    best_parse, best_text = float("inf"), float("inf")
+    for _ in range(repeat):
+        article = newspaper.Article(
+            "https://www.example.com/2024/01/01/benchmark.html", fetch_images=False
+        )
+        article.download(input_html=html)
+        start = time.perf_counter()
+        article.parse()
+        best_parse = min(best_parse, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        text_index = parsers.TextIndex()
+        for node in nodes:
+            parsers.get_text(node, text_index)
+        best_text = min(best_text, time.perf_counter() - start)
+    return len(nodes), best_parse, best_text
+
+
+def main(args):
+    print(
+        f"{'sections':>10} {'nodes':>10} {'parse (s)':>12} {'us/node':>10}"
+        f" {'all texts (s)':>14}"
+    )
+    for sections in args.sizes:
+        nodes, parse_time, text_time = benchmark(sections, args.repeat)
+        print(
+            f"{sections:>10} {nodes:>10} {parse_time:>12.4f}"
+            f" {parse_time * 1e6 / nodes:>10.1f} {text_time:>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[25, 50, 100, 200, 400],
+        help="Number of sections of the generated pages",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Best time out of `repeat` runs"
+    )
+    main(parser.parse_args())
@@ -0,0 +1,76 @@
+"""Measures the default tokenizer on texts of typical article sizes, from a
+short link text to a long article, as called for every candidate node, link
+and sentence during parsing and NLP. The texts are taken from the test data.
+
+Usage:
+    python tests/evaluation/benchmark_tokenizer.py --words 5 50 500 5000
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from newspaper import text
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "txt"
+
+
+def load_words() -> list:
+    """All the words of the test articles"""
+    words = []
+    for path in sorted(DATA_DIR.glob("*.txt")):
+        words.extend(path.read_text(encoding="utf-8").split())
+    return words
+
+
+def benchmark(texts: list, repeat: int) -> tuple:
+    """Best time of tokenizing `texts` one by one, and in one batch"""
+    best_single, best_batch = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in texts:
+            text.default_tokenizer(t)
+        best_single = min(best_single, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        text.default_tokenizer.tokenize_many(texts)
+        best_batch = min(best_batch, time.perf_counter() - start)
+    return best_single, best_batch
+
+
+def main(args):
+    words = load_words()
+    print(
+        f"{'words':>8} {'texts':>8} {'single (s)':>12} {'batch (s)':>12}"
+        f" {'us/text':>10}"
+    )
+    for size in args.words:
+        count = max(1, args.total // size)
+        starts = [(i * size) % max(1, len(words) - size) for i in range(count)]
+        texts = [" ".join(words[start : start + size]) for start in starts]
+        single, batch = benchmark(texts, args.repeat)
+        print(
+            f"{size:>8} {count:>8} {single:>12.4f} {batch:>12.4f}"
+            f" {single * 1e6 / count:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--words",
+        type=int,
+        nargs="+",
+        default=[5, 50, 500, 5000],
+        help="Number of words of the tokenized texts",
+    )
+    parser.add_argument(
+        "--total",
+        type=int,
+        default=200000,
+        help="Total number of words tokenized for each size",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Best time out of `repeat` runs"
+    )
+    main(parser.parse_args())
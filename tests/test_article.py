@@ -344,6 +344,144 @@ def test_pickle(self, cnn_article):
         article_ = pickle.load(bytes_io)
         assert article == article_
 
+    def test_parse_many(self, cnn_article):
+        config = Configuration()
+        config.fetch_images = False
+        expected = newspaper.article(
+            cnn_article["url"], input_html=cnn_article["html_content"], config=config
+        )
+        article = Article(cnn_article["url"], config=config)
+        article.download(input_html=cnn_article["html_content"])
+
+        results = newspaper.parse_many(
+            [article, (cnn_article["url"], cnn_article["html_content"])],
+            processes=2,
+            config=config,
+        )
+
+        assert results[0] is article
+        for result in results:
+            assert result.is_parsed
+            assert result.title == expected.title
+            assert result.text == expected.text
+            assert result.authors == expected.authors
+            assert result.is_valid_body() == expected.is_valid_body()
+            assert result.doc is None
+            assert result.html == cnn_article["html_content"]
+
+        with pytest.raises(ArticleException):
+            newspaper.parse_many([Article(cnn_article["url"])])
+
+    def test_parse_many_processes(self, cnn_article, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("parsed in subprocesses")
+
+        monkeypatch.setattr(newspaper.mthreading, "ProcessPoolExecutor", no_pool)
+        # the number of processes comes from the configuration of the articles
+        config = Configuration()
+        config.fetch_images = False
+        config.parse_processes = 1
+        articles = []
+        for _ in range(2):
+            article = Article(cnn_article["url"], config=config)
+            article.download(input_html=cnn_article["html_content"])
+            articles.append(article)
+
+        results = newspaper.parse_many(articles)
+        assert all(a.is_parsed for a in results)
+        assert results[0].extractor.metadata_extractor.meta_type == "article"
+
+    def test_parse_fields(self, cnn_article, monkeypatch):
+        expected = newspaper.article(
+            cnn_article["url"],
+            input_html=cnn_article["html_content"],
+            fetch_images=False,
+        )
+
+        article = Article(cnn_article["url"])
+        article.download(input_html=cnn_article["html_content"])
+        article.parse(fields={"text", "publish_date"})
+        assert article.text == expected.text
+        assert article.publish_date == expected.publish_date
+        assert article.authors == []
+        assert article.article_links == []
+        assert article.images == []
+
+        article = Article(cnn_article["url"], parse_fields=["title", "canonical_link"])
+        article.download(input_html=cnn_article["html_content"])
+        article.parse()
+        assert article.title == expected.title
+        assert article.canonical_link == expected.canonical_link
+        assert article.text == ""
+        assert article.top_node is None
+
+        # the top image is the only one that downloads images
+        def no_download(*args, **kwargs):
+            raise AssertionError("image downloaded")
+
+        monkeypatch.setattr(
+            newspaper.extractors.image_extractor.ImageExtractor,
+            "_check_image_size",
+            no_download,
+        )
+        article = Article(cnn_article["url"])
+        article.download(input_html=cnn_article["html_content"])
+        article.parse(fields=["images", "meta_img"])
+        assert article.images == expected.images
+        assert article.meta_img == expected.meta_img
+        assert article.top_image == ""
+
+        with pytest.raises(ValueError):
+            article.parse(fields={"text", "summary"})
+        with pytest.raises(ValueError):
+            Configuration().parse_fields = {"keywords"}
+
+    def test_lazy_parse(self, cnn_article, monkeypatch):
+        expected = newspaper.article(
+            cnn_article["url"],
+            input_html=cnn_article["html_content"],
+            fetch_images=False,
+        )
+
+        article = Article(cnn_article["url"], fetch_images=False, lazy_parse=True)
+        article.download(input_html=cnn_article["html_content"])
+        calls = []
+        get_authors = article.extractor.get_authors
+        monkeypatch.setattr(
+            article.extractor,
+            "get_authors",
+            lambda doc: calls.append(doc) or get_authors(doc),
+        )
+        article.parse()
+        assert article.top_node is not None
+        assert article.title == expected.title
+        assert not calls
+
+        assert article.authors == expected.authors
+        assert article.authors == expected.authors
+        assert len(calls) == 1
+        assert article.text == expected.text
+        assert article.to_json(False) == expected.to_json(False)
+        assert article.is_valid_body() == expected.is_valid_body()
+        # to_json does not extract the fields it does not output
+        assert article._unparsed_fields == {"article_links"}
+        assert article.article_links == expected.article_links
+        assert article._doc_index is None
+
+        # a field set before its first access is not extracted
+        article = Article(cnn_article["url"], fetch_images=False, lazy_parse=True)
+        article.download(input_html=cnn_article["html_content"])
+        article.parse()
+        article.publish_date = None
+        assert article.publish_date is None
+
+        article = Article(cnn_article["url"], fetch_images=False, lazy_parse=True)
+        article.download(input_html=cnn_article["html_content"])
+        article.parse()
+        article_ = pickle.loads(pickle.dumps(article))
+        assert article_ == expected
+        assert article_.meta_data == expected.meta_data
+
     def test_image_alt_extraction(self, image_alt_fixture):
         """Test that image URLs and their alt text are correctly extracted"""
         for test_case in image_alt_fixture:
@@ -1,3 +1,4 @@
+import lxml.html
 import pytest
 import newspaper
 from newspaper.cleaners import DocumentCleaner
@@ -93,6 +94,83 @@ def test_clean_para_spans(self, get_cleaner, html_fixture_para):
 
         assert result == "This is a test This is a test T his is a test"
 
+    def test_clean(self, html_fixture):
+        html = """
+            <html><body class="footer"><article id="main">
+            <p><em>Emphasis</em> and <span class="dropcap">T</span>ext
+            <span>in a span</span></p>
+            <div id="comments"><p>A comment</p><em id="article">x</em></div>
+            <figure><img src="a.jpg"><figcaption>Caption</figcaption></figure>
+            <div class="image-caption">Caption</div> tail
+            <script>var x = 1;</script><!-- comment --><nav>Menu</nav>
+            <div class="related-links"><p>Related</p></div>
+            <p class="facebook-broadcasting">Share</p>
+            </article></body></html>
+        """
+        config = newspaper.Config()
+        for source in [html, html_fixture]:
+            cleaner = DocumentCleaner(config, profile=True)
+            expected = cleaner.clean_sequential(parsers.fromstring(source))
+            result = cleaner.clean(parsers.fromstring(source))
+            assert lxml.html.tostring(result) == lxml.html.tostring(expected)
+
+        cleaner = DocumentCleaner(config, profile=True)
+        cleaner.clean(parsers.fromstring(html))
+        stats = cleaner.profile_stats
+        assert stats["clean_bad_tags:id"]["matches"] == 1
+        assert stats["clean_caption_tags:figure"]["matches"] == 1
+        assert stats["remove_scripts_styles:comment"]["matches"] == 1
+        assert stats["remove_nodes_related_re:class"]["matches"] == 1
+        assert stats["clean_para_spans"]["matches"] == 1
+        assert all(rule["time"] >= 0 for rule in stats.values())
+
+    def test_clean_subtrees(self, get_cleaner):
+        html = """
+            <html><head><script>var x = 1;</script></head><body>
+            <div id="menu"><em>Menu</em><nav>Navigation</nav></div>
+            <div id="story"><p><em>Text</em> of the <span>story</span></p>
+            <div class="related-links">Related</div></div>
+            </body></html>
+        """
+        doc = parsers.fromstring(html)
+        roots = [doc.find("head"), doc.get_element_by_id("story")]
+        doc = get_cleaner.clean_subtrees(doc, roots)
+
+        assert doc.find("head/script") is None
+        assert lxml.html.tostring(doc.get_element_by_id("story")) == (
+            b'<div id="story"><p>Text of the story</p>\n            </div>'
+            b"\n            "
+        )
+        # the rest of the document is not cleaned
+        assert len(doc.xpath("//div[@id='menu']/em | //div[@id='menu']/nav")) == 2
+
+    def test_clean_scope(self):
+        html = """
+            <html><body><div class="nav"><ul>
+            <li><a href="/a">Link a</a></li><li><a href="/b">Link b</a></li>
+            </ul></div><div id="story">
+            <p>The committee said on Tuesday that the new rules would be applied
+            to all the members of the union.</p>
+            <p>Further details will be published in the coming weeks by the
+            ministry, and the <span>members</span> will be informed.</p>
+            </div></body></html>
+        """
+        text = newspaper.fulltext(html, clean_scope="article")
+        assert text.startswith("The committee said on Tuesday")
+        assert "by the ministry, and the members will be informed." in text
+
+        article = newspaper.Article(
+            "https://example.com/story.html", clean_scope="article"
+        )
+        article.download(input_html=html)
+        article.parse()
+        assert article.clean_doc is not article.doc
+        assert not article.clean_doc.xpath("//div[@id='story']//span")
+        assert article.clean_doc.xpath("//li")
+
+        with pytest.raises(ValueError):
+            newspaper.Config().clean_scope = "page"
+
     def test_newlines(self, get_formatter):
         txt = """<div>
                     <p>line 1
@@ -127,6 +205,29 @@ def test_newlines(self, get_formatter):
 
         assert expected == result_txt
 
+    def test_formatted_html(self, get_formatter):
+        html = (
+            '<div id="body"><h2 class="x">Title</h2><p>First <b>bold</b> and '
+            '<a href="javascript:alert(1)" onclick="f()">link</a><br>after break'
+            "</p><script>var x;</script><section><div>Nested <span>text</span>"
+            "</div> tail</section><p>Café &amp; bar</p></div>"
+        )
+        top_node = parsers.fromstring(html)
+
+        text, article_html = get_formatter.get_formatted(top_node)
+
+        assert text == (
+            "Title\n\nFirst bold and link\n\nafter break\n\nNested text\n\n"
+            "tail\n\nCafé & bar"
+        )
+        assert article_html == (
+            '<div><h2 class="x">Title</h2><p>First <b>bold</b> and <a href="">link'
+            "</a><br>after break</p>Nested <span>text</span> tail"
+            "<p>Caf&#233; &amp; bar</p></div>"
+        )
+        # the top node is not modified
+        assert top_node.find(".//script") is not None
+
 
 class TestParser:
     def test_get_tag(self, html_fixture):
@@ -180,6 +281,70 @@ def test_get_tag(self, html_fixture):
             == 4
         )
 
+    def test_document_index(self, html_fixture):
+        doc = parsers.fromstring(html_fixture)
+        queries = [
+            {"tag": "span"},
+            {"tag": None},
+            {"tag": "span", "attribs": {"class": "dropcap"}},
+            {"tag": "span", "attribs": {"class": "bla"}, "attribs_match": "substring"},
+            {"tag": "span", "attribs": {"class": "blag bla"}, "attribs_match": "word"},
+            {"attribs": {"class": "class2"}, "attribs_match": "word"},
+            {
+                "tag": "span",
+                "attribs": {"class": "class2"},
+                "attribs_match": "word",
+                "ignore_dashes": True,
+            },
+        ]
+        expected = [parsers.get_tags(doc, **query) for query in queries]
+        expected_lists = parsers.get_elements_by_tagslist(doc, ["span", "p"])
+
+        with parsers.document_index(doc) as index:
+            assert index.tags["span"] == expected[0]
+            assert [parsers.get_tags(doc, **query) for query in queries] == expected
+            assert (
+                parsers.get_elements_by_tagslist(doc, ["span", "p"]) == expected_lists
+            )
+            # queries on other nodes are not answered from the index
+            div = doc.xpath("//div")[0]
+            assert parsers.get_tags(div, "span") == div.xpath(".//span")
+
+    def test_xpath_cache(self, html_fixture):
+        doc = parsers.fromstring(html_fixture)
+        query = {
+            "tag": "span",
+            "attribs": {"class": "blag bla"},
+            "attribs_match": "word",
+        }
+        parsers.xpath_cache.clear()
+        first = parsers.get_tags(doc, **query)
+        assert parsers.get_tags(doc, **query) == first
+        assert parsers.get_tags(doc, **query, ignore_dashes=True) == first
+        stats = parsers.xpath_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 2
+
+    def test_get_text(self):
+        doc = parsers.fromstring(
+            "<html><body><div id='a'>Some <b>bold</b>\n\t text<!-- comment -->"
+            "<script>var x = 1;</script><select><option>1</option></select>"
+            "<p>a <a href='#'>link</a></p>tail</div></body></html>"
+        )
+        div = doc.xpath("//div")[0]
+        expected = "Some bold text a link tail"
+        assert parsers.get_text(div) == expected
+
+        text_index = parsers.TextIndex()
+        assert parsers.get_text(div.xpath(".//p")[0], text_index) == "a link"
+        assert parsers.get_text(div, text_index) == expected
+        # the tree is not modified
+        assert len(div.xpath(".//script")) == 1
+        # removing nodes without text keeps the index valid
+        parsers.remove(div.xpath(".//select")[0])
+        assert parsers.get_text(div, text_index) == expected
+
     def test_remove_captions(self, get_cleaner):
         # ruff: noqa: E501
 
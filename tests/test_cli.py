@@ -73,6 +73,34 @@ def test_nlp(self, output_file):
         assert json_data["keywords"] == []
         assert json_data["summary"] == ""
 
+    def test_fields(self, output_file):
+        main(
+            [
+                "--url=http://www.test.com",
+                "--html-from-file=tests/data/html/cnn_001.html",
+                "--output-format=json",
+                "--output-file",
+                str(output_file["json"]),
+                "--skip-nlp",
+                "--fields",
+                "title",
+                "canonical_link",
+            ]
+        )
+
+        json_data = json.loads(output_file["json"].read_text())[0]
+        expected = json.load(
+            open("tests/data/metadata/cnn_001.json", "r", encoding="utf-8")
+        )
+
+        assert json_data["title"] == expected["title"]
+        assert json_data["canonical_link"] == expected["canonical_link"]
+        assert json_data["text"] == ""
+        assert json_data["authors"] == []
+
+        with pytest.raises(SystemExit):
+            main(["--url=http://www.test.com", "--fields", "summary"])
+
     # Skip if GITHUB_ACTIONS
     @pytest.mark.skipif("GITHUB_ACTIONS" in os.environ, reason="Skip if GITHUB_ACTIONS")
     def test_cli_output_format(self, output_file):
@@ -1,8 +1,12 @@
+import unicodedata
+
 import pytest
 
 import newspaper
 from newspaper.article import Article
-from newspaper.text import StopWords
+from newspaper import settings
+import newspaper.text as text_module
+from newspaper.text import StopWords, get_stopwords
 from tests import conftest
 
 
@@ -183,3 +187,25 @@ def test_nepali(self):
         stat = stopwords.get_stopword_count(text)
 
         assert stat.stop_word_count == 33, "Stopwords count for np is not correct"
+
+    def test_shared_stopwords(self, language_text_fixture):
+        for lang in ["en", "es", "ar"]:
+            text = language_text_fixture[lang]
+            stopwords = get_stopwords(lang)
+            assert get_stopwords(lang) is stopwords
+
+            contents = [text["text"], "", text["text"][:100]]
+            expected = [
+                StopWords(lang).get_stopword_count(content).word_count
+                for content in contents
+            ]
+            assert stopwords.count_words(contents) == expected
+
+    def test_punctuation_file(self):
+        with open(settings.PUNCTUATION_FILE, encoding="utf-8") as f:
+            header = f.readline()
+        if unicodedata.unidata_version not in header:
+            pytest.skip(f"punctuation file generated for another version: {header}")
+
+        assert text_module.read_punctuation_file() == text_module.unicode_punctuation()
+        assert "!" in text_module.punctuation and "'" not in text_module.punctuation
@@ -1,10 +1,15 @@
 import os
+import subprocess
+import sys
+import time
 import pytest
 import newspaper
+from newspaper import network
 from newspaper.article import Article
 from newspaper.configuration import Configuration
 from newspaper.mthreading import fetch_news
 from newspaper.network import multithread_request
+from newspaper.utils import LRUCache
 
 
 @pytest.fixture
@@ -114,3 +119,64 @@ def test_multithread_sources(article_urls):
     assert len(slate_paper.articles[-1].html) > 0
     assert len(espn_paper.articles[-1].html) > 0
     assert len(tc_paper.articles[-1].html) > 0
+
+
+def test_lru_cache(monkeypatch):
+    cache = LRUCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 2}
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_do_cache():
+    calls = []
+
+    @network.do_cache(maxsize=2, ttl=None)
+    def probe(url):
+        calls.append(url)
+        return len(calls)
+
+    assert probe("https://www.cnn.com/a") == 1
+    assert probe(url="https://edition.cnn.com/b") == 1
+    assert probe("https://www.bbc.co.uk/news") == 2
+    assert calls == ["https://www.cnn.com/a", "https://www.bbc.co.uk/news"]
+    assert probe.cache.stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_import_time():
+    # heavy dependencies are imported on first use, not by `import newspaper`
+    code = (
+        "import newspaper; from newspaper import network;"
+        "assert network.session_manager._default_session is None"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+    lazy_modules = {
+        "aiohttp",
+        "bs4",
+        "dateutil",
+        "feedparser",
+        "nltk",
+        "numpy",
+        "PIL",
+        "tldextract",
+    }
+    assert "newspaper" in imported
+    assert not lazy_modules & imported
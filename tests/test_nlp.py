@@ -1,7 +1,7 @@
 import pytest
 import newspaper
 from newspaper import nlp
-from newspaper.text import StopWords
+from newspaper.text import StopWords, default_tokenizer
 from tests import conftest
 
 
@@ -89,3 +89,12 @@ def test_summarize(self, cnn_article):
         summary = nlp.summarize(title, text, stopwords)
 
         assert summary == cnn_article.get("summary")
+
+    def test_tokenizer(self, cnn_article):
+        tokens = default_tokenizer("“Don't stop” -- it's 'rock-n-roll', OK?")
+        assert tokens == ["don't", "stop", "it's", "rock-n-roll", "ok"]
+
+        sentences = cnn_article.get("text_content").splitlines()
+        assert default_tokenizer.tokenize_many(sentences) == [
+            default_tokenizer(s) for s in sentences
+        ]
@@ -4,7 +4,7 @@
 from newspaper.extractors import ContentExtractor
 from newspaper import parsers
 from newspaper.configuration import Configuration
-from newspaper.urls import STRICT_DATE_REGEX, prepare_url, valid_url
+from newspaper.urls import STRICT_DATE_REGEX, prepare_url, split_domain, valid_url
 
 
 @pytest.fixture
@@ -117,6 +117,66 @@ def test_meta_image_extraction(self, meta_image_fixture):
             extractor.image_extractor.parse(doc, None, "http://www.test.com")
             assert extractor.image_extractor.meta_image == expected
 
+    def test_body_features(self):
+        sentence = "It was the best of times and it was the worst of times. "
+        html = (
+            "<html><body><div class='article'>"
+            f"<p>{sentence * 2}</p><p>{sentence}<a href='#'>and a link</a></p>"
+            f"<div class='story'><p>{sentence}</p></div>"
+            "</div></body></html>"
+        )
+        config = Configuration()
+        config.language = "en"
+        extractor = ContentExtractor(config)
+        doc = parsers.fromstring(html)
+        top_node = extractor.calculate_best_node(doc)
+        features = extractor.article_body_extractor.node_features
+
+        assert top_node.get("class") == "article"
+        paragraphs = doc.xpath("//p")
+        assert [features[p].node_level for p in paragraphs] == [4, 4, 5]
+        # the stopwords of the descendants are not counted twice
+        assert (
+            features[paragraphs[0]].stop_words == 2 * features[paragraphs[2]].stop_words
+        )
+        story = doc.xpath("//div[@class='story']")[0]
+        assert features[story].stop_words == 0
+        assert features[top_node].stop_words == 0
+        # the scores are not written in the document
+        assert extractor.article_body_extractor.gravity_scores[top_node] > 0
+        assert not doc.xpath("//*[@gravityScore or @gravityNodes]")
+        assert not doc.xpath("//*[@stop_words or @node_level]")
+
+    def test_gravity_scores_arrays(self, monkeypatch):
+        pytest.importorskip("numpy")
+        from newspaper.extractors import articlebody_extractor
+
+        config = Configuration()
+        config.language = "en"
+        html_folder = Path(__file__).resolve().parent / "data" / "html"
+        for html_file in sorted(html_folder.glob("*.html")):
+            doc = parsers.fromstring(html_file.read_text(encoding="utf-8"))
+            if doc is None:
+                continue
+            extractor = articlebody_extractor.ArticleBodyExtractor(config)
+            extractor.stopwords = articlebody_extractor.StopWords("en")
+            extractor.text_index = parsers.TextIndex()
+            extractor.boost_highly_likely_nodes(doc)
+            nodes = extractor.compute_features(doc)
+            initial_scores = dict(extractor.gravity_scores)
+
+            parents = extractor.compute_gravity_scores(nodes)
+            scores, counts = extractor.gravity_scores, extractor.gravity_nodes
+
+            extractor.gravity_scores, extractor.gravity_nodes = initial_scores, {}
+            monkeypatch.setattr(articlebody_extractor, "np", None)
+            expected_parents = extractor.compute_gravity_scores(nodes)
+            monkeypatch.undo()
+
+            assert set(parents) == set(expected_parents), html_file.name
+            assert scores == extractor.gravity_scores, html_file.name
+            assert counts == extractor.gravity_nodes, html_file.name
+
     @pytest.mark.skip(reason="Does not pass, not sure what it tests")
     def test_valid_url(self):
         for is_valid, url in get_url_filecontent("test_urls.txt"):
@@ -132,3 +192,17 @@ def test_pubdate(self):
     def test_prepare_url(self):
         for real, url, source in get_url_filecontent("test_prepare_urls.txt"):
             assert real == prepare_url(url, source)
+
+    def test_split_domain(self, monkeypatch):
+        def no_network(*args, **kwargs):
+            raise OSError("no network access allowed")
+
+        # the bundled public suffix list is used, nothing is downloaded
+        monkeypatch.setattr("socket.getaddrinfo", no_network)
+        tld = split_domain("https://user@edition.cnn.co.uk:443/news?x=//a.b.org")
+        assert tuple(tld) == ("edition", "cnn", "co.uk")
+        tld = split_domain("www.example.com/a//b.org")
+        assert tuple(tld) == ("www", "example", "com")
+        assert split_domain("http://www.bbc.co.uk/a") is split_domain(
+            "http://www.bbc.co.uk/b?c=d"
+        )
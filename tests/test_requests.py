@@ -1,7 +1,15 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import os
+import requests
+import threading
+import time
 import newspaper.network as network
-from newspaper import article, ArticleException
+from newspaper import article, Article, ArticleException, Source
+from newspaper.article import ArticleDownloadState
+from newspaper.configuration import Configuration, RetryPolicy
+from newspaper.exceptions import ArticleBinaryDataException
 
 
 @pytest.fixture
@@ -42,3 +50,387 @@ def test_detect_binary(self, binary_url):
 
         url = "https://aol.com"  # does not have Ranges
         assert not network.has_get_ranges(url), "detect range requests failed"
+
+    @pytest.mark.parametrize("use_aiohttp", [True, False])
+    def test_async_multi_request(self, local_server, monkeypatch, use_aiohttp):
+        if not use_aiohttp:
+            monkeypatch.setattr(network, "aiohttp", None)
+        elif network.aiohttp is None:
+            pytest.skip("aiohttp is not installed")
+
+        config = Configuration()
+        config.headers = {"X-Newspaper-Test": "async"}
+        urls = [f"{local_server.url}/article/{i}" for i in range(50)]
+        urls.append(f"{local_server.url}/notfound")
+
+        responses = asyncio.run(network.async_multi_request(urls, config))
+
+        assert len(responses) == len(urls)
+        for i, response in enumerate(responses[:-1]):
+            assert response.status_code == 200
+            assert f"Article {i}<" in network.get_html(urls[i], response=response)
+        assert responses[-1].status_code == 404
+
+        response = asyncio.run(
+            network.async_do_request(f"{local_server.url}/headers", config)
+        )
+        assert response.json()["X-Newspaper-Test"] == "async"
+
+        with pytest.raises(ArticleBinaryDataException):
+            asyncio.run(network.async_do_request(f"{local_server.url}/binary", config))
+
+    def test_async_download_articles(self, local_server):
+        source = Source(local_server.url, memorize_articles=False)
+        source.articles = [
+            Article(f"{local_server.url}/article/{i}", config=source.config)
+            for i in range(10)
+        ]
+        source.articles.append(
+            Article(f"{local_server.url}/notfound", config=source.config)
+        )
+
+        asyncio.run(source.adownload_articles())
+
+        assert source.is_downloaded
+        for i, source_article in enumerate(source.articles[:-1]):
+            assert source_article.download_state == ArticleDownloadState.SUCCESS
+            assert f"Article body {i}" in source_article.html
+        assert source.articles[-1].html == ""
+
+        article = Article(f"{local_server.url}/notfound")
+        asyncio.run(article.adownload())
+        assert article.download_state == ArticleDownloadState.FAILED_RESPONSE
+
+        article = Article(f"{local_server.url}/article/1")
+        asyncio.run(article.adownload())
+        article.parse()
+        assert article.title == "Article 1"
+
+    def test_session_per_configuration(self, local_server):
+        config1 = Configuration()
+        config1.headers = {"X-Newspaper-Test": "one"}
+        config2 = Configuration()
+        config2.headers = {"X-Newspaper-Test": "two"}
+
+        session1 = network.session_manager.get(config1)
+        assert session1 is network.session_manager.get(config1)
+        assert session1 is not network.session_manager.get(config2)
+        assert network.session_manager.get() is network.session
+
+        url = f"{local_server.url}/headers"
+        with ThreadPoolExecutor(max_workers=8) as tpe:
+            futures = [
+                (config, tpe.submit(network.do_request, url, config))
+                for config in [config1, config2] * 20
+            ]
+        for config, future in futures:
+            echo = future.result().json()
+            assert echo["X-Newspaper-Test"] == config.headers["X-Newspaper-Test"]
+
+        assert "X-Newspaper-Test" not in session1.headers
+
+    def test_connection_reuse(self, local_server):
+        config = Configuration()
+        config.number_threads = 4
+        config.allow_binary_content = True
+        urls = [f"{local_server.url}/article/{i}" for i in range(40)]
+
+        network.multithread_request(urls, config)
+
+        host = local_server.url.split("//")[1]
+        stats = network.session_manager.stats()["hosts"][host]
+        assert stats["requests"] >= 40
+        assert stats["reused"] > 0
+        assert stats["connections"] <= network.session_manager.pool_size_for(config)
+
+    def test_http_cache(self, local_server, tmp_path, monkeypatch):
+        cache = network.HttpValidatorCache(tmp_path)
+        monkeypatch.setattr(network, "http_cache", cache)
+        config = Configuration()
+        url = f"{local_server.url}/cached/abc"
+
+        html = network.get_html(url, config, use_http_cache=True)
+        assert "Cached" in html
+        assert cache.stats() == {"hits": 0, "misses": 1}
+        assert cache.get(url).etag == '"abc"'
+
+        response = network.do_request(url, config, use_http_cache=True)
+        assert response.status_code == 200
+        assert response.from_cache
+        assert response.text == html
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+        # without the cache, the full content is downloaded again
+        response = network.do_request(url, config)
+        assert response.status_code == 200
+        assert not getattr(response, "from_cache", False)
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+        # urls without validators are not stored
+        network.get_html(f"{local_server.url}/article/1", config, use_http_cache=True)
+        assert cache.get(f"{local_server.url}/article/1") is None
+
+        cache.clear()
+        assert cache.get(url) is None
+
+    def test_http_cache_eviction(self, local_server, tmp_path, monkeypatch):
+        cache = network.HttpValidatorCache(tmp_path / "http_cache", max_entries=2)
+        monkeypatch.setattr(network, "http_cache", cache)
+        config = Configuration()
+        assert not config.use_http_cache
+        assert not (tmp_path / "http_cache").exists()
+
+        urls = [f"{local_server.url}/cached/{i}" for i in range(3)]
+        for i, url in enumerate(urls):
+            network.get_html(url, config, use_http_cache=True)
+            # distinct modification times for the eviction order
+            os.utime(cache.get_cache_file(url), (i, i))
+
+        assert len(list((tmp_path / "http_cache").iterdir())) == 2
+        assert cache.get(urls[0]) is None
+        assert cache.get(urls[2]) is not None
+
+        # the entries read by get() are kept, the files being written are
+        # neither counted nor removed
+        cache.clear()
+        tmp_file = tmp_path / "http_cache" / "entry.123.tmp"
+        tmp_file.write_bytes(b"")
+        for i, url in enumerate(urls[:2]):
+            network.get_html(url, config, use_http_cache=True)
+            os.utime(cache.get_cache_file(url), (i, i))
+        assert cache.get(urls[0]) is not None
+        network.get_html(urls[2], config, use_http_cache=True)
+
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[0]) is not None
+        assert cache.get(urls[2]) is not None
+        assert tmp_file.exists()
+
+    def test_binary_detection_single_request(self, local_server, monkeypatch):
+        monkeypatch.setattr(network, "binary_verdicts", network.BinaryVerdictCache())
+        config = Configuration()
+
+        response = network.do_request(f"{local_server.url}/article/1", config)
+        assert response.status_code == 200
+        assert "Article body 1" in response.text
+        assert local_server.hits["/article/1"] == 1
+
+        for path in ["/binary", "/octets"]:
+            with pytest.raises(ArticleBinaryDataException):
+                network.do_request(f"{local_server.url}{path}", config)
+            assert local_server.hits[path] == 1
+
+        # A domain that served some binary content is never html only
+        urls = [f"{local_server.url}/article/{i}" for i in range(20)]
+        network.multithread_request(urls, config)
+        assert not network.binary_verdicts.is_html_only(local_server.url)
+
+        network.binary_verdicts.clear()
+        network.multithread_request(urls, config)
+        assert network.binary_verdicts.is_html_only(local_server.url)
+        assert not network.is_binary_url(f"{local_server.url}/article/100")
+        assert local_server.hits["/article/100"] == 0
+        # Content-Type is still checked for html only domains
+        with pytest.raises(ArticleBinaryDataException):
+            network.do_request(f"{local_server.url}/binary", config)
+
+    def test_scheduler_spread(self):
+        urls = [
+            "https://a.com/1",
+            "https://a.com/2",
+            "https://a.com/3",
+            "https://b.com/1",
+            "https://c.com/1",
+            "https://b.com/2",
+        ]
+        assert network.DomainScheduler.spread(urls) == [0, 3, 4, 1, 5, 2]
+
+    def test_scheduler_politeness(self, local_server, monkeypatch):
+        monkeypatch.setattr(network, "scheduler", network.DomainScheduler())
+        config = Configuration()
+        config.number_threads = 8
+        config.domain_max_concurrency = 2
+        urls = [f"{local_server.url}/slow/{i}" for i in range(8)]
+
+        responses = network.multithread_request(urls, config)
+
+        assert all(r.status_code == 200 for r in responses)
+        assert local_server.max_in_flight <= 2
+
+        config = Configuration()
+        config.domain_requests_per_second = 5
+        start = time.monotonic()
+        network.multithread_request(
+            [f"{local_server.url}/article/{i}" for i in range(10)], config
+        )
+        # a burst of 5, then 5 requests per second
+        assert time.monotonic() - start >= 0.9
+
+        # the Retry-After pause is off by default
+        config = Configuration()
+        response = network.do_request(
+            f"{local_server.url}/ratelimited", config, retry=False
+        )
+        assert response.status_code == 429
+        start = time.monotonic()
+        network.do_request(f"{local_server.url}/article/1", config)
+        assert time.monotonic() - start < 0.9
+
+        config.max_retry_after = 60
+        network.do_request(f"{local_server.url}/ratelimited", config, retry=False)
+        start = time.monotonic()
+        network.do_request(f"{local_server.url}/article/1", config)
+        assert time.monotonic() - start >= 0.9
+
+    def test_scheduler_prune(self, monkeypatch):
+        scheduler = network.DomainScheduler()
+        monkeypatch.setattr(scheduler, "MAX_IDLE_DOMAINS", 1)
+        config = Configuration()
+        config.domain_requests_per_second = 1
+        url = "http://a.example.com/1"
+        scheduler.acquire(url, config)
+        scheduler.release(url, config)
+        state = scheduler._states["a.example.com"]
+
+        # the waiter waits for a token, without any request in flight
+        waiter = threading.Thread(target=scheduler.acquire, args=(url, config))
+        waiter.start()
+        time.sleep(0.2)
+        assert state.in_flight == 0 and state.waiting == 1
+        scheduler.acquire("http://b.example.com/1", config)
+        assert scheduler._states["a.example.com"] is state
+        waiter.join()
+
+    def test_retry_policy(self):
+        policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+        assert policy.backoff(1, retry_after=3) == 3
+        assert policy.backoff(1, retry_after=600) == 5
+        policy.jitter = True
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(20))
+
+        assert policy.should_retry(exception=requests.exceptions.ConnectionError())
+        assert not policy.should_retry(exception=requests.exceptions.InvalidURL())
+
+    @pytest.mark.parametrize("use_aiohttp", [True, False])
+    def test_retry_downloads(self, local_server, monkeypatch, use_aiohttp):
+        monkeypatch.setattr(network, "scheduler", network.DomainScheduler())
+        if not use_aiohttp:
+            monkeypatch.setattr(network, "aiohttp", None)
+        config = Configuration()
+        assert config.retry_policy.max_attempts == 1
+        config.retry_policy = RetryPolicy(max_attempts=3, backoff_factor=0.01)
+
+        response = network.do_request(f"{local_server.url}/flaky/2/1", config)
+        assert response.status_code == 200
+        assert response.attempts == 3
+
+        a = Article(f"{local_server.url}/flaky/5/2", config=config)
+        a.download()
+        assert a.download_state == ArticleDownloadState.FAILED_RESPONSE
+        assert a.download_attempts == {a.url: 3}
+
+        urls = [f"{local_server.url}/flaky/{i % 3}/{i}" for i in range(6)]
+        attempts = {}
+        responses = network.multithread_request(urls, config, attempts=attempts)
+        assert all(r.status_code == 200 for r in responses)
+        assert attempts == {url: i % 3 + 1 for i, url in enumerate(urls)}
+
+        urls = [f"{local_server.url}/flaky/1/{i}" for i in range(10, 14)]
+        attempts = {}
+        responses = asyncio.run(
+            network.async_multi_request(urls, config, attempts=attempts)
+        )
+        assert all(r.status_code == 200 for r in responses)
+        assert set(attempts.values()) == {2}
+
+        # the pipeline retries on timers, no download thread sleeps
+        source = Source(local_server.url, memorize_articles=False, config=config)
+        articles = [
+            Article(f"{local_server.url}/flaky/{i % 3}/{i}", config=config)
+            for i in range(30, 36)
+        ]
+        source.articles = list(articles)
+        retry_flags = []
+        original_do_request = network.do_request
+
+        def do_request(*args, retry=True, **kwargs):
+            retry_flags.append(retry)
+            return original_do_request(*args, retry=retry, **kwargs)
+
+        monkeypatch.setattr(network, "do_request", do_request)
+        source.process_articles(parse_threads=1)
+        assert all(a.is_parsed for a in articles)
+        assert [a.download_attempts[a.url] for a in articles] == [1, 2, 3] * 2
+        assert retry_flags == [False] * 12
+        monkeypatch.setattr(network, "do_request", original_do_request)
+
+        # no retries by default
+        a = Article(f"{local_server.url}/flaky/1/20", config=Configuration())
+        asyncio.run(a.adownload())
+        assert a.download_state == ArticleDownloadState.FAILED_RESPONSE
+        assert a.download_attempts == {a.url: 1}
+
+    def test_iter_multithread_request(self, local_server):
+        config = Configuration()
+        config.number_threads = 4
+        urls = [f"{local_server.url}/slow/0"] + [
+            f"{local_server.url}/article/{i}" for i in range(1, 4)
+        ]
+
+        results = list(network.iter_multithread_request(urls, config))
+        assert sorted(url for url, _ in results) == sorted(urls)
+        assert results[-1][0] == urls[0]
+        assert all(r.status_code == 200 for _, r in results)
+
+        results = list(network.iter_multithread_request(urls, config, ordered=True))
+        assert [url for url, _ in results] == urls
+
+        # with max_pending, the next urls are submitted as the results are consumed
+        urls = [f"{local_server.url}/article/{i}" for i in range(10, 16)]
+        results = network.iter_multithread_request(urls, config, max_pending=2)
+        next(results)
+        time.sleep(0.2)
+        assert sum(local_server.hits[f"/article/{i}"] for i in range(10, 16)) == 3
+        assert len(list(results)) == 5
+        assert sum(local_server.hits[f"/article/{i}"] for i in range(10, 16)) == 6
+        with pytest.raises(ValueError):
+            next(network.iter_multithread_request(urls, ordered=True, max_pending=2))
+
+        results = list(
+            network.iter_multithread_request(
+                [f"{local_server.url}/notfound", "http://localhost:1/x"], config
+            )
+        )
+        statuses = sorted((r.status_code if r is not None else 0) for _, r in results)
+        assert statuses == [0, 404]
+
+    def test_process_articles_pipeline(self, local_server, monkeypatch):
+        source = Source(local_server.url, memorize_articles=False, number_threads=2)
+        articles = [
+            Article(f"{local_server.url}/slow/{i}", config=source.config)
+            for i in range(8)
+        ]
+        articles.append(Article(f"{local_server.url}/notfound", config=source.config))
+        source.articles = list(articles)
+
+        parse_times = []
+        original_parse = Article.parse
+
+        def parse(self):
+            parse_times.append(time.monotonic())
+            return original_parse(self)
+
+        monkeypatch.setattr(Article, "parse", parse)
+        start = time.monotonic()
+        source.process_articles(parse_threads=1, queue_size=1)
+        end = time.monotonic()
+
+        assert source.is_downloaded and source.is_parsed
+        for i, parsed_article in enumerate(articles[:-1]):
+            assert parsed_article.is_parsed
+            assert parsed_article.title == f"Article {i}"
+        assert not articles[-1].is_parsed
+        assert len(parse_times) == 8
+        # parsing started while the other articles were still downloading
+        assert parse_times[0] - start < (end - start) / 2